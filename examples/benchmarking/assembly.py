@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+##
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+"""Compare the two ways of assembling the Trilinos matrix of an equation:
+into a :term:`PySparse` matrix on each processor, which is then copied into
+an `Epetra.CrsMatrix` (the default with ``--trilinos``), or directly into the
+rows of the `Epetra.CrsMatrix` held by each processor (``--no-pysparse``).
+
+Only the assembly is timed; the linear system is not solved. Run, e.g.,
+
+    $ mpirun -np 4 python examples/benchmarking/assembly.py --numberOfElements=1000000
+
+Given ``--assembly=pysparse`` or ``--assembly=epetra``, only that path is
+run and the maximum resident memory is reported as well.
+"""
+
+import time
+import resource
+
+from fipy import *
+from fipy.tools import parallelComm
+from fipy.tools.parser import parse
+from fipy.solvers.trilinos.trilinosSolver import TrilinosSolver
+
+numberOfElements = parse('--numberOfElements', action='store',
+                         type='int', default=10000)
+N = int(numerix.sqrt(numberOfElements))
+
+sweeps = parse('--numberOfSweeps', action='store',
+               type='int', default=10)
+
+assembly = parse('--assembly', action='store',
+                 type='string', default=None)
+
+class _AssemblySolver(TrilinosSolver):
+    """Builds the distributed matrix and vectors of each solve, but does not
+    solve
+    """
+    def __init__(self, MeshMatrix):
+        TrilinosSolver.__init__(self)
+        self.MeshMatrix = MeshMatrix
+
+    @property
+    def _matrixClass(self):
+        return self.MeshMatrix
+
+    def _solve(self):
+        self._globalMatrixAndVectors
+        self._deleteGlobalMatrixAndVectors()
+        del self.var
+        del self.RHSvector
+
+def assemble(MeshMatrix):
+    mesh = Grid2D(nx=N, ny=N)
+    var = CellVariable(mesh=mesh)
+    var.constrain(1., mesh.facesLeft)
+    eq = (TransientTerm()
+          == DiffusionTerm(coeff=1. + var)
+          + ExponentialConvectionTerm(coeff=(1., 0.)))
+
+    solver = _AssemblySolver(MeshMatrix)
+
+    start = time.time()
+    for sweep in range(sweeps):
+        eq.solve(var=var, solver=solver, dt=1.)
+    elapsed = time.time() - start
+
+    return max(parallelComm.allgather(elapsed)) / sweeps
+
+paths = []
+if assembly in (None, "pysparse"):
+    from fipy.matrices.pysparseMatrix import _PysparseMeshMatrix
+    paths.append(("pysparse", _PysparseMeshMatrix))
+if assembly in (None, "epetra"):
+    from fipy.matrices.trilinosMatrix import _TrilinosMeshMatrix
+    paths.append(("epetra", _TrilinosMeshMatrix))
+
+for name, MeshMatrix in paths:
+    secs = assemble(MeshMatrix)
+    if parallelComm.procID == 0:
+        print "%8s assembly: %.9f s / sweep / cell" % (name, secs / N**2)
+
+if assembly is not None:
+    rss = max(parallelComm.allgather(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    if parallelComm.procID == 0:
+        print "max resident memory: %d kB / processor" % rss
@@ -37,11 +37,33 @@ from fipy.tools import numerix
 
 __all__ = ["OffsetSparseMatrix"]
 
-def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
+def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations, interleaved=False):
     """
     Used in binary terms. equationIndex and varIndex need to be set statically before instantiation.
+
+    By default, the unknowns are numbered variable by variable. If
+    `interleaved`, the unknowns of each cell are numbered consecutively,
+    so the matrix is made of dense `numberOfVariables` square blocks.
+
+        >>> from fipy import *
+        >>> from fipy.solvers import _MeshMatrix
+        >>> m = Grid1D(nx=2)
+        >>> for interleaved in (False, True):
+        ...     SparseMatrix = OffsetSparseMatrix(_MeshMatrix, 2, 2, interleaved=interleaved)
+        ...     SparseMatrix.equationIndex = 0
+        ...     SparseMatrix.varIndex = 1
+        ...     L = SparseMatrix(mesh=m)
+        ...     L.addAtDiagonal(numerix.array([1., 2.]))
+        ...     print L.blockSize, numerix.nonzero(L.numpyArray) # doctest: +SERIAL
+        1 (array([0, 1]), array([2, 3]))
+        2 (array([0, 2]), array([1, 3]))
     """
 
+    if interleaved:
+        blockSize = numberOfVariables
+    else:
+        blockSize = 1
+
     class OffsetSparseMatrixClass(SparseMatrix):
         equationIndex = 0
         varIndex = 0
@@ -51,11 +73,21 @@ def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
             SparseMatrix.__init__(self, mesh=mesh, bandwidth=bandwidth, sizeHint=sizeHint,
                                   numberOfVariables=numberOfVariables, numberOfEquations=numberOfEquations)
 
+        def _offset(self, id1, id2):
+            if interleaved:
+                return (numerix.asarray(id1) * numberOfEquations + self.equationIndex,
+                        numerix.asarray(id2) * numberOfVariables + self.varIndex)
+            else:
+                return (id1 + self.mesh.numberOfCells * self.equationIndex,
+                        id2 + self.mesh.numberOfCells * self.varIndex)
+
         def put(self, vector, id1, id2):
-            SparseMatrix.put(self, vector, id1 + self.mesh.numberOfCells * self.equationIndex, id2 + self.mesh.numberOfCells * self.varIndex)
+            id1, id2 = self._offset(id1, id2)
+            SparseMatrix.put(self, vector, id1, id2)
 
         def addAt(self, vector, id1, id2):
-            SparseMatrix.addAt(self, vector, id1 + self.mesh.numberOfCells * self.equationIndex, id2 + self.mesh.numberOfCells * self.varIndex)
+            id1, id2 = self._offset(id1, id2)
+            SparseMatrix.addAt(self, vector, id1, id2)
 
         def addAtDiagonal(self, vector):
             if type(vector) in [type(1), type(1.)]:
@@ -65,4 +97,13 @@ def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
             else:
                 SparseMatrix.addAtDiagonal(self, vector)
 
+    OffsetSparseMatrixClass.blockSize = blockSize
+
     return OffsetSparseMatrixClass
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -49,6 +49,45 @@ class _ScipyMatrix(_SparseMatrix):
     `_ScipyMatrix` is always NxN.
     Allows basic python operations __add__, __sub__ etc.
     Facilitate matrix populating in an easy way.
+
+    Contributions from `addAt` and `addAtDiagonal` are appended to
+    coordinate (COO) triplet buffers and only summed into the CSR
+    `matrix` when it is next accessed, so assembling a matrix from many
+    terms builds a single CSR matrix instead of one per call.
+
+        >>> L = _ScipyMatrixFromShape(size=3)
+        >>> L.addAt([1., 2.], [0, 1], [0, 1])
+        >>> L.addAt([3., 4.], [0, 2], [0, 1])
+        >>> L._pendingCount
+        4
+        >>> print L
+         4.000000      ---        ---    
+            ---     2.000000      ---    
+            ---     4.000000      ---    
+        >>> L._pendingCount
+        0
+
+    A matrix with a `sparsityPattern` reuses the CSR structure of the
+    previous assembly when the same stencil is contributed again
+
+        >>> from fipy.matrices.sparseMatrix import _SparsityPattern
+        >>> pattern = _SparsityPattern()
+        >>> for value in (1., 2.):
+        ...     L = _ScipyMatrixFromShape(size=3)
+        ...     L.sparsityPattern = pattern
+        ...     L.addAt([value, 2 * value], [0, 2], [0, 1])
+        ...     L += _ScipyIdentityMatrix(size=3)
+        ...     print L.matrix.toarray()
+        ...     if value == 1.:
+        ...         indices = pattern.indices
+        [[ 2.  0.  0.]
+         [ 0.  1.  0.]
+         [ 0.  2.  1.]]
+        [[ 3.  0.  0.]
+         [ 0.  1.  0.]
+         [ 0.  4.  1.]]
+        >>> pattern.indices is indices
+        True
     """
 
     def __init__(self, matrix):
@@ -59,6 +98,79 @@ class _ScipyMatrix(_SparseMatrix):
         """
         self.matrix = matrix
 
+    def _getMatrix(self):
+        if self._pendingCount > 0:
+            self._assemble()
+        return self._matrix
+
+    def _setMatrix(self, matrix):
+        self._matrix = matrix
+        self._clearPending()
+
+    def _delMatrix(self):
+        del self._matrix
+        self._clearPending()
+
+    matrix = property(_getMatrix, _setMatrix, _delMatrix)
+
+    def _clearPending(self):
+        self._pendingValues = []
+        self._pendingRows = []
+        self._pendingColumns = []
+        self._pendingCount = 0
+
+    def _assemble(self):
+        """Sum the buffered COO triplets into the CSR `matrix`
+
+        When a `sparsityPattern` is attached and the CSR matrix is still
+        empty, the structure of the previous assembly is reused if the
+        triplets have the same row and column IDs, and only the values are
+        scattered into it.
+        """
+        values = numerix.concatenate(self._pendingValues)
+        rows = numerix.concatenate(self._pendingRows)
+        columns = numerix.concatenate(self._pendingColumns)
+        self._clearPending()
+
+        shape = self._matrix.shape
+        pattern = self.sparsityPattern
+        if pattern is not None and self._matrix.nnz == 0:
+            if not pattern.matches(rows, columns, shape):
+                pattern.build(rows, columns, shape)
+            self._matrix = sp.csr_matrix((pattern.scatter(values),
+                                          pattern.indices.copy(),
+                                          pattern.indptr.copy()),
+                                         shape=shape)
+            return
+
+        temp = sp.coo_matrix((values, (rows, columns)), shape).tocsr()
+        if self._matrix.nnz == 0:
+            self._matrix = temp
+        else:
+            self._matrix = self._matrix + temp
+
+    def _appendTriplets(self, other, sign=1):
+        """Buffer the contents of `other` as COO triplets, without assembling
+        either matrix
+        """
+        if other is self:
+            other = _ScipyMatrix(matrix=self.matrix.copy())
+
+        if other._matrix.nnz > 0:
+            coo = other._matrix.tocoo()
+            self._pendingValues.append(sign * coo.data)
+            self._pendingRows.append(coo.row)
+            self._pendingColumns.append(coo.col)
+            self._pendingCount += coo.nnz
+
+        if sign == 1:
+            self._pendingValues.extend(other._pendingValues)
+        else:
+            self._pendingValues.extend([sign * v for v in other._pendingValues])
+        self._pendingRows.extend(other._pendingRows)
+        self._pendingColumns.extend(other._pendingColumns)
+        self._pendingCount += other._pendingCount
+
     def getCoupledClass(self):
         return _CoupledScipyMeshMatrix
 
@@ -76,7 +188,10 @@ class _ScipyMatrix(_SparseMatrix):
         return self._iadd(other)
 
     def _iadd(self, other, sign=1):
-        if hasattr(other, "matrix"):
+        if (isinstance(other, _ScipyMatrix)
+            and other._matrix.shape == self._matrix.shape):
+            self._appendTriplets(other, sign=sign)
+        elif hasattr(other, "matrix"):
             self.matrix = self.matrix + (sign * other.matrix)
         elif type(other) in [float, int]:
             fillVec = numerix.repeat(other, self.matrix.nnz)
@@ -252,9 +367,12 @@ class _ScipyMatrix(_SparseMatrix):
         """
         assert(len(id1) == len(id2) == len(vector))
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        vector = numerix.asarray(vector)
+        if len(vector) > 0:
+            self._pendingValues.append(vector.ravel())
+            self._pendingRows.append(numerix.asarray(id1).ravel())
+            self._pendingColumns.append(numerix.asarray(id2).ravel())
+            self._pendingCount += len(vector)
 
     def addAtDiagonal(self, vector):
         if type(vector) in [type(1), type(1.)]:
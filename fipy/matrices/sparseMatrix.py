@@ -50,6 +50,9 @@ class _SparseMatrix(object):
         pass
 
     matrix     = None
+    sparsityPattern = None
+    # size of the dense square blocks of coupled unknowns, if numbered by cell
+    blockSize  = 1
     numpyArray = property()
     _shape     = property()
 
@@ -158,3 +161,87 @@ class _SparseMatrix(object):
 ##      indices = numerix.indices(shape)
 ##         numMatrix = self.take(indices[0].ravel(), indices[1].ravel())
 ##      return numerix.reshape(numMatrix, shape)
+
+class _SparsityPattern(object):
+    """Compressed sparse row (CSR) structure of a sequence of coordinate
+    (COO) contributions to a matrix.
+
+    The stencil of a term's matrix is fixed by the mesh and the boundary
+    conditions, so the contributions made in one sweep have the same row
+    and column IDs, in the same order, as those made in the previous
+    sweep. The pattern sorts the IDs once and records where each
+    contribution lands in the CSR `data` array; later sweeps only need to
+    scatter their new values.
+
+        >>> pattern = _SparsityPattern()
+        >>> rows = numerix.array((2, 0, 1, 0, 2))
+        >>> columns = numerix.array((0, 1, 1, 1, 2))
+        >>> pattern.matches(rows, columns, (3, 3))
+        False
+        >>> pattern.build(rows, columns, (3, 3))
+        >>> print pattern.indptr
+        [0 1 2 4]
+        >>> print pattern.indices
+        [1 1 0 2]
+        >>> print pattern.scatter((1., 2., 3., 4., 5.))
+        [ 6.  3.  1.  5.]
+        >>> pattern.matches(rows, columns, (3, 3))
+        True
+        >>> pattern.matches(rows[::-1], columns[::-1], (3, 3))
+        False
+    """
+    def __init__(self):
+        self.rows = None
+        self.columns = None
+        self.shape = None
+
+    def matches(self, rows, columns, shape):
+        """Whether `rows` and `columns` are the IDs this pattern was built from
+        """
+        return (self.shape == tuple(shape)
+                and len(rows) == len(self.rows)
+                and numerix.array_equal(rows, self.rows)
+                and numerix.array_equal(columns, self.columns))
+
+    def build(self, rows, columns, shape):
+        """Calculate the CSR structure of the COO `rows` and `columns`
+
+        Duplicate entries are summed into a single entry of the structure.
+        """
+        self.rows = numerix.array(rows, dtype=numerix.INT_DTYPE)
+        self.columns = numerix.array(columns, dtype=numerix.INT_DTYPE)
+        self.shape = tuple(shape)
+
+        # row-major position of each entry
+        keys = self.rows * self.shape[1] + self.columns
+        order = numerix.argsort(keys)
+        keys = keys[order]
+        sortedRows = self.rows[order]
+        sortedColumns = self.columns[order]
+
+        new = numerix.ones(len(order), dtype=bool)
+        new[1:] = keys[1:] != keys[:-1]
+
+        self.permutation = numerix.empty(len(order), dtype=numerix.INT_DTYPE)
+        self.permutation[order] = numerix.cumsum(new) - 1
+
+        self.indices = sortedColumns[new]
+        rowCounts = numerix.bincount(sortedRows[new], minlength=self.shape[0])
+        self.indptr = numerix.concatenate(([0], numerix.cumsum(rowCounts))).astype(numerix.INT_DTYPE)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def scatter(self, values):
+        """Sum `values`, ordered as the contributions the pattern was built
+        from, into a CSR `data` array
+        """
+        return numerix.bincount(self.permutation, weights=values, minlength=self.nnz)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
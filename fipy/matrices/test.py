@@ -50,7 +50,7 @@ else:
     raise ImportError, 'Unknown solver package %s' % solver
 
 def _suite():
-    return _LateImportDocTestSuite(docTestModuleNames=docTestModuleNames, base=__name__)
+    return _LateImportDocTestSuite(docTestModuleNames=('sparseMatrix', 'offsetSparseMatrix') + docTestModuleNames, base=__name__)
 
 if __name__ == '__main__':
     fipy.tests.testProgram.main(defaultTest='_suite')
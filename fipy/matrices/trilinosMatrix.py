@@ -573,6 +573,28 @@ class _TrilinosMatrixFromShape(_TrilinosMatrix):
                                      domainMap=domainMap,
                                      bandwidth=bandwidth)
 
+class _MeshCommunicationPlan(object):
+    """The `Epetra.Map` objects of the rows and columns of a
+    `_TrilinosMeshMatrix`, the `Epetra.Import` from the former to the
+    latter, and the lookups from local overlapping row and column IDs to
+    global IDs
+    """
+    def __init__(self, matrix):
+        comm = matrix.mesh.communicator.epetra_comm
+
+        globalNonOverlappingRowIDs = matrix._globalNonOverlappingRowIDs
+        self.globalOverlappingRowIDs = matrix._globalOverlappingRowIDs
+        self.globalOverlappingColIDs = matrix._globalOverlappingColIDs
+        self.localNonOverlappingColIDs = matrix._localNonOverlappingColIDs
+
+        # whether each local overlapping row is held by this processor
+        self.ownedRows = numerix.in1d(self.globalOverlappingRowIDs,
+                                      globalNonOverlappingRowIDs)
+
+        self.rowMap = Epetra.Map(-1, list(globalNonOverlappingRowIDs), 0, comm)
+        self.colMap = Epetra.Map(-1, list(self.globalOverlappingColIDs), 0, comm)
+        self.importer = Epetra.Import(self.colMap, self.rowMap)
+
 class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
     def __init__(self, mesh, bandwidth=0, sizeHint=None, numberOfVariables=1, numberOfEquations=1):
         """Creates a `_TrilinosMatrixFromShape` associated with a `Mesh`
@@ -588,9 +610,10 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
         self.numberOfVariables = numberOfVariables
         self.numberOfEquations = numberOfEquations
 
-        comm = mesh.communicator.epetra_comm
-        rowMap = Epetra.Map(-1, list(self._globalNonOverlappingRowIDs), 0, comm)
-        colMap = Epetra.Map(-1, list(self._globalOverlappingColIDs), 0, comm)
+        self._plan = self._communicationPlan
+        self._importer = self._plan.importer
+        rowMap = self._plan.rowMap
+        colMap = self._plan.colMap
         domainMap = rowMap
 
         _TrilinosMatrixFromShape.__init__(self,
@@ -602,6 +625,34 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
                                  colMap=colMap,
                                  domainMap=domainMap)
 
+    @property
+    def _communicationPlan(self):
+        """The `_MeshCommunicationPlan` of the mesh for this number of
+        variables and equations
+
+        Building it requires communication between all the processors,
+        so it is built once and shared by all the matrices.
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=5)
+            >>> L1 = _TrilinosMeshMatrix(mesh=m)
+            >>> L2 = _TrilinosMeshMatrix(mesh=m)
+            >>> print L1.colMap is L2.colMap and L1._importer is L2._importer
+            True
+            >>> L3 = _TrilinosMeshMatrix(mesh=m, numberOfVariables=2, numberOfEquations=2)
+            >>> print L1.colMap is L3.colMap
+            False
+        """
+        if not hasattr(self.mesh, "_trilinosCommunicationPlans"):
+            self.mesh._trilinosCommunicationPlans = {}
+        plans = self.mesh._trilinosCommunicationPlans
+
+        key = (self.numberOfVariables, self.numberOfEquations)
+        if key not in plans:
+            plans[key] = _MeshCommunicationPlan(self)
+
+        return plans[key]
+
     def _cellIDsToGlobalRowIDs(self, IDs):
          N = len(IDs)
          M = self.numberOfEquations
@@ -652,7 +703,9 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
 
     def copy(self):
         tmp = _TrilinosMatrixFromShape.copy(self)
-        copy = self.__class__(mesh=self.mesh, bandwidth=self.bandwidth)
+        copy = self.__class__(mesh=self.mesh, bandwidth=self.bandwidth,
+                              numberOfVariables=self.numberOfVariables,
+                              numberOfEquations=self.numberOfEquations)
         copy.matrix = tmp._matrix
         return copy
 
@@ -661,12 +714,14 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
         return self
 
     def _getStencil(self, id1, id2):
-        id1 = self._globalOverlappingRowIDs[id1]
-        id2 = self._globalOverlappingColIDs[id2]
+        id1 = numerix.asarray(id1)
+        id2 = numerix.asarray(id2)
 
-        mask = numerix.in1d(id1, self._globalNonOverlappingRowIDs)
-        id1 = id1[mask]
-        id2 = id2[mask]
+        # only the rows of this processor are assembled, directly by
+        # their global IDs
+        mask = self._plan.ownedRows[id1]
+        id1 = self._plan.globalOverlappingRowIDs[id1[mask]]
+        id2 = self._plan.globalOverlappingColIDs[id2[mask]]
 
         return id1, id2, mask
 
@@ -713,8 +768,7 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
 
         overlapping_result = Epetra.Vector(self.colMap)
         overlapping_result.Import(nonoverlapping_result,
-                                  Epetra.Import(self.colMap,
-                                                self.domainMap),
+                                  self._importer,
                                   Epetra.Insert)
 
         return overlapping_result
@@ -783,7 +837,7 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
                     other_map = self.colMap
 
                 if other_map.SameAs(self.colMap):
-                    localNonOverlappingColIDs = self._localNonOverlappingColIDs
+                    localNonOverlappingColIDs = self._plan.localNonOverlappingColIDs
 
                     other = Epetra.Vector(self.domainMap,
                                           other[localNonOverlappingColIDs])
@@ -795,8 +849,7 @@ class _TrilinosMeshMatrix(_TrilinosMatrixFromShape):
                     if other_map.SameAs(self.colMap):
                         overlapping_result = Epetra.Vector(self.colMap)
                         overlapping_result.Import(nonoverlapping_result,
-                                                  Epetra.Import(self.colMap,
-                                                                self.domainMap),
+                                                  self._importer,
                                                   Epetra.Insert)
 
                         return overlapping_result
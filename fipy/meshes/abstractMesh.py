@@ -115,6 +115,56 @@ class AbstractMesh(object):
     def _isOrthogonal(self):
         return self.topology._isOrthogonal
 
+    @property
+    def _leastSquaresGradMatrices(self):
+        """
+        The `(D, M, N)` distance-weighted normals to the neighbors of each
+        cell and the `(D, D, N)` inverse of the least-squares matrix they
+        form. They depend only on the geometry, so they are calculated
+        once and shared by every `leastSquaresGrad` on the mesh.
+
+        >>> from fipy import *
+        >>> m = Grid3D(dx=(1.,) * 2, dy=(2.,) * 3, dz=(3.,) * 4)
+        >>> cellDistanceNormals, inverse = m._leastSquaresGradMatrices
+        >>> print inverse.shape
+        (3, 3, 24)
+        >>> print numerix.allclose(inverse[..., 0], [[1. / 1.25, 0., 0.],
+        ...                                          [0., 1. / 5., 0.],
+        ...                                          [0., 0., 1. / 11.25]])
+        True
+        >>> m._leastSquaresGradMatrices[1] is inverse
+        True
+        """
+        cellToCellDistances = self._cellToCellDistances
+        if (not hasattr(self, "_leastSquaresGradData")
+            or self._leastSquaresGradData[0] is not cellToCellDistances):
+            cellDistanceNormals = numerix.array(cellToCellDistances * self._cellNormals)
+
+            mat = numerix.sum(cellDistanceNormals[:, numerix.newaxis]
+                              * cellDistanceNormals[numerix.newaxis, :], axis=2)
+
+            D = self.dim
+            if D == 1:
+                inverse = 1. / mat
+            elif D == 2:
+                divisor = mat[0, 0] * mat[1, 1] - mat[0, 1] * mat[1, 0]
+                inverse = numerix.array([[mat[1, 1], -mat[0, 1]],
+                                         [-mat[1, 0], mat[0, 0]]]) / divisor
+            else:
+                # adjugate of each 3x3 matrix
+                inverse = numerix.empty(mat.shape, 'd')
+                for i in range(3):
+                    i1, i2 = (i + 1) % 3, (i + 2) % 3
+                    for j in range(3):
+                        j1, j2 = (j + 1) % 3, (j + 2) % 3
+                        inverse[j, i] = mat[i1, j1] * mat[i2, j2] - mat[i1, j2] * mat[i2, j1]
+                divisor = numerix.sum(mat[0] * inverse[:, 0], axis=0)
+                inverse /= divisor
+
+            self._leastSquaresGradData = (cellToCellDistances, cellDistanceNormals, inverse)
+
+        return self._leastSquaresGradData[1:]
+
     """Geometry properties"""
 
     @property
@@ -374,17 +424,14 @@ class AbstractMesh(object):
         self_XvertexCoords = selfc.vertexCoords[..., self_Xvertices]
         other_XvertexCoords = otherc.vertexCoords[..., other_Xvertices]
 
-        closest = numerix.nearest(self_XvertexCoords, other_XvertexCoords)
-
-        # just because they're closest, doesn't mean they're close
-        tmp = self_XvertexCoords[..., closest] - other_XvertexCoords
-        distance = numerix.sqrtDot(tmp, tmp)
         # only want vertex pairs that are 100x closer than the smallest
         # cell-to-cell distance
-        close = distance < resolution * min(selfc._cellToCellDistances.min(),
-                                            otherc._cellToCellDistances.min())
-        vertexCorrelates = numerix.array((self_Xvertices[closest[close]],
-                                          other_Xvertices[close]))
+        from fipy.tools.spatialIndex import _matchPoints
+        close = _matchPoints(self_XvertexCoords, other_XvertexCoords,
+                             tolerance=resolution * min(selfc._cellToCellDistances.min(),
+                                                        otherc._cellToCellDistances.min()))
+        vertexCorrelates = numerix.array((self_Xvertices[close[0]],
+                                          other_Xvertices[close[1]]))
 
         # warn if meshes don't touch, but allow it
         if (selfc._numberOfVertices > 0
@@ -414,12 +461,16 @@ class AbstractMesh(object):
             self_faceVertexIDs = MA.masked_values(self_faceVertexIDs, -1)
 
         # want self's Faces for which all faceVertexIDs are in vertexCorrelates
-        self_matchingFaces = numerix.in1d(self_faceVertexIDs,
-                                          vertexCorrelates[0]).reshape(self_faceVertexIDs.shape).all(axis=0).nonzero()[0]
+        self_filledFaceVertexIDs = MA.filled(self_faceVertexIDs, -1)
+        self_matchingFaces = (numerix.in1d(self_filledFaceVertexIDs,
+                                           vertexCorrelates[0]).reshape(self_faceVertexIDs.shape)
+                              | (self_filledFaceVertexIDs == -1)).all(axis=0).nonzero()[0]
 
         # want other's Faces for which all faceVertexIDs are in vertexCorrelates
-        other_matchingFaces = numerix.in1d(other_faceVertexIDs,
-                                           vertexCorrelates[1]).reshape(other_faceVertexIDs.shape).all(axis=0).nonzero()[0]
+        other_filledFaceVertexIDs = MA.filled(other_faceVertexIDs, -1)
+        other_matchingFaces = (numerix.in1d(other_filledFaceVertexIDs,
+                                            vertexCorrelates[1]).reshape(other_faceVertexIDs.shape)
+                               | (other_filledFaceVertexIDs == -1)).all(axis=0).nonzero()[0]
 
         # map other's Vertex IDs to new Vertex IDs,
         # accounting for overlaps with self's Vertex IDs
@@ -428,38 +479,21 @@ class AbstractMesh(object):
         vertex_map[verticesToAdd] = numerix.arange(otherNumVertices - len(vertexCorrelates[1])) + selfNumVertices
         vertex_map[vertexCorrelates[1]] = vertexCorrelates[0]
 
-        # calculate hashes of faceVertexIDs for comparing Faces
-
-        if self_matchingFaces.shape[-1] == 0:
-            self_faceHash = numerix.empty(self_matchingFaces.shape[:-1] + (0,), dtype="str")
-        else:
-            # sort each of self's Face's vertexIDs for canonical comparison
-            self_faceHash = numerix.sort(self_faceVertexIDs[..., self_matchingFaces], axis=0)
-            # then hash the Faces for comparison (NumPy set operations are only for 1D arrays)
-            self_faceHash = numerix.apply_along_axis(str, axis=0, arr=self_faceHash)
-
-        face_sort = numerix.argsort(self_faceHash)
-        self_faceHash = self_faceHash[face_sort]
-        self_matchingFaces = self_matchingFaces[face_sort]
-
-        if other_matchingFaces.shape[-1] == 0:
-            other_faceHash = numerix.empty(other_matchingFaces.shape[:-1] + (0,), dtype="str")
+        # look up other's Faces, in terms of the new Vertex IDs, among
+        # self's Faces by sorting their vertices together
+        if self_matchingFaces.shape[-1] == 0 or other_matchingFaces.shape[-1] == 0:
+            found = numerix.zeros((0,), dtype=numerix.INT_DTYPE)
+            other_matchingFaces = other_matchingFaces[:0]
         else:
-            # convert each of other's Face's vertexIDs to new IDs
-            other_faceHash = vertex_map[other_faceVertexIDs[..., other_matchingFaces]]
-            # sort each of other's Face's vertexIDs for canonical comparison
-            other_faceHash = numerix.sort(other_faceHash, axis=0)
-            # then hash the Faces for comparison (NumPy set operations are only for 1D arrays)
-            other_faceHash = numerix.apply_along_axis(str, axis=0, arr=other_faceHash)
-
-        face_sort = numerix.argsort(other_faceHash)
-        other_faceHash = other_faceHash[face_sort]
-        other_matchingFaces = other_matchingFaces[face_sort]
-
-        self_matchingFaces = self_matchingFaces[numerix.in1d(self_faceHash,
-                                                             other_faceHash)]
-        other_matchingFaces = other_matchingFaces[numerix.in1d(other_faceHash,
-                                                               self_faceHash)]
+            from fipy.meshes.mesh import _findFaces
+            other_matchingVertexIDs = other_filledFaceVertexIDs[..., other_matchingFaces]
+            other_matchingVertexIDs = numerix.where(other_matchingVertexIDs == -1, -1,
+                                                    vertex_map[other_matchingVertexIDs])
+            found = _findFaces(self_filledFaceVertexIDs[..., self_matchingFaces],
+                               other_matchingVertexIDs)
+
+        self_matchingFaces = self_matchingFaces[found[found >= 0]]
+        other_matchingFaces = other_matchingFaces[found >= 0]
 
         faceCorrelates = numerix.array((self_matchingFaces,
                                         other_matchingFaces))
@@ -8,3 +8,5 @@ from fipy.meshes.builders.grid3DBuilder import _NonuniformGrid3DBuilder
 from fipy.meshes.builders.grid3DBuilder import _UniformGrid3DBuilder
 from fipy.meshes.builders.grid3DBuilder import _Grid3DBuilder
 from fipy.meshes.builders.periodicGrid1DBuilder import _PeriodicGrid1DBuilder
+from fipy.meshes.builders.periodicGrid2DBuilder import _PeriodicGrid2DBuilder
+from fipy.meshes.builders.periodicGrid3DBuilder import _PeriodicGrid3DBuilder
@@ -100,6 +100,7 @@ class _AbstractGridBuilder(object):
 
         globalNumCells = reduce(self._mult, newNs)
         globalNumFaces = self._calcGlobalNumFaces(newNs)
+        globalShape = tuple(newNs)
 
         """
         parallel stuff
@@ -110,28 +111,42 @@ class _AbstractGridBuilder(object):
         procID = communicator.procID
         Nproc = communicator.Nproc
 
-        overlap = min(overlap, newNs[-1])
-        cellsPerNode = max(newNs[-1] // Nproc, overlap)
-        occupiedNodes = min(newNs[-1] // (cellsPerNode or 1), Nproc)
-
-        (firstOverlap,
-         secOverlap,
-         overlap) = self._buildOverlap(overlap, procID, occupiedNodes)
-
-        offsetArg = min(procID, occupiedNodes-1) * cellsPerNode - firstOverlap
-        offset = self._packOffset(offsetArg)
+        overlaps = [min(overlap, n) for n in newNs]
+        parts = self._calcProcessorGrid(newNs, Nproc, overlap)
+        occupiedNodes = reduce(self._mult, parts)
 
         """
         local nx, [ny, [nz]] calculation
         """
-        local_n = cellsPerNode * (procID < occupiedNodes)
+        offsets = []
+        firstOverlaps = []
+        secOverlaps = []
+        local_ns = []
+        index = min(procID, occupiedNodes - 1)
+        for n, p, o in zip(newNs, parts, overlaps):
+            # the first axis varies fastest over the process grid
+            index, k = divmod(index, p)
+            cellsPerNode = n // p
+
+            if procID < occupiedNodes:
+                (first, sec) = self._buildOverlap(o, k, p)
+                local_n = cellsPerNode
+                if k == p - 1:
+                    local_n += n - cellsPerNode * p
+                local_n += first + sec
+            else:
+                (first, sec) = (0, 0)
+                local_n = 0
 
-        if procID == occupiedNodes - 1:
-            local_n += (newNs[-1] - cellsPerNode * occupiedNodes)
+            offsets.append(k * cellsPerNode - first)
+            firstOverlaps.append(first)
+            secOverlaps.append(sec)
+            local_ns.append(local_n)
 
-        local_n += firstOverlap + secOverlap
+        offset = self._packOffset(offsets)
+        overlap = self._packOverlap(firstOverlaps, secOverlaps)
 
-        newNs = tuple(newNs[:-1] + [local_n])
+        newNs = tuple(local_ns)
 
         """
         post-parallel
@@ -162,6 +177,7 @@ class _AbstractGridBuilder(object):
 
         self.globalNumberOfCells = globalNumCells
         self.globalNumberOfFaces = globalNumFaces
+        self.globalShape = globalShape
 
         self.offset = offset
         self.overlap = overlap
@@ -188,6 +204,7 @@ class _AbstractGridBuilder(object):
                 self.scale,
                 self.globalNumberOfCells,
                 self.globalNumberOfFaces,
+                self.globalShape,
                 self.overlap,
                 self.offset,
                 self.numberOfVertices,
@@ -271,11 +288,66 @@ class _AbstractGridBuilder(object):
     def _calcNs(self, ns, ds):
         return self.NumPtsCalcClass.calcNs(ns, ds)
 
-    def _buildOverlap(self, overlap, procID, occupiedNodes):
-        (first, sec) = (overlap * (procID > 0) * (procID < occupiedNodes),
-                        overlap * (procID < occupiedNodes - 1))
+    def _calcProcessorGrid(self, ns, Nproc, overlap):
+        """
+        Choose the number of processes to divide each axis among.
+
+        As many processes as possible are occupied, each holding at least
+        `overlap` cells along any axis that is divided. Among the process
+        grids that do so, the one that gives the busiest process the fewest
+        ghost cells is chosen, with ties going to dividing the later axes,
+        so a grid is only cut into pencils or blocks when that reduces
+        communication over slabs.
 
-        return first, sec, self._packOverlap(first, sec)
+        >>> from fipy.meshes.builders import *
+
+        >>> _Grid1DBuilder()._calcProcessorGrid([10], 4, 2)
+        [4]
+        >>> _Grid1DBuilder()._calcProcessorGrid([5], 4, 2)
+        [2]
+        >>> _Grid2DBuilder()._calcProcessorGrid([100, 100], 2, 2)
+        [1, 2]
+        >>> _Grid2DBuilder()._calcProcessorGrid([100, 100], 4, 2)
+        [2, 2]
+        >>> _Grid2DBuilder()._calcProcessorGrid([1000, 10], 4, 2)
+        [4, 1]
+        >>> _Grid3DBuilder()._calcProcessorGrid([64, 64, 64], 64, 2)
+        [4, 4, 4]
+        >>> _Grid3DBuilder()._calcProcessorGrid([3, 2, 9], 8, 2)
+        [1, 1, 4]
+        """
+        maxParts = [max(n // max(min(overlap, n), 1), 1) for n in ns]
+        occupiedNodes = min(Nproc, reduce(self._mult, maxParts))
+
+        def factorizations(N, maxParts):
+            if len(maxParts) == 1:
+                if N <= maxParts[0]:
+                    yield [N]
+            else:
+                for p in range(1, min(N, maxParts[0]) + 1):
+                    if N % p == 0:
+                        for rest in factorizations(N // p, maxParts[1:]):
+                            yield [p] + rest
+
+        def ghostCells(parts):
+            local = [n - (n // p) * (p - 1) for n, p in zip(ns, parts)]
+            width = [min(overlap, n) * min(p - 1, 2) for n, p in zip(ns, parts)]
+            return (reduce(self._mult, [l + w for l, w in zip(local, width)])
+                    - reduce(self._mult, local))
+
+        while occupiedNodes > 1:
+            candidates = list(factorizations(occupiedNodes, maxParts))
+            if len(candidates) > 0:
+                return min(candidates,
+                           key=lambda parts: (ghostCells(parts),
+                                                  [-p for p in reversed(parts)]))
+            occupiedNodes -= 1
+
+        return [1] * len(ns)
+
+    def _buildOverlap(self, overlap, procID, occupiedNodes):
+        return (overlap * (procID > 0) * (procID < occupiedNodes),
+                overlap * (procID < occupiedNodes - 1))
 
     def _packOverlap(self, first, sec):
         raise NotImplementedError
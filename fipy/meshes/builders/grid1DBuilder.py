@@ -51,10 +51,10 @@ class _Grid1DBuilder(_AbstractGridBuilder):
         super(_Grid1DBuilder, self).buildGridData(*args, **kwargs)
 
     def _packOverlap(self, first, second):
-        return {'left': first, 'right': second}
+        return {'left': first[0], 'right': second[0]}
 
     def _packOffset(self, arg):
-        return arg
+        return arg[0]
 
     @property
     def _specificGridData(self):
@@ -195,10 +195,11 @@ class _Grid2DBuilder(_AbstractGridBuilder):
             return cellFaceIDs
 
     def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom': first, 'top': second}
+        return {'left': first[0], 'right': second[0],
+                'bottom': first[1], 'top': second[1]}
 
     def _packOffset(self, arg):
-        return (0, arg)
+        return tuple(arg)
 
 class _NonuniformGrid2DBuilder(_Grid2DBuilder):
 
@@ -170,11 +170,12 @@ class _Grid3DBuilder(_AbstractGridBuilder):
 
 
     def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom' : 0, 'top' : 0,
-                'front': first, 'back': second}
+        return {'left': first[0], 'right': second[0],
+                'bottom' : first[1], 'top' : second[1],
+                'front': first[2], 'back': second[2]}
 
     def _packOffset(self, arg):
-        return (0, 0, arg)
+        return tuple(arg)
 
 class _NonuniformGrid3DBuilder(_Grid3DBuilder):
 
@@ -39,6 +39,7 @@
 
 __docformat__ = 'restructuredtext'
 
+import hashlib
 import os
 from subprocess import Popen, PIPE
 import sys
@@ -52,9 +53,9 @@ from fipy.tools import parallelComm
 from fipy.tools import serialComm
 from fipy.tests.doctestPlus import register_skipper
 
-from fipy.meshes.mesh import Mesh
+from fipy.meshes.mesh import Mesh, _uniqueFaces, _findFaces
 from fipy.meshes.mesh2D import Mesh2D
-from fipy.meshes.topologies.meshTopology import _MeshTopology
+from fipy.meshes.topologies.meshTopology import _PartitionedMeshTopology
 
 from fipy.tools.debug import PRINT
 
@@ -139,11 +140,6 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
     if order > 1:
         communicator = serialComm
 
-    # Enforce gmsh version to be either >= 2 or 2.5, based on Nproc.
-    version = _gmshVersion(communicator=communicator)
-    if version < StrictVersion("2.0"):
-        raise EnvironmentError("Gmsh version must be >= 2.0.")
-
     # If we're being passed a .msh file, leave it be. Otherwise,
     # we've gotta compile a .msh file from either (i) a .geo file,
     # or (ii) a gmsh script passed as a string.
@@ -181,6 +177,12 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
                 geoFile = name
 
         if geoFile is not None:
+            # Enforce gmsh version to be either >= 2 or 2.5, based on Nproc.
+            # An existing MSH file is read without running gmsh.
+            version = _gmshVersion(communicator=communicator)
+            if version < StrictVersion("2.0"):
+                raise EnvironmentError("Gmsh version must be >= 2.0.")
+
             gmshFlags = ["-%d" % dimensions, "-nopopup"]
 
             if communicator.Nproc > 1:
@@ -532,34 +534,101 @@ class MSHFile(GmshFile):
         order.
         """
         self._seekForHeader("MeshFormat")
-        metaData = self.fileobj.readline().split()
+        metaData = [float(x) for x in self.fileobj.readline().split()]
+        if metaData[1] == 1:
+            # binary files write the integer 1 after the header
+            # so that we can detect their endianness
+            one = nx.fromstring(self.fileobj.read(4), dtype='<i4')[0]
+            if one == 1:
+                self.byteOrder = '<'
+            else:
+                self.byteOrder = '>'
         self.fileobj.seek(0)
-        return [float(x) for x in metaData]
+        return metaData
 
-    def _isolateData(self, title):
+    _chunkSize = 2**20
+
+    def _readSection(self, title):
         """
-        Gets all data between $[title] and $End[title], writes
-        it out to its own file.
+        Gets all data between $[title] and $End[title], reading the
+        file in large chunks rather than line by line.
         """
-        newF, newPath = tempfile.mkstemp(title, text=True)
-        newF = os.fdopen(newF, 'w')
+        endMarker = "$End%s" % title
+        chunks = []
+        buf = ""
         try:
             self._seekForHeader(title)
-        except Exception, e:
-            newF.close()
-            os.unlink(newPath)
-            raise
+            while True:
+                chunk = self.fileobj.read(self._chunkSize)
+                if len(chunk) == 0:
+                    raise EOFError("No `%s' footer found!" % endMarker)
+                buf += chunk
+                end = buf.find(endMarker)
+                if end >= 0:
+                    chunks.append(buf[:end])
+                    break
+                # hold back enough to spot a footer split between chunks
+                keep = len(endMarker) - 1
+                chunks.append(buf[:-keep])
+                buf = buf[-keep:]
+        finally:
+            self.fileobj.seek(0)
 
-        # extract the actual data within section
-        while True:
-            line = self.fileobj.readline()
-            if ("$End%s" % title) not in line:
-                newF.write(line)
-            else: break
+        return "".join(chunks)
 
-        self.fileobj.seek(0)
-        newF.close()
-        return newPath
+    def _readNodes(self):
+        """
+        Returns the Gmsh IDs and the coordinates of all nodes in the
+        $Nodes section.
+        """
+        numNodes, data = self._readSection("Nodes").split("\n", 1)
+        numNodes = int(numNodes)
+
+        if self.fileType == 1:
+            nodeType = nx.dtype([("id", self.byteOrder + "i4"),
+                                 ("coords", self.byteOrder + "f%d" % self.dataSize, (3,))])
+            nodes = nx.fromstring(data[:numNodes * nodeType.itemsize], dtype=nodeType)
+            return nodes["id"].astype(nx.INT_DTYPE), nodes["coords"].astype(float)
+        else:
+            nodes = nx.fromstring(data, sep=" ").reshape((numNodes, 4))
+            return nodes[..., 0].astype(nx.INT_DTYPE), nodes[..., 1:]
+
+    def _readElements(self):
+        """
+        Returns the $Elements section as a list of blocks of elements that
+        share an element type and a number of tags. Each block is an array
+        with rows of `[id, type, numTags, tags..., nodes...]`.
+        """
+        numElements, data = self._readSection("Elements").split("\n", 1)
+        numElements = int(numElements)
+
+        if self.fileType == 1:
+            # binary elements come in blocks, each preceded by a header of
+            # element type, number of elements, and number of tags
+            intType = nx.dtype(self.byteOrder + "i4")
+            blocks = []
+            offset = 0
+            while numElements > 0:
+                elType, numFollow, numTags = nx.fromstring(data[offset:offset + 3 * intType.itemsize],
+                                                           dtype=intType)
+                offset += 3 * intType.itemsize
+                length = 1 + numTags + _numNodesOfElement(elType)
+                raw = nx.fromstring(data[offset:offset + numFollow * length * intType.itemsize],
+                                    dtype=intType).reshape((numFollow, length))
+                offset += raw.nbytes
+
+                block = nx.empty((numFollow, length + 2), dtype=nx.INT_DTYPE)
+                block[..., 0] = raw[..., 0]
+                block[..., 1] = elType
+                block[..., 2] = numTags
+                block[..., 3:] = raw[..., 1:]
+                blocks.append(block)
+
+                numElements -= numFollow
+
+            return blocks
+        else:
+            return _splitElementBlocks(nx.fromstring(data, dtype=nx.INT_DTYPE, sep=" "))
 
     def _seekForHeader(self, title):
         """
@@ -576,121 +645,86 @@ class MSHFile(GmshFile):
             else:
                 break # found header
 
-    def _deriveCellsAndFaces(self, cellsToVertIDs, shapeTypes, numCells):
+    def _faceOrderings(self, shapeType):
         """
-        Uses element information obtained from `_parseElementFile` to deliver
-        `facesToVertices` and `cellsToFaces`.
+        Returns the vertex orderings of the faces of a cell of `shapeType`.
         """
-
-        allShapes  = nx.unique(shapeTypes).tolist()
-        maxFaces   = max([self.numFacesPerCell[x] for x in allShapes])
-
-        # `cellsToFaces` must be padded with -1; see mesh.py
-        currNumFaces = 0
-        cellsToFaces = nx.ones((numCells, maxFaces), 'l') * -1
-        facesDict    = {}
-        uniqueFaces  = []
-
-        # we now build `cellsToFaces` and `uniqueFaces`,
-        # the latter will result in `facesToVertices`.
-        for cellIdx in range(numCells):
-            shapeType = shapeTypes[cellIdx]
-            cell = cellsToVertIDs[cellIdx]
-
-            if shapeType in [5, 12, 17]: # hexahedron
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3], # ordering of vertices gleaned from
-                                                                 [4, 5, 6, 7], # a one-cube Grid3D example
-                                                                 [0, 1, 5, 4],
-                                                                 [3, 2, 6, 7],
-                                                                 [0, 3, 7, 4],
-                                                                 [1, 2, 6, 5]])
-            elif shapeType in [6, 13, 18]: # prism
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2],
-                                                                 [5, 4, 3],
-                                                                 [3, 4, 1, 0],
-                                                                 [4, 5, 2, 1],
-                                                                 [5, 3, 0, 2]])
-            elif shapeType in [7, 14, 19]: # pyramid
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3],
-                                                                 [0, 1, 4],
-                                                                 [1, 2, 4],
-                                                                 [2, 3, 4],
-                                                                 [3, 0, 4]])
-            else:
-                if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
-                    faceLength = 2 # triangle
-                elif shapeType in [3, 10, 16]:
-                    faceLength = 2 # quadrangle
-                elif shapeType in [4, 11, 29, 30, 31]:
-                    faceLength = 3 # tetrahedron
-
-                faces = self._extractRegularFaces(cell=cell,
-                                                  faceLength=faceLength,
-                                                  facesPerCell=self.numFacesPerCell[shapeType])
-
-            for faceIdx in range(len(faces)):
-                # NB: currFace is sorted for the key to spot duplicates
-                currFace = faces[faceIdx]
-                keyStr   = ' '.join([str(x) for x in sorted(currFace)])
-
-                if keyStr in facesDict:
-                    cellsToFaces[cellIdx][faceIdx] = facesDict[keyStr]
-                else: # new face
-                    facesDict[keyStr] = currNumFaces
-                    cellsToFaces[cellIdx][faceIdx] = currNumFaces
-                    uniqueFaces.append(currFace)
-                    currNumFaces += 1
-
-        # pad short faces with -1
-        maxFaceLen = max([len(f) for f in uniqueFaces])
-        uniqueFaces = [[-1] * (maxFaceLen - len(f)) + f for f in uniqueFaces]
-
-        facesToVertices = nx.array(uniqueFaces, dtype=nx.INT_DTYPE)
-
-        return facesToVertices.swapaxes(0,1)[::-1], cellsToFaces.swapaxes(0,1).copy('C'), facesDict
-
-    def _translateNodesToVertices(self, entitiesNodes, vertexMap):
-        """Translates entitiesNodes from Gmsh node IDs to `vertexCoords` indices.
+        if shapeType in [5, 12, 17]: # hexahedron
+            return [[0, 1, 2, 3], # ordering of vertices gleaned from
+                    [4, 5, 6, 7], # a one-cube Grid3D example
+                    [0, 1, 5, 4],
+                    [3, 2, 6, 7],
+                    [0, 3, 7, 4],
+                    [1, 2, 6, 5]]
+        elif shapeType in [6, 13, 18]: # prism
+            return [[0, 1, 2],
+                    [5, 4, 3],
+                    [3, 4, 1, 0],
+                    [4, 5, 2, 1],
+                    [5, 3, 0, 2]]
+        elif shapeType in [7, 14, 19]: # pyramid
+            return [[0, 1, 2, 3],
+                    [0, 1, 4],
+                    [1, 2, 4],
+                    [2, 3, 4],
+                    [3, 0, 4]]
+        else:
+            if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
+                faceLength = 2 # triangle
+            elif shapeType in [3, 10, 16]:
+                faceLength = 2 # quadrangle
+            elif shapeType in [4, 11, 29, 30, 31]:
+                faceLength = 3 # tetrahedron
+
+            # each face starts at successive corner vertices, which
+            # Gmsh lists ahead of any higher-order nodes
+            facesPerCell = self.numFacesPerCell[shapeType]
+            return [[(i + j) % facesPerCell for j in range(faceLength)]
+                    for i in range(facesPerCell)]
+
+    def _deriveCellsAndFaces(self, cellBlocks, numCells):
+        """
+        Uses the blocks of cell vertices obtained from `_parseElementFile`
+        and `_translateNodesToVertices` to deliver `facesToVertices` and
+        `cellsToFaces`.
         """
-        entitiesVertices = []
 
-        for entity in entitiesNodes:
-            try:
-                vertIndices = vertexMap[nx.array(entity)]
-            except IndexError:
-                vertIndices = nx.ones((len(entity),), 'l') * -1
-            entitiesVertices.append(vertIndices)
+        allShapes  = set([shape for shape, cells in cellBlocks])
+        orderings  = dict([(shape, self._faceOrderings(shape)) for shape in allShapes])
+        maxFaces   = max([len(o) for o in orderings.values()])
+        maxFaceLen = max([len(f) for o in orderings.values() for f in o])
 
-        return entitiesVertices
+        # faces of every cell, padded with -1 for short faces and
+        # for cells with fewer faces; see mesh.py
+        cellFaceVertices = nx.ones((numCells, maxFaces, maxFaceLen), dtype=nx.INT_DTYPE) * -1
 
-    def _extractRegularFaces(self, cell, faceLength, facesPerCell):
-        """Return faces for a regular poly(gon|hedron)
+        start = 0
+        for shape, cells in cellBlocks:
+            # an extra column of -1 lets short faces index their own padding
+            cells = nx.concatenate((cells, nx.ones((len(cells), 1), dtype=nx.INT_DTYPE) * -1), axis=1)
 
-        Given `cell`, defined by node IDs, returns an array of
-        `facesPerCell` faces of length `faceLength` in terms of nodes.
-        """
-        faces = []
-        for i in range(facesPerCell):
-            aFace = []
-            for j in range(faceLength):
-                aVertex = (i + j) % len(cell) # we may wrap
-                aFace.append(int(cell[aVertex]))
-            faces.append(aFace)
-        return faces
-
-    def _extractOrderedFaces(self, cell, faceOrderings):
-        """Return faces for a 8-node hexahedron cell.
+            # FiPy faces run opposite to the Gmsh orderings
+            faceOrderings = nx.array([f[::-1] + [-1] * (maxFaceLen - len(f)) for f in orderings[shape]])
+
+            cellFaceVertices[start:start + len(cells), :len(faceOrderings)] = cells[..., faceOrderings]
+            start += len(cells)
+
+        return _uniqueFaces(cellFaceVertices)
+
+    def _translateNodesToVertices(self, blocks, vertexMap):
+        """Translates the nodes of each block of elements from Gmsh node IDs
+        to `vertexCoords` indices. Elements with nodes beyond `vertexMap`
+        are given vertices of -1.
         """
-        def orderingToFace(vertList):
-            aFace = []
-            for i in vertList:
-                aFace.append(int(cell[i]))
-            return aFace
+        translated = []
 
-        return [orderingToFace(o) for o in faceOrderings]
+        for shape, nodes in blocks:
+            outside = (nodes >= len(vertexMap)).any(axis=-1)
+            vertices = vertexMap[nx.where(nodes < len(vertexMap), nodes, 0)]
+            vertices[outside] = -1
+            translated.append((shape, vertices))
+
+        return translated
 
     def read(self):
         """
@@ -701,162 +735,144 @@ class MSHFile(GmshFile):
         3. Build faces
         4. Build cellsToFaces
 
-        Isolate relevant data into three files, store in
-        `self.nodesPath` for $Nodes,
-        `self.elemsPath` for $Elements.
-        `self.namesFile` for $PhysicalNames.
+        The $Nodes and $Elements sections are parsed in bulk, from either
+        ASCII or binary files, and kept in `self.nodeIDs`,
+        `self.nodeCoords`, and `self.elementBlocks`. $PhysicalNames is
+        kept in `self.namesSection`.
 
         Returns vertexCoords, facesToVertexID, cellsToFaceID,
                 cellGlobalIDMap, ghostCellGlobalIDMap.
         """
         self.version, self.fileType, self.dataSize = self._getMetaData()
-        self.nodesPath = self._isolateData("Nodes")
-        self.elemsPath = self._isolateData("Elements")
+        self.nodeIDs, self.nodeCoords = self._readNodes()
+        self.elementBlocks = self._readElements()
         try:
-            self.namesPath = self._isolateData("PhysicalNames")
+            self.namesSection = self._readSection("PhysicalNames")
         except EOFError, e:
-            self.namesPath = None
-
-        try:
-            if self.dimensions is None:
-                nodesFile = open(self.nodesPath, 'r')
-                nodesFile.readline() # skip number of nodes
-
-                # We assume we have a 2D file unless we find a node
-                # with a non-zero Z coordinate
-                self.dimensions = 2
-                for node in nodesFile:
-                    line   = node.split()
+            self.namesSection = None
 
-                    newVert = [float(x) for x in line]
-
-                    if newVert[2] != 0.0:
-                        self.dimensions = 3
-                        break
-
-                nodesFile.close()
-
-            self.coordDimensions = self.coordDimensions or self.dimensions
-
-            # we need a conditional here so we don't pick up 2D shapes in 3D
-            if self.dimensions == 2:
-                self.numVertsPerFace = {1: 2, # 2-node line
-                                        8: 2} # 3-node line
-                self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 faces)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-            elif self.dimensions == 3:
-                self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 vertices)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-                self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
-                                        11: 4, # 10-node tetrahedron (we only read 1st 4)
-                                        29: 4, # 20-node tetrahedron (we only read 1st 4)
-                                        30: 4, # 35-node tetrahedron (we only read 1st 4)
-                                        31: 4, # 56-node tetrahedron (we only read 1st 4)
-                                         5: 6, # 8-node hexahedron (6 faces)
-                                        12: 6, # 27-node tetrahedron (we only read 1st 6)
-                                        17: 6, # 20-node tetrahedron (we only read 1st 6)
-                                         6: 5, # 6-node prism (5 faces)
-                                        13: 5, # 18-node prism (we only read 1st 6)
-                                        18: 5, # 15-node prism (we only read 1st 6)
-                                         7: 5, # 5-node pyramid (5 faces)
-                                        14: 5, # 14-node pyramid (we only read 1st 5)
-                                        19: 5} # 13-node pyramid (we only read 1st 5)
+        if self.dimensions is None:
+            # We assume we have a 2D file unless we find a node
+            # with a non-zero Z coordinate
+            if nx.any(self.nodeCoords[..., 2] != 0.0):
+                self.dimensions = 3
             else:
-                raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
-
-            parprint("Parsing elements.")
-            (cellsData,
-             ghostsData,
-             facesData) = self._parseElementFile()
-
-            cellsToGmshVerts = cellsData.nodes + ghostsData.nodes
-            numCellsTotal    = len(cellsData.nodes) + len(ghostsData.nodes)
-            allShapeTypes    = cellsData.shapes + ghostsData.shapes
-            allShapeTypes    = nx.array(allShapeTypes)
-            allShapeTypes    = nx.delete(allShapeTypes, nx.s_[numCellsTotal:])
-            self.physicalCellMap = nx.array(cellsData.physicalEntities
-                                            + ghostsData.physicalEntities)
-            self.geometricalCellMap = nx.array(cellsData.geometricalEntities
-                                               + ghostsData.geometricalEntities)
-
-            if numCellsTotal < 1:
-                errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
-                errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
-                raise GmshException(errStr)
-
-            parprint("Recovering coords.")
-            parprint("numcells %d" % numCellsTotal)
-            vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellsToGmshVerts)
-
-            # translate Gmsh IDs to `vertexCoord` indices
-            cellsToVertIDs = self._translateNodesToVertices(cellsToGmshVerts,
-                                                            vertIDtoIdx)
-
-            parprint("Building cells and faces.")
-            (facesToV,
-             cellsToF,
-             facesDict) = self._deriveCellsAndFaces(cellsToVertIDs,
-                                                    allShapeTypes,
-                                                    numCellsTotal)
-
-            # cell entities were easy to record on parsing
-            # but we don't use Gmsh faces, so we need to correlate the nodes
-            # that make up the Gmsh faces with the vertex IDs of the FiPy faces
-            # so that we can check if any are named
-            faceEntitiesDict = dict()
+                self.dimensions = 2
 
+        self.coordDimensions = self.coordDimensions or self.dimensions
+
+        # we need a conditional here so we don't pick up 2D shapes in 3D
+        if self.dimensions == 2:
+            self.numVertsPerFace = {1: 2, # 2-node line
+                                    8: 2} # 3-node line
+            self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 faces)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+        elif self.dimensions == 3:
+            self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 vertices)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+            self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
+                                    11: 4, # 10-node tetrahedron (we only read 1st 4)
+                                    29: 4, # 20-node tetrahedron (we only read 1st 4)
+                                    30: 4, # 35-node tetrahedron (we only read 1st 4)
+                                    31: 4, # 56-node tetrahedron (we only read 1st 4)
+                                     5: 6, # 8-node hexahedron (6 faces)
+                                    12: 6, # 27-node tetrahedron (we only read 1st 6)
+                                    17: 6, # 20-node tetrahedron (we only read 1st 6)
+                                     6: 5, # 6-node prism (5 faces)
+                                    13: 5, # 18-node prism (we only read 1st 6)
+                                    18: 5, # 15-node prism (we only read 1st 6)
+                                     7: 5, # 5-node pyramid (5 faces)
+                                    14: 5, # 14-node pyramid (we only read 1st 5)
+                                    19: 5} # 13-node pyramid (we only read 1st 5)
+        else:
+            raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
+
+        parprint("Parsing elements.")
+        (cellsData,
+         ghostsData,
+         facesData) = self._parseElementFile()
+
+        cellBlocks       = cellsData.blocks + ghostsData.blocks
+        numCellsTotal    = cellsData.numberOfElements + ghostsData.numberOfElements
+        self.physicalCellMap = nx.concatenate((cellsData.physicalEntities,
+                                               ghostsData.physicalEntities))
+        self.geometricalCellMap = nx.concatenate((cellsData.geometricalEntities,
+                                                  ghostsData.geometricalEntities))
+
+        if numCellsTotal < 1:
+            errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
+            errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
+            raise GmshException(errStr)
+
+        parprint("Recovering coords.")
+        parprint("numcells %d" % numCellsTotal)
+        vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellBlocks)
+
+        # translate Gmsh IDs to `vertexCoord` indices
+        cellBlocks = self._translateNodesToVertices(cellBlocks, vertIDtoIdx)
+
+        parprint("Building cells and faces.")
+        (facesToV,
+         cellsToF) = self._deriveCellsAndFaces(cellBlocks, numCellsTotal)
+
+        # cell entities were easy to record on parsing
+        # but we don't use Gmsh faces, so we need to find the FiPy faces
+        # made of the same vertices as the Gmsh faces to see if any are named
+        self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+        self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+
+        if facesData.numberOfElements > 0:
             # translate Gmsh IDs to `vertexCoord` indices
-            facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
-                                                            vertIDtoIdx)
-
-            for face, physicalEntity, geometricalEntity in zip(facesToVertIDs,
-                                                               facesData.physicalEntities,
-                                                               facesData.geometricalEntities):
-                faceEntitiesDict[' '.join([str(x) for x in sorted(face)])] = (physicalEntity, geometricalEntity)
-
-            self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            for face in facesDict.keys():
-                # not all faces are necessarily tagged
-                if face in faceEntitiesDict:
-                    self.physicalFaceMap[facesDict[face]] = faceEntitiesDict[face][0]
-                    self.geometricalFaceMap[facesDict[face]] = faceEntitiesDict[face][1]
-
-            self.physicalNames = self._parseNamesFile()
-
-        finally:
-            os.unlink(self.nodesPath)
-            os.unlink(self.elemsPath)
-            if self.namesPath is not None:
-                os.unlink(self.namesPath)
-
-        # convert lists of cell vertices to a properly oriented masked array
-        maxVerts = max([len(v) for v in cellsToVertIDs])
-        # ticket:539 - NumPy 1.7 casts to array before concatenation and empty array defaults to float
-        cellsToVertIDs = [nx.concatenate((v, nx.array([-1] * (maxVerts-len(v)), dtype=nx.INT_DTYPE))) for v in cellsToVertIDs]
+            faceBlocks = self._translateNodesToVertices(facesData.blocks,
+                                                        vertIDtoIdx)
+
+            numVerts = max([self.numVertsPerFace[shape] for shape, faces in faceBlocks])
+            gmshFaces = nx.ones((numVerts, facesData.numberOfElements), dtype=nx.INT_DTYPE) * -1
+            start = 0
+            for shape, faces in faceBlocks:
+                n = self.numVertsPerFace[shape]
+                gmshFaces[:n, start:start + len(faces)] = faces[..., :n].swapaxes(0, 1)
+                start += len(faces)
+
+            faceIDs = _findFaces(facesToV, gmshFaces)
+
+            # not all faces are necessarily tagged
+            tagged = faceIDs >= 0
+            self.physicalFaceMap[faceIDs[tagged]] = facesData.physicalEntities[tagged]
+            self.geometricalFaceMap[faceIDs[tagged]] = facesData.geometricalEntities[tagged]
+
+        self.physicalNames = self._parseNamesFile()
+
+        # convert blocks of cell vertices to a properly oriented masked array
+        maxVerts = max([cells.shape[-1] for shape, cells in cellBlocks])
+        cellsToVertIDs = nx.ones((numCellsTotal, maxVerts), dtype=nx.INT_DTYPE) * -1
+        start = 0
+        for shape, cells in cellBlocks:
+            cellsToVertIDs[start:start + len(cells), :cells.shape[-1]] = cells
+            start += len(cells)
         cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs, value=-1).swapaxes(0,1)
 
         parprint("Done with cells and faces.")
         return (vertexCoords, facesToV, cellsToF,
-                cellsData.idmap, ghostsData.idmap,
+                cellsData.idmap.tolist(), ghostsData.idmap.tolist(),
                 cellsToVertIDs)
 
     def write(self, obj, time=0.0, timeindex=0):
@@ -986,44 +1002,25 @@ class MSHFile(GmshFile):
 
         self.fileobj.write("$EndElementData\n")
 
-    def _vertexCoordsAndMap(self, cellsToGmshVerts):
+    def _vertexCoordsAndMap(self, cellBlocks):
         """
         Returns `vertexCoords` and mapping from Gmsh ID to `vertexCoords`
         indices (same as in MSHFile).
 
-        Unlike parent, doesn't use genfromtxt
-        because we want to avoid loading the entire msh file into memory.
+        The coordinates come from the bulk-parsed $Nodes section.
         """
-        allVerts     = [v for c in cellsToGmshVerts for v in c] # flatten
-        allVerts     = nx.unique(nx.array(allVerts, dtype=nx.INT_DTYPE)) # remove dups
-        allVerts     = nx.sort(allVerts)
+        allVerts     = nx.concatenate([cells.ravel() for shape, cells in cellBlocks])
+        allVerts     = nx.unique(allVerts) # remove dups, sorted
         maxVertIdx   = allVerts[-1] + 1 # add one to offset zero
         vertGIDtoIdx = nx.ones(maxVertIdx, 'l') * -1 # gmsh ID -> vertexCoords idx
-        vertexCoords = nx.empty((len(allVerts), self.coordDimensions))
-        nodeCount    = 0
 
         # establish map. This works because allVerts is a sorted set.
         vertGIDtoIdx[allVerts] = nx.arange(len(allVerts))
 
-        nodesFile = open(self.nodesPath, 'r')
-        nodesFile.readline() # skip number of nodes
-
-        # now we walk through node file with a sorted unique list of vertices
-        # in hand. When we encounter 0th element in `allVerts`, save it
-        # to `vertexCoords` then pop its ID off `allVerts`.
-        for node in nodesFile:
-            line   = node.split()
-            nodeID = int(line[0])
-
-            if nodeID == allVerts[nodeCount]:
-                newVert = [float(x) for x in line[1:self.coordDimensions+1]]
-                vertexCoords[nodeCount,:] = nx.array(newVert)
-                nodeCount += 1
-
-            if len(allVerts) == nodeCount:
-                break
-
-        nodesFile.close()
+        # Gmsh IDs need be neither contiguous nor sorted in the $Nodes section
+        sorter = nx.argsort(self.nodeIDs)
+        rows = sorter[nx.searchsorted(self.nodeIDs, allVerts, sorter=sorter)]
+        vertexCoords = self.nodeCoords[rows, :self.coordDimensions]
 
         # transpose for FiPy
         transCoords = vertexCoords.swapaxes(0,1)
@@ -1039,90 +1036,57 @@ class MSHFile(GmshFile):
         GHOST CELLS OURSELVES, the only code we'd have to change is in here.
         """
 
-        def _parseTags(offset, currLineInts):
-            if offset == -1:
-                # if first valid shape
-                offset = currLineInts[0]
-
-            numTags = currLineInts[2]
-            tags    = currLineInts[3:(3+numTags)]
-
-            # the partition tags for don't seem to always be present
-            # and don't always make much sense when they are
-
-            if len(tags) >= 2:
-                physicalEntity = tags.pop(0)
-                geometricalEntity = tags.pop(0)
-            else:
-                physicalEntity = geometricalEntity = -1
-
-            return offset, tags, physicalEntity, geometricalEntity
-
-
         cellsData = _ElementData()
         ghostsData = _ElementData()
         facesData = _ElementData()
 
-        cellOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        faceOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
+        cellOffset = None # this will be subtracted from gmsh ID to obtain global ID
+        faceOffset = None # this will be subtracted from gmsh ID to obtain global ID
         pid = self.communicator.procID + 1
 
-        elemsFile = open(self.elemsPath, 'r')
-
-        elemsFile.readline() # skip number of elements
-        for el in elemsFile:
-            currLineInts = [int(x) for x in el.split()]
-            elemType     = currLineInts[1]
+        for elements in self.elementBlocks:
+            elemType = elements[0, 1]
+            numTags = elements[0, 2]
 
             if elemType in self.numFacesPerCell.keys():
-                # element is a cell
-
-                (cellOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=cellOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= cellOffset
-
-                if len(tags) > 0:
-                    # next item is a count
-                    if tags[0] != len(tags) - 1:
-                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (tags[0], len(tags) - 1),
+                # elements are cells
+
+                if cellOffset is None:
+                    # if first valid shape
+                    cellOffset = elements[0, 0]
+                elements[..., 0] -= cellOffset
+
+                # tags beyond the physical and geometrical entities
+                # are a partition count followed by the partitions
+                if numTags >= 2:
+                    tags = elements[..., 5:(3+numTags)]
+                else:
+                    tags = elements[..., 3:(3+numTags)]
+
+                if tags.shape[-1] > 0:
+                    counts = tags[..., 0]
+                    disagree = (counts != tags.shape[-1] - 1)
+                    if disagree.any():
+                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (counts[disagree.argmax()], tags.shape[-1] - 1),
                                       SyntaxWarning, stacklevel=2)
-                    tags = tags[1:]
+                    tags = tags[..., 1:]
 
                 if self.communicator.Nproc > 1:
-                    for tag in tags:
-                        if -tag == pid:
-                            # if we're collecting ghost cells and this is our ghost cell
-                            ghostsData.add(currLine=currLineInts, elType=elemType,
-                                           physicalEntity=physicalEntity,
-                                           geometricalEntity=geometricalEntity)
-                        elif tag == pid:
-                            # el is in this processor's partition or we collect all cells
-                            cellsData.add(currLine=currLineInts, elType=elemType,
-                                          physicalEntity=physicalEntity,
-                                          geometricalEntity=geometricalEntity)
+                    # if we're collecting ghost cells and this is our ghost cell
+                    ghostsData.extend(elements[(tags == -pid).any(axis=-1)])
+                    # el is in this processor's partition or we collect all cells
+                    cellsData.extend(elements[(tags == pid).any(axis=-1)])
                 else:
                     # we collect all cells
-                    cellsData.add(currLine=currLineInts, elType=elemType,
-                                  physicalEntity=physicalEntity,
-                                  geometricalEntity=geometricalEntity)
+                    cellsData.extend(elements)
             elif elemType in self.numVertsPerFace.keys():
-                # element is a face
-
-                (faceOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=faceOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= faceOffset
+                # elements are faces
 
-                facesData.add(currLine=currLineInts, elType=elemType,
-                              physicalEntity=physicalEntity,
-                              geometricalEntity=geometricalEntity)
+                if faceOffset is None:
+                    faceOffset = elements[0, 0]
+                elements[..., 0] -= faceOffset
 
-        elemsFile.close()
+                facesData.extend(elements)
 
         return cellsData, ghostsData, facesData
 
@@ -1134,12 +1098,13 @@ class MSHFile(GmshFile):
             2: dict(),
             3: dict()
         }
-        if self.namesPath is not None:
-            namesFile = open(self.namesPath, 'r')
+        if self.namesSection is not None:
+            names = self.namesSection.splitlines()
 
-            namesFile.readline() # skip number of elements
-            for nm in namesFile:
+            for nm in names[1:]: # skip number of elements
                 nm = nm.split()
+                if len(nm) == 0:
+                    continue
                 if self.version > 2.0:
                     dim = [int(nm.pop(0))]
                 else:
@@ -1152,35 +1117,32 @@ class MSHFile(GmshFile):
                 for d in dim:
                     physicalNames[d][name] = int(num)
 
-            namesFile.close()
-
         return physicalNames
 
     def makeMapVariables(self, mesh):
         """Utility function to make MeshVariables that define different domains in the mesh
         """
-        from fipy.variables.cellVariable import CellVariable
-        from fipy.variables.faceVariable import FaceVariable
+        mapVariables = _makeMapVariables(mesh=mesh, **self._entities)
 
-        self.physicalCellMap = CellVariable(mesh=mesh, value=self.physicalCellMap)
-        self.geometricalCellMap = CellVariable(mesh=mesh, value=self.geometricalCellMap)
-        self.physicalFaceMap = FaceVariable(mesh=mesh, value=self.physicalFaceMap)
-        self.geometricalFaceMap = FaceVariable(mesh=mesh, value=self.geometricalFaceMap)
-
-        physicalCells = dict()
-        for name in self.physicalNames[self.dimensions].keys():
-            physicalCells[name] = (self.physicalCellMap == self.physicalNames[self.dimensions][name])
+        (self.physicalCellMap,
+         self.geometricalCellMap,
+         physicalCells,
+         self.physicalFaceMap,
+         self.geometricalFaceMap,
+         physicalFaces) = mapVariables
 
-        physicalFaces = dict()
-        for name in self.physicalNames[self.dimensions-1].keys():
-            physicalFaces[name] = (self.physicalFaceMap == self.physicalNames[self.dimensions-1][name])
+        return mapVariables
 
-        return (self.physicalCellMap,
-                self.geometricalCellMap,
-                physicalCells,
-                self.physicalFaceMap,
-                self.geometricalFaceMap,
-                physicalFaces)
+    @property
+    def _entities(self):
+        """The Gmsh entities of the cells and faces found by `read()`
+        """
+        return dict(physicalCellMap=self.physicalCellMap,
+                    geometricalCellMap=self.geometricalCellMap,
+                    physicalFaceMap=self.physicalFaceMap,
+                    geometricalFaceMap=self.geometricalFaceMap,
+                    physicalNames=self.physicalNames,
+                    dimensions=self.dimensions)
 
     def _test(self):
         """
@@ -1258,112 +1220,322 @@ class MSHFile(GmshFile):
         """
         pass
 
-class _ElementData(object):
+# number of nodes for each Gmsh element type
+_numNodesOfElementType = {
+     1: 2,   # 2-node line
+     2: 3,   # 3-node triangle
+     3: 4,   # 4-node quadrangle
+     4: 4,   # 4-node tetrahedron
+     5: 8,   # 8-node hexahedron
+     6: 6,   # 6-node prism
+     7: 5,   # 5-node pyramid
+     8: 3,   # 3-node line
+     9: 6,   # 6-node triangle
+    10: 9,   # 9-node quadrangle
+    11: 10,  # 10-node tetrahedron
+    12: 27,  # 27-node hexahedron
+    13: 18,  # 18-node prism
+    14: 14,  # 14-node pyramid
+    15: 1,   # 1-node point
+    16: 8,   # 8-node quadrangle
+    17: 20,  # 20-node hexahedron
+    18: 15,  # 15-node prism
+    19: 13,  # 13-node pyramid
+    20: 9,   # 9-node triangle
+    21: 10,  # 10-node triangle
+    22: 12,  # 12-node triangle
+    23: 15,  # 15-node triangle
+    24: 15,  # 15-node triangle
+    25: 21,  # 21-node triangle
+    26: 4,   # 4-node line
+    27: 5,   # 5-node line
+    28: 6,   # 6-node line
+    29: 20,  # 20-node tetrahedron
+    30: 35,  # 35-node tetrahedron
+    31: 56,  # 56-node tetrahedron
+    92: 64,  # 64-node hexahedron
+    93: 125  # 125-node hexahedron
+}
+
+def _numNodesOfElement(elType):
+    try:
+        return _numNodesOfElementType[elType]
+    except KeyError:
+        raise GmshException("Unknown Gmsh element type %d" % elType)
+
+def _splitElementBlocks(ints):
     """
-    Bookkeeping for cells. Declared as own class for generality.
+    Split the integers of an ASCII `$Elements` section into blocks of
+    consecutive elements that share an element type and a number of tags,
+    such that each block is a 2D array with rows of
+    `[id, type, numTags, tags..., nodes...]`.
+
+        >>> ints = nx.array([1, 15, 2, 0, 1, 1,
+        ...                  2, 1, 2, 0, 1, 1, 2,
+        ...                  3, 1, 2, 0, 1, 2, 3,
+        ...                  4, 2, 3, 0, 1, 1, 1, 2, 3])
+        >>> for block in _splitElementBlocks(ints):
+        ...     print block.tolist()
+        [[1, 15, 2, 0, 1, 1]]
+        [[2, 1, 2, 0, 1, 1, 2], [3, 1, 2, 0, 1, 2, 3]]
+        [[4, 2, 3, 0, 1, 1, 1, 2, 3]]
+    """
+    blocks = []
+    start = 0
+    while start < len(ints):
+        elType, numTags = ints[start + 1], ints[start + 2]
+        length = 3 + numTags + _numNodesOfElement(elType)
+        if start + length > len(ints):
+            raise GmshException("Truncated element %d in $Elements section" % ints[start])
+
+        # Scan ahead in geometrically growing windows for the first element
+        # with a different layout, so that runs of similar elements are
+        # found without rescanning the rest of the section each time.
+        end = start
+        window = 256
+        while True:
+            available = min(window, (len(ints) - end) // length)
+            if available == 0:
+                break
+            candidates = ints[end:end + available * length].reshape((available, length))
+            differs = (candidates[..., 1] != elType) | (candidates[..., 2] != numTags)
+            if differs.any():
+                end += differs.argmax() * length
+                break
+            end += available * length
+            window *= 2
+
+        blocks.append(ints[start:end].reshape((-1, length)))
+        start = end
+
+    return blocks
+
+def _makeMapVariables(mesh, physicalCellMap, geometricalCellMap,
+                      physicalFaceMap, geometricalFaceMap,
+                      physicalNames, dimensions):
+    from fipy.variables.cellVariable import CellVariable
+    from fipy.variables.faceVariable import FaceVariable
+
+    physicalCellMap = CellVariable(mesh=mesh, value=physicalCellMap)
+    geometricalCellMap = CellVariable(mesh=mesh, value=geometricalCellMap)
+    physicalFaceMap = FaceVariable(mesh=mesh, value=physicalFaceMap)
+    geometricalFaceMap = FaceVariable(mesh=mesh, value=geometricalFaceMap)
 
-    "nodes": A Python list of the vertices that make up this element
-    "shapes": A shapeTypes Python list
-    "idmap": A Python list which maps vertexCoords idx -> global ID
-    "physicalEntities": A Python list of the Gmsh physical entities each element is in
-    "geometricalEntities": A Python list of the Gmsh geometrical entities each element is in
+    physicalCells = dict()
+    for name in physicalNames[dimensions].keys():
+        physicalCells[name] = (physicalCellMap == physicalNames[dimensions][name])
+
+    physicalFaces = dict()
+    for name in physicalNames[dimensions-1].keys():
+        physicalFaces[name] = (physicalFaceMap == physicalNames[dimensions-1][name])
+
+    return (physicalCellMap,
+            geometricalCellMap,
+            physicalCells,
+            physicalFaceMap,
+            geometricalFaceMap,
+            physicalFaces)
+
+class _GmshMeshCache(object):
     """
-    def __init__(self):
-        self.nodes = []
-        self.shapes = []
-        self.idmap = [] # vertexCoords idx -> gmsh ID (global ID)
-        self.physicalEntities = []
-        self.geometricalEntities = []
-
-    def add(self, currLine, elType, physicalEntity, geometricalEntity):
-        numTags = currLine[2]
-        self.nodes.append(currLine[(numTags+3):])
-        self.shapes.append(elType)
-        self.idmap.append(currLine[0])
-        self.physicalEntities.append(physicalEntity)
-        self.geometricalEntities.append(geometricalEntity)
-
-class _GmshTopology(_MeshTopology):
+    On-disk cache of the arrays read from a Gmsh mesh and of the topology
+    and geometry `Mesh` derives from them, stored in the
+    :mod:`~fipy.tools.checkpoint` format so that they are read back by
+    memory mapping.
+
+    A cached mesh is found in `cacheDir`, or in the directory named by
+    the :envvar:`FIPY_GMSH_CACHE` environment variable, by the content
+    of `arg` (but not of any files that a geometry script includes or
+    merges), the Gmsh version, the requested dimensions and order, and
+    the number of processors and the rank of this one. Meshes generated
+    with a `background` are never cached.
+    """
+    _version = 1
 
-    @property
-    def _globalNonOverlappingCellIDs(self):
-        """
-        Return the IDs of the local mesh in the context of the
-        global parallel mesh. Does not include the IDs of boundary cells.
+    def __init__(self, arg, dimensions, coordDimensions, communicator, order, background, cacheDir):
+        cacheDir = cacheDir or os.environ.get('FIPY_GMSH_CACHE')
 
-        E.g., would return [0, 1, 4, 5] for mesh A
+        if cacheDir is None or background is not None:
+            self.filename = None
+        else:
+            if os.path.exists(arg):
+                f = open(arg, 'rb')
+                try:
+                    content = f.read()
+                finally:
+                    f.close()
+            else:
+                content = arg
 
-            A        B
-        ------------------
-        | 4 | 5 || 6 | 7 |
-        ------------------
-        | 0 | 1 || 2 | 3 |
-        ------------------
+            key = hashlib.sha1(content)
+            for part in [self._version, _gmshVersion(communicator=communicator),
+                         dimensions, coordDimensions, order,
+                         communicator.Nproc, communicator.procID]:
+                key.update("\0" + str(part))
 
-        .. note:: Trivial except for parallel meshes
-        """
-        return nx.array(self.mesh.cellGlobalIDs)
+            self.filename = os.path.join(cacheDir, key.hexdigest() + ".fipymesh")
 
-    @property
-    def _globalOverlappingCellIDs(self):
+    def read(self):
         """
-        Return the IDs of the local mesh in the context of the
-        global parallel mesh. Includes the IDs of boundary cells.
+        Returns the cached `dict` of arrays, or `None` if there is none.
+        """
+        if self.filename is None or not os.path.exists(self.filename):
+            return None
 
-        E.g., would return [0, 1, 2, 4, 5, 6] for mesh A
+        from fipy.tools import checkpoint
 
-            A        B
-        ------------------
-        | 4 | 5 || 6 | 7 |
-        ------------------
-        | 0 | 1 || 2 | 3 |
-        ------------------
+        try:
+            return checkpoint._readArrays(self.filename)
+        except (IOError, ValueError, KeyError, EOFError), e:
+            warnings.warn("Ignoring unreadable Gmsh mesh cache %s: %s" % (self.filename, e),
+                          RuntimeWarning, stacklevel=3)
+            return None
 
-        .. note:: Trivial except for parallel meshes
+    def write(self, mesh, arrays):
         """
-        return nx.array(self.mesh.cellGlobalIDs + self.mesh.gCellGlobalIDs)
-
-    @property
-    def _localNonOverlappingCellIDs(self):
+        Cache `arrays`, along with the topology and geometry of `mesh`.
         """
-        Return the IDs of the local mesh in isolation.
-        Does not include the IDs of boundary cells.
+        if self.filename is None or os.path.exists(self.filename):
+            return
 
-        E.g., would return [0, 1, 2, 3] for mesh A
+        from fipy.tools import checkpoint
 
-            A        B
-        ------------------
-        | 3 | 4 || 4 | 5 |
-        ------------------
-        | 0 | 1 || 1 | 2 |
-        ------------------
+        arrays = dict(arrays)
+        arrays.update(mesh._cacheableState)
 
-        .. note:: Trivial except for parallel meshes
-        """
-        return nx.arange(len(self.mesh.cellGlobalIDs))
+        # write to a temporary file first, so that concurrent runs
+        # never see a partially written cache
+        cacheDir = os.path.dirname(self.filename)
+        if not os.path.exists(cacheDir):
+            try:
+                os.makedirs(cacheDir)
+            except OSError:
+                pass
+        (f, tmp) = tempfile.mkstemp(suffix=".tmp", dir=cacheDir)
+        os.close(f)
+        try:
+            checkpoint._writeArrays(tmp, arrays)
+            os.rename(tmp, self.filename)
+        except (IOError, OSError):
+            if os.path.exists(tmp):
+                os.unlink(tmp)
 
-    @property
-    def _localOverlappingCellIDs(self):
-        """
-        Return the IDs of the local mesh in isolation.
-        Includes the IDs of boundary cells.
+def _readGmshMesh(arg, dimensions, coordDimensions, communicator, order, background, cacheDir):
+    """
+    Returns the `_GmshMeshCache` for `arg`, the arrays that define the mesh
+    and the Gmsh entities of its cells and faces, and, if they were
+    cached, the topology and geometry that `Mesh` derives from them.
+    """
+    cache = _GmshMeshCache(arg,
+                           dimensions=dimensions,
+                           coordDimensions=coordDimensions,
+                           communicator=communicator,
+                           order=order,
+                           background=background,
+                           cacheDir=cacheDir)
+
+    arrays = cache.read()
+
+    if arrays is None:
+        mshFile = openMSHFile(arg,
+                              dimensions=dimensions,
+                              coordDimensions=coordDimensions,
+                              communicator=communicator,
+                              order=order,
+                              mode='r',
+                              background=background)
+
+        arrays = dict(zip(["vertexCoords",
+                           "faceVertexIDs",
+                           "cellFaceIDs",
+                           "cellGlobalIDs",
+                           "gCellGlobalIDs",
+                           "orderedCellVertexIDs"], mshFile.read()))
+        arrays.update(mshFile._entities)
+
+        mshFile.close()
+
+        derivedState = None
+    else:
+        derivedState = dict((name, arrays.pop(name))
+                            for name in Mesh._geometryAttributes + ("faceCellIDs",))
 
-        E.g., would return [0, 1, 2, 3, 4, 5] for mesh A
+    return cache, arrays, derivedState
+
+class _ElementData(object):
+    """
+    Bookkeeping for cells. Declared as own class for generality.
 
-            A        B
-        ------------------
-        | 3 | 4 || 5 |   |
-        ------------------
-        | 0 | 1 || 2 |   |
-        ------------------
+    "blocks": A Python list of the element type and the array of the nodes
+              of each block of elements, with one row per element
+    "shapes": An array of the element type of each element
+    "idmap": An array which maps vertexCoords idx -> global ID
+    "physicalEntities": An array of the Gmsh physical entities each element is in
+    "geometricalEntities": An array of the Gmsh geometrical entities each element is in
+
+        >>> data = _ElementData()
+        >>> data.extend(nx.array([[2, 1, 2, 0, 1, 1, 2], [3, 1, 2, 0, 2, 2, 3]]))
+        >>> data.extend(nx.array([[4, 2, 0, 1, 2, 3]]))
+        >>> print data.numberOfElements, data.shapes.tolist(), data.idmap.tolist()
+        3 [1, 1, 2] [2, 3, 4]
+        >>> print data.geometricalEntities.tolist()
+        [1, 2, -1]
+        >>> print [nodes.tolist() for shape, nodes in data.blocks]
+        [[[1, 2], [2, 3]], [[1, 2, 3]]]
+    """
+    def __init__(self):
+        self.blocks = []
+        self._shapes = []
+        self._idmap = [] # vertexCoords idx -> gmsh ID (global ID)
+        self._physicalEntities = []
+        self._geometricalEntities = []
 
-        .. note:: Trivial except for parallel meshes
+    def extend(self, elements):
+        """
+        Add a block of elements that share a type and a number of tags,
+        given as rows of `[id, type, numTags, tags..., nodes...]`.
         """
-        return nx.arange(len(self.mesh.cellGlobalIDs)
-                         + len(self.mesh.gCellGlobalIDs))
+        if len(elements) == 0:
+            return
+
+        numTags = elements[0, 2]
+        self.blocks.append((elements[0, 1], elements[..., (numTags+3):]))
+        self._shapes.append(elements[..., 1])
+        self._idmap.append(elements[..., 0])
+
+        # the partition tags for don't seem to always be present
+        # and don't always make much sense when they are
+        if numTags >= 2:
+            self._physicalEntities.append(elements[..., 3])
+            self._geometricalEntities.append(elements[..., 4])
+        else:
+            self._physicalEntities.append(-nx.ones((len(elements),), dtype=nx.INT_DTYPE))
+            self._geometricalEntities.append(-nx.ones((len(elements),), dtype=nx.INT_DTYPE))
+
+    def _concatenate(self, arrays):
+        if len(arrays) == 0:
+            return nx.zeros((0,), dtype=nx.INT_DTYPE)
+        return nx.concatenate(arrays)
 
+    @property
+    def numberOfElements(self):
+        return sum([len(nodes) for shape, nodes in self.blocks])
 
+    @property
+    def shapes(self):
+        return self._concatenate(self._shapes)
 
+    @property
+    def idmap(self):
+        return self._concatenate(self._idmap)
+
+    @property
+    def physicalEntities(self):
+        return self._concatenate(self._physicalEntities)
+
+    @property
+    def geometricalEntities(self):
+        return self._concatenate(self._geometricalEntities)
 
 class Gmsh2D(Mesh2D):
     """Construct a 2D Mesh using Gmsh
@@ -1554,6 +1726,8 @@ class Gmsh2D(Mesh2D):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to cache the mesh, overriding the
+        :envvar:`FIPY_GMSH_CACHE` environment variable
     """
 
     def __init__(self,
@@ -1561,44 +1735,49 @@ class Gmsh2D(Mesh2D):
                  coordDimensions=2,
                  communicator=parallelComm,
                  order=1,
-                 background=None):
-
-        self.mshFile = openMSHFile(arg,
-                                   dimensions=2,
-                                   coordDimensions=coordDimensions,
-                                   communicator=communicator,
-                                   order=order,
-                                   mode='r',
-                                   background=background)
-
-        (verts,
-         faces,
-         cells,
-         self.cellGlobalIDs,
-         self.gCellGlobalIDs,
-         self._orderedCellVertexIDs_data) = self.mshFile.read()
-
-        self.mshFile.close()
+                 background=None,
+                 cacheDir=None):
+
+        (cache,
+         arrays,
+         derivedState) = _readGmshMesh(arg,
+                                       dimensions=2,
+                                       coordDimensions=coordDimensions,
+                                       communicator=communicator,
+                                       order=order,
+                                       background=background,
+                                       cacheDir=cacheDir)
+
+        self.cellGlobalIDs = arrays["cellGlobalIDs"]
+        self.gCellGlobalIDs = arrays["gCellGlobalIDs"]
+        self._orderedCellVertexIDs_data = arrays["orderedCellVertexIDs"]
 
         if communicator.Nproc > 1:
             self.globalNumberOfCells = communicator.sum(len(self.cellGlobalIDs))
             parprint("  I'm solving with %d cells total." % self.globalNumberOfCells)
             parprint("  Got global number of cells")
 
-        Mesh2D.__init__(self, vertexCoords=verts,
-                              faceVertexIDs=faces,
-                              cellFaceIDs=cells,
+        Mesh2D.__init__(self, vertexCoords=arrays["vertexCoords"],
+                              faceVertexIDs=arrays["faceVertexIDs"],
+                              cellFaceIDs=arrays["cellFaceIDs"],
                               communicator=communicator,
-                              _TopologyClass=_GmshTopology)
+                              _TopologyClass=_PartitionedMeshTopology,
+                              _derivedState=derivedState)
 
         (self.physicalCellMap,
          self.geometricalCellMap,
          self.physicalCells,
          self.physicalFaceMap,
          self.geometricalFaceMap,
-         self.physicalFaces) = self.mshFile.makeMapVariables(mesh=self)
+         self.physicalFaces) = _makeMapVariables(mesh=self,
+                                                 physicalCellMap=arrays["physicalCellMap"],
+                                                 geometricalCellMap=arrays["geometricalCellMap"],
+                                                 physicalFaceMap=arrays["physicalFaceMap"],
+                                                 geometricalFaceMap=arrays["geometricalFaceMap"],
+                                                 physicalNames=arrays["physicalNames"],
+                                                 dimensions=arrays["dimensions"])
 
-        del self.mshFile
+        cache.write(mesh=self, arrays=arrays)
 
         parprint("Exiting Gmsh2D")
 
@@ -1687,6 +1866,64 @@ class Gmsh2D(Mesh2D):
         ... # doctest: +GMSH, +SERIAL
         True
 
+        A cached mesh is read back without running Gmsh
+
+        >>> cacheDir = tempfile.mkdtemp()
+        >>> geo = "Point(1) = {0, 0, 0, 0.5}; Point(2) = {1, 0, 0, 0.5}; Point(3) = {0, 1, 0, 0.5};"
+        >>> geo += "Line(4) = {1, 2}; Line(5) = {2, 3}; Line(6) = {3, 1};"
+        >>> geo += 'Line Loop(7) = {4, 5, 6}; Plane Surface(8) = {7}; Physical Line("base") = {4};'
+        >>> fresh = Gmsh2D(geo, cacheDir=cacheDir) # doctest: +GMSH
+        >>> print len(os.listdir(cacheDir)) # doctest: +GMSH, +SERIAL
+        1
+        >>> cached = Gmsh2D(geo, cacheDir=cacheDir) # doctest: +GMSH
+        >>> print nx.allclose(cached.cellVolumes, fresh.cellVolumes) # doctest: +GMSH
+        True
+        >>> print nx.allclose(cached._cellToCellDistances, fresh._cellToCellDistances) # doctest: +GMSH
+        True
+        >>> print (cached.physicalFaces["base"] == fresh.physicalFaces["base"]).all() # doctest: +GMSH
+        True
+        >>> import shutil
+        >>> shutil.rmtree(cacheDir)
+
+        Equations can be solved on a cached mesh. Reading an existing MSH
+        file does not need Gmsh.
+
+        >>> cacheDir = tempfile.mkdtemp()
+        >>> (ftmp, mshFile) = tempfile.mkstemp('.msh')
+        >>> os.close(ftmp)
+        >>> f = open(mshFile, 'w')
+        >>> f.write('''$MeshFormat
+        ... 2.2 0 8
+        ... $EndMeshFormat
+        ... $Nodes
+        ... 4
+        ... 1 0 0 0
+        ... 2 1 0 0
+        ... 3 1 1 0
+        ... 4 0 1 0
+        ... $EndNodes
+        ... $Elements
+        ... 2
+        ... 1 2 2 1 1 1 2 3
+        ... 2 2 2 1 1 1 3 4
+        ... $EndElements
+        ... ''')
+        >>> f.close()
+        >>> fresh = Gmsh2D(mshFile, communicator=serialComm, cacheDir=cacheDir)
+        >>> cached = Gmsh2D(mshFile, communicator=serialComm, cacheDir=cacheDir)
+        >>> print len(os.listdir(cacheDir))
+        1
+        >>> print nx.allclose(cached.cellVolumes, fresh.cellVolumes)
+        True
+        >>> from fipy import CellVariable, DiffusionTerm
+        >>> var = CellVariable(mesh=cached)
+        >>> var.constrain(1., cached.exteriorFaces)
+        >>> DiffusionTerm().solve(var)
+        >>> print nx.allclose(var, 1.)
+        True
+        >>> shutil.rmtree(cacheDir)
+        >>> os.remove(mshFile)
+
         >>> (ftmp, mshFile) = tempfile.mkstemp('.msh')
         >>> os.close(ftmp)
         >>> f = openMSHFile(name=mshFile, mode='w') # doctest: +GMSH
@@ -1846,14 +2083,17 @@ class Gmsh2DIn3DSpace(Gmsh2D):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to cache the mesh, overriding the
+        :envvar:`FIPY_GMSH_CACHE` environment variable
     """
-    def __init__(self, arg, communicator=parallelComm, order=1, background=None):
+    def __init__(self, arg, communicator=parallelComm, order=1, background=None, cacheDir=None):
         Gmsh2D.__init__(self,
                         arg,
                         coordDimensions=3,
                         communicator=communicator,
                         order=order,
-                        background=background)
+                        background=background,
+                        cacheDir=cacheDir)
 
     def _test(self):
         """
@@ -1921,29 +2161,30 @@ class Gmsh3D(Mesh):
       - `order`: ???
       - `background`: a `CellVariable` that specifies the desired characteristic
         lengths of the mesh cells
+      - `cacheDir`: a directory in which to cache the mesh, overriding the
+        :envvar:`FIPY_GMSH_CACHE` environment variable
     """
-    def __init__(self, arg, communicator=parallelComm, order=1, background=None):
-        self.mshFile  = openMSHFile(arg,
-                                    dimensions=3,
-                                    communicator=communicator,
-                                    order=order,
-                                    mode='r',
-                                    background=background)
-
-        (verts,
-         faces,
-         cells,
-         self.cellGlobalIDs,
-         self.gCellGlobalIDs,
-         self._orderedCellVertexIDs_data) = self.mshFile.read()
-
-        self.mshFile.close()
-
-        Mesh.__init__(self, vertexCoords=verts,
-                            faceVertexIDs=faces,
-                            cellFaceIDs=cells,
+    def __init__(self, arg, communicator=parallelComm, order=1, background=None, cacheDir=None):
+        (cache,
+         arrays,
+         derivedState) = _readGmshMesh(arg,
+                                       dimensions=3,
+                                       coordDimensions=None,
+                                       communicator=communicator,
+                                       order=order,
+                                       background=background,
+                                       cacheDir=cacheDir)
+
+        self.cellGlobalIDs = arrays["cellGlobalIDs"]
+        self.gCellGlobalIDs = arrays["gCellGlobalIDs"]
+        self._orderedCellVertexIDs_data = arrays["orderedCellVertexIDs"]
+
+        Mesh.__init__(self, vertexCoords=arrays["vertexCoords"],
+                            faceVertexIDs=arrays["faceVertexIDs"],
+                            cellFaceIDs=arrays["cellFaceIDs"],
                             communicator=communicator,
-                            _TopologyClass=_GmshTopology)
+                            _TopologyClass=_PartitionedMeshTopology,
+                            _derivedState=derivedState)
 
         if self.communicator.Nproc > 1:
             self.globalNumberOfCells = self.communicator.sum(len(self.cellGlobalIDs))
@@ -1953,9 +2194,15 @@ class Gmsh3D(Mesh):
          self.physicalCells,
          self.physicalFaceMap,
          self.geometricalFaceMap,
-         self.physicalFaces) = self.mshFile.makeMapVariables(mesh=self)
-
-        del self.mshFile
+         self.physicalFaces) = _makeMapVariables(mesh=self,
+                                                 physicalCellMap=arrays["physicalCellMap"],
+                                                 geometricalCellMap=arrays["geometricalCellMap"],
+                                                 physicalFaceMap=arrays["physicalFaceMap"],
+                                                 geometricalFaceMap=arrays["geometricalFaceMap"],
+                                                 physicalNames=arrays["physicalNames"],
+                                                 dimensions=arrays["dimensions"])
+
+        cache.write(mesh=self, arrays=arrays)
 
     def __setstate__(self, state):
         super(Gmsh3D, self).__setstate__(state)
@@ -53,6 +53,119 @@ __all__ = ["MeshAdditionError", "Mesh"]
 class MeshAdditionError(Exception):
     pass
 
+def _faceKeys(faceVertexIDs, numVertices):
+    """Sorted vertex IDs of each face, padded with -1 to `numVertices`
+    """
+    faceVertexIDs = numerix.asarray(faceVertexIDs)
+    keys = -numerix.ones((numVertices, faceVertexIDs.shape[-1]), dtype=numerix.INT_DTYPE)
+    keys[:len(faceVertexIDs)] = faceVertexIDs
+    return numerix.sort(keys.swapaxes(0, 1), axis=1)
+
+def _groupRows(keys):
+    """Lexically sort the rows of `keys`
+
+    Returns the sort order and a mask of the sorted rows that differ from
+    their predecessor.
+    """
+    order = numerix.lexsort(keys.swapaxes(0, 1)[::-1])
+    keys = keys[order]
+    newGroup = numerix.ones((len(keys),), dtype=bool)
+    newGroup[1:] = (keys[1:] != keys[:-1]).any(axis=1)
+    return order, newGroup
+
+def _uniqueFaces(cellFaceVertexIDs):
+    """Find the distinct faces of a collection of cells
+
+    :Parameters:
+      - `cellFaceVertexIDs`: an integer array of shape
+        `(numCells, maxFacesPerCell, maxVerticesPerFace)` holding the
+        vertex IDs of every face of every cell. Faces with fewer vertices
+        are padded with -1, as are cells with fewer faces.
+
+    :Returns:
+      - `faceVertexIDs`: the `(maxVerticesPerFace, numFaces)` vertex IDs of
+        each distinct face, in the order given by the first cell to
+        reference it
+      - `cellFaceIDs`: the `(maxFacesPerCell, numCells)` face IDs of each
+        cell, padded with -1
+
+    Faces are numbered in the order they are first encountered. Two
+    triangles sharing an edge
+
+        >>> faceVertexIDs, cellFaceIDs = _uniqueFaces([[[0, 1], [1, 2], [2, 0]],
+        ...                                            [[2, 1], [1, 3], [3, 2]]])
+        >>> print faceVertexIDs.tolist()
+        [[0, 1, 2, 1, 3], [1, 2, 0, 3, 2]]
+        >>> print cellFaceIDs.tolist()
+        [[0, 1], [1, 3], [2, 4]]
+
+    and a triangle next to a square
+
+        >>> faceVertexIDs, cellFaceIDs = _uniqueFaces([[[0, 1], [1, 2], [2, 0], [-1, -1]],
+        ...                                            [[1, 3], [3, 4], [4, 2], [2, 1]]])
+        >>> print cellFaceIDs.tolist()
+        [[0, 3], [1, 4], [2, 5], [-1, 1]]
+    """
+    cellFaceVertexIDs = numerix.asarray(cellFaceVertexIDs)
+    numCells, maxFaces, maxVertices = cellFaceVertexIDs.shape
+
+    faces = cellFaceVertexIDs.reshape((numCells * maxFaces, maxVertices))
+    present = (faces != -1).any(axis=1)
+    faces = faces[present]
+
+    order, newFace = _groupRows(numerix.sort(faces, axis=1))
+
+    # lexsort is stable, so the first of each group of identical faces
+    # is the one that appears first in `cellFaceVertexIDs`
+    first = order[newFace]
+    group = numerix.cumsum(newFace) - 1
+    rank = numerix.empty((len(first),), dtype=numerix.INT_DTYPE)
+    rank[numerix.argsort(first)] = numerix.arange(len(first))
+
+    faceIDs = numerix.empty((len(faces),), dtype=numerix.INT_DTYPE)
+    faceIDs[order] = rank[group]
+
+    cellFaceIDs = -numerix.ones((numCells * maxFaces,), dtype=numerix.INT_DTYPE)
+    cellFaceIDs[present] = faceIDs
+    cellFaceIDs = cellFaceIDs.reshape((numCells, maxFaces)).swapaxes(0, 1).copy('C')
+
+    faceVertexIDs = faces[numerix.sort(first)].swapaxes(0, 1).copy('C')
+
+    return faceVertexIDs, cellFaceIDs
+
+def _findFaces(faceVertexIDs, vertexIDs):
+    """Find the faces made of the given vertices
+
+    :Parameters:
+      - `faceVertexIDs`: the `(maxVerticesPerFace, numFaces)` vertex IDs
+        of the faces to search, padded with -1
+      - `vertexIDs`: the `(numVertices, N)` vertex IDs, in any order and
+        padded with -1, of the faces to look for
+
+    :Returns:
+      - the IDs of the matching faces, or -1 where there is no match
+
+        >>> print _findFaces([[0, 1, 2, 1, 3], [1, 2, 0, 3, 2]],
+        ...                  [[2, 3, 0], [1, 1, 3]]).tolist()
+        [1, 3, -1]
+    """
+    faceVertexIDs = numerix.asarray(faceVertexIDs)
+    vertexIDs = numerix.asarray(vertexIDs)
+    numVertices = max(len(faceVertexIDs), len(vertexIDs))
+    numFaces = faceVertexIDs.shape[-1]
+
+    keys = numerix.concatenate((_faceKeys(faceVertexIDs, numVertices),
+                                _faceKeys(vertexIDs, numVertices)))
+    order, newGroup = _groupRows(keys)
+
+    # lexsort is stable, so if a group of identical keys contains one
+    # of the faces, that face leads the group
+    first = order[newGroup][numerix.cumsum(newGroup) - 1]
+    matches = numerix.empty((len(keys),), dtype=numerix.INT_DTYPE)
+    matches[order] = numerix.where(first < numFaces, first, -1)
+
+    return matches[numFaces:]
+
 class Mesh(AbstractMesh):
     """Generic mesh class using numerix to do the calculations
 
@@ -61,7 +174,7 @@ class Mesh(AbstractMesh):
         This is built for a non-mixed element mesh.
     """
 
-    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_MeshTopology):
+    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_MeshTopology, _derivedState=None):
         super(Mesh, self).__init__(communicator=communicator,
                                    _RepresentationClass=_RepresentationClass,
                                    _TopologyClass=_TopologyClass)
@@ -83,10 +196,37 @@ class Mesh(AbstractMesh):
         if not hasattr(self, "globalNumberOfFaces"):
             self.globalNumberOfFaces = self.numberOfFaces
 
-        self.faceCellIDs = self._calcFaceCellIDs()
+        if _derivedState is None:
+            self.faceCellIDs = self._calcFaceCellIDs()
 
-        self._setTopology()
-        self._setGeometry(scaleLength = 1.)
+            self._setTopology()
+            self._setGeometry(scaleLength = 1.)
+        else:
+            # as returned by `_cacheableState` for a mesh
+            # with the same vertices, faces and cells
+            self.faceCellIDs = _derivedState["faceCellIDs"]
+
+            self._setTopology()
+            for name in self._geometryAttributes:
+                setattr(self, name, _derivedState[name])
+            self._setScaledGeometry(self.scale['length'])
+
+    _geometryAttributes = ("_faceCenters", "_faceAreas", "_cellCenters",
+                           "_internalFaceToCellDistances", "_cellToFaceDistanceVectors",
+                           "_internalCellDistances", "_cellDistanceVectors",
+                           "faceNormals", "_orientedFaceNormals", "_cellVolumes",
+                           "_faceCellToCellNormals", "_faceTangents1", "_faceTangents2",
+                           "_cellToCellDistances", "_cellAreas", "_cellNormals")
+
+    @property
+    def _cacheableState(self):
+        """The arrays calculated by `_setGeometry()`, and `faceCellIDs`,
+        which can be passed back to `__init__()` as `_derivedState` to skip
+        calculating them.
+        """
+        state = dict((name, getattr(self, name)) for name in self._geometryAttributes)
+        state["faceCellIDs"] = self.faceCellIDs
+        return state
 
     """
     Topology set and calc
@@ -568,7 +708,21 @@ class Mesh(AbstractMesh):
 
     """scaling"""
 
-    def _getNearestCellID(self, points):
+    @property
+    def _cellCenterIndex(self):
+        """Spatial index of the global cell centers
+
+        The index is rebuilt only when the scaled cell centers are
+        recalculated, e.g., when the mesh scale changes.
+        """
+        if (not hasattr(self, "_cellCenterIndexData")
+            or self._cellCenterIndexData[0] is not self._scaledCellCenters):
+            from fipy.tools.spatialIndex import _SpatialIndex
+            self._cellCenterIndexData = (self._scaledCellCenters,
+                                         _SpatialIndex(self.cellCenters.globalValue))
+        return self._cellCenterIndexData[1]
+
+    def _getNearestCellID(self, points, exact=False):
         """
         Test cases
 
@@ -578,8 +732,72 @@ class Mesh(AbstractMesh):
            >>> print m0._getNearestCellID(m1.cellCenters.globalValue)
            [4 5 7 8]
 
+        The index of cell centers is only built once
+
+           >>> m0._cellCenterIndex is m0._cellCenterIndex
+           True
+
+        On a strongly skewed mesh, the cell with the nearest center need not
+        contain the point. The `exact` option searches the neighborhood of
+        the nearest center for the cell that does
+
+           >>> from fipy.meshes.skewedGrid2D import SkewedGrid2D
+           >>> m = SkewedGrid2D(nx=3, ny=3, rand=0.1)
+           >>> points = m.faceCenters.value[..., m.interiorFaceIDs]
+           >>> points = points + 1e-3 * numerix.array(m.faceNormals)[..., m.interiorFaceIDs]
+           >>> up = m.faceCellIDs[1, m.interiorFaceIDs].filled()
+           >>> print (m._getNearestCellID(points, exact=True) == up).all() # doctest: +SERIAL
+           True
+
+        """
+        cellIDs = self._cellCenterIndex.nearest(points)
+
+        if exact and self.communicator.Nproc == 1:
+            cellIDs = self._getContainingCellID(points, cellIDs)
+
+        return cellIDs
+
+    def _getContainingCellID(self, points, cellIDs):
+        """Replace each of `cellIDs` with the neighboring cell that contains
+        the corresponding point of `points`
+
+        A point that does not lie in `cellIDs` or any of its neighbors, e.g.,
+        one outside the mesh, keeps its nearest cell. Only meaningful on a
+        single processor, where local and global cell IDs coincide.
+        """
+        points = numerix.asanyarray(points)
+        shape = points.shape[1:]
+        points = points.reshape((self.dim, -1))
+        cellIDs = numerix.array(cellIDs, dtype=numerix.INT_DTYPE).reshape((-1,))
+
+        if cellIDs.shape[0] == 0:
+            return cellIDs.reshape(shape)
+
+        found = self._cellsContainPoints(cellIDs, points)
+        neighbors = MA.filled(numerix.take(self._cellToCellIDs, cellIDs, axis=1), -1)
+        for candidates in neighbors:
+            check = ~found & (candidates >= 0)
+            inside = numerix.zeros(found.shape, dtype=bool)
+            inside[check] = self._cellsContainPoints(candidates[check],
+                                                     points[..., check])
+            cellIDs[inside] = candidates[inside]
+            found |= inside
+
+        return cellIDs.reshape(shape)
+
+    def _cellsContainPoints(self, cellIDs, points):
+        """Whether each point of the `(D, M)` `points` lies inside the
+        corresponding convex cell of `cellIDs`
         """
-        return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+        faceIDs = numerix.take(self.cellFaceIDs, cellIDs, axis=1)
+        faceMask = MA.getmaskarray(faceIDs)
+        faceCenters = numerix.take(self._faceCenters, MA.filled(faceIDs, 0), axis=1)
+        normals = MA.filled(numerix.take(self._cellNormals, cellIDs, axis=-1), 0)
+        # signed distance of each point from each of its cell's faces,
+        # positive outside the cell
+        distances = numerix.sum((points[:, numerix.newaxis, :] - faceCenters) * normals, axis=0)
+        tolerance = 1e-10 * MA.filled(numerix.take(self._cellToCellDistances, cellIDs, axis=-1), 0).max(axis=0)
+        return ((distances <= tolerance) | faceMask).all(axis=0)
 
     def _test(self):
         """
@@ -68,9 +68,9 @@ def _orderVertices(vertexCoords, vertices):
 __all__ = ["Mesh2D"]
 
 class Mesh2D(Mesh):
-    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_Mesh2DTopology):
+    def __init__(self, vertexCoords, faceVertexIDs, cellFaceIDs, communicator=serialComm, _RepresentationClass=_MeshRepresentation, _TopologyClass=_Mesh2DTopology, _derivedState=None):
         super(Mesh2D, self).__init__(vertexCoords=vertexCoords, faceVertexIDs=faceVertexIDs, cellFaceIDs=cellFaceIDs, communicator=communicator,
-                                     _RepresentationClass=_RepresentationClass, _TopologyClass=_TopologyClass)
+                                     _RepresentationClass=_RepresentationClass, _TopologyClass=_TopologyClass, _derivedState=_derivedState)
 
     def _calcScaleArea(self):
         return self.scale['length']
@@ -87,6 +87,7 @@ class NonUniformGrid1D(Mesh1D):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
@@ -53,9 +53,10 @@ class NonUniformGrid2D(Mesh2D):
     first and then vertical faces.
     """
     def __init__(self, dx=1., dy=1., nx=None, ny=None, overlap=2, communicator=parallelComm,
+                 _BuilderClass=_NonuniformGrid2DBuilder,
                  _RepresentationClass=_Grid2DRepresentation, _TopologyClass=_Grid2DTopology):
 
-        builder = _NonuniformGrid2DBuilder()
+        builder = _BuilderClass()
 
         self.args = {
             'dx': dx,
@@ -74,6 +75,7 @@ class NonUniformGrid2D(Mesh2D):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
@@ -62,9 +62,10 @@ class NonUniformGrid3D(Mesh):
     Faces: XY faces numbered first, then XZ faces, then YZ faces. Within each subcategory, it is numbered in the usual way.
     """
     def __init__(self, dx = 1., dy = 1., dz = 1., nx = None, ny = None, nz = None, overlap=2, communicator=parallelComm,
+                 _BuilderClass=_NonuniformGrid3DBuilder,
                  _RepresentationClass=_Grid3DRepresentation, _TopologyClass=_Grid3DTopology):
 
-        builder = _NonuniformGrid3DBuilder()
+        builder = _BuilderClass()
 
         self.args = {
             'dx': dx,
@@ -86,6 +87,7 @@ class NonUniformGrid3D(Mesh):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
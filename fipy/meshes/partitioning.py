@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "partitioning.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+
+"""Partitioning of arbitrary meshes among parallel processes.
+
+Grids are split into rectangular blocks and `Gmsh` meshes are split by
+Gmsh itself. :func:`partitionMesh` instead divides the cells of
+any complete mesh using their adjacency graph, with METIS_ (through
+pymetis_) when it is installed and with recursive coordinate bisection
+otherwise.
+
+.. _METIS: http://glaros.dtc.umn.edu/gkhome/metis/metis/overview
+.. _pymetis: https://pypi.python.org/pypi/PyMetis
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+from fipy.tools import parallelComm
+
+from fipy.meshes.topologies.meshTopology import _PartitionedMeshTopology
+
+__all__ = ["partitionMesh"]
+
+def _cellAdjacency(mesh):
+    """Adjacency graph of the cells of `mesh` in compressed sparse row
+    form; the neighbors of cell `i` are `adjncy[xadj[i]:xadj[i + 1]]`.
+
+    >>> from fipy import Grid2D, serialComm
+    >>> xadj, adjncy = _cellAdjacency(Grid2D(nx=3, ny=1, communicator=serialComm))
+    >>> print xadj.tolist(), adjncy.tolist()
+    [0, 1, 3, 4] [1, 2, 0, 1]
+    """
+    faceCellIDs = mesh.faceCellIDs
+    interior = ~MA.getmaskarray(faceCellIDs[1])
+    first = MA.filled(faceCellIDs[0], 0)[interior]
+    second = MA.filled(faceCellIDs[1], 0)[interior]
+    rows = numerix.concatenate((first, second))
+    cols = numerix.concatenate((second, first))
+    adjncy = cols[numerix.argsort(rows, kind='mergesort')]
+    counts = numerix.bincount(rows, minlength=mesh.numberOfCells)
+    xadj = numerix.concatenate(([0], numerix.cumsum(counts))).astype(numerix.INT_DTYPE)
+    return xadj, adjncy.astype(numerix.INT_DTYPE)
+
+def _recursiveCoordinateBisection(coordinates, nparts):
+    """Assign points to `nparts` parts of nearly equal size by repeatedly
+    cutting each part across its longest extent.
+
+    >>> x = numerix.arange(8.)
+    >>> print _recursiveCoordinateBisection(numerix.array([x, 0 * x]), 4).tolist()
+    [0, 0, 1, 1, 2, 2, 3, 3]
+    >>> print _recursiveCoordinateBisection(numerix.array([x[::-1], 0 * x]), 3).tolist()
+    [2, 2, 2, 1, 1, 1, 0, 0]
+    """
+    coordinates = numerix.asarray(coordinates)
+    parts = numerix.zeros((coordinates.shape[-1],), dtype=numerix.INT_DTYPE)
+    stack = [(numerix.arange(coordinates.shape[-1]), 0, nparts)]
+    while stack:
+        ids, first, n = stack.pop()
+        if n == 1 or len(ids) == 0:
+            parts[ids] = first
+            continue
+        local = coordinates[..., ids]
+        axis = numerix.argmax(local.max(axis=1) - local.min(axis=1))
+        nleft = n // 2
+        cut = len(ids) * nleft // n
+        order = numerix.argsort(local[axis], kind='mergesort')
+        stack.append((ids[order[:cut]], first, nleft))
+        stack.append((ids[order[cut:]], first + nleft, n - nleft))
+    return parts
+
+def _metisPartition(mesh, nparts):
+    import pymetis
+    xadj, adjncy = _cellAdjacency(mesh)
+    edgecuts, parts = pymetis.part_graph(nparts, xadj=xadj.tolist(), adjncy=adjncy.tolist())
+    return numerix.array(parts, dtype=numerix.INT_DTYPE)
+
+def _partitionCells(mesh, nparts, method=None):
+    """Assign each cell of `mesh` to one of `nparts` parts.
+
+    `method` is "metis", "rcb" (recursive coordinate bisection) or `None`
+    to use METIS if it is available.
+
+    >>> from fipy import Grid2D, serialComm
+    >>> mesh = Grid2D(nx=4, ny=2, communicator=serialComm)
+    >>> print _partitionCells(mesh, 2, method="rcb").tolist()
+    [0, 0, 1, 1, 0, 0, 1, 1]
+    >>> _partitionCells(mesh, 2, method="chaco")
+    Traceback (most recent call last):
+        ...
+    ValueError: unknown partitioning method: chaco
+    """
+    if nparts == 1:
+        return numerix.zeros((mesh.numberOfCells,), dtype=numerix.INT_DTYPE)
+    if method in (None, "metis"):
+        try:
+            return _metisPartition(mesh, nparts)
+        except ImportError:
+            if method == "metis":
+                raise
+            method = "rcb"
+    if method == "rcb":
+        return _recursiveCoordinateBisection(mesh.cellCenters.value, nparts)
+    raise ValueError("unknown partitioning method: %s" % method)
+
+def _ghostCells(xadj, adjncy, ownedCells, overlap):
+    """Cells within `overlap` layers of neighbors of `ownedCells`, ordered
+    by layer.
+
+    >>> xadj = numerix.array([0, 1, 3, 5, 7, 8])
+    >>> adjncy = numerix.array([1, 0, 2, 1, 3, 2, 4, 3])
+    >>> print _ghostCells(xadj, adjncy, numerix.array([0, 1]), 2).tolist()
+    [2, 3]
+    >>> print _ghostCells(xadj, adjncy, numerix.array([2]), 1).tolist()
+    [1, 3]
+    """
+    reached = numerix.zeros((len(xadj) - 1,), dtype=bool)
+    reached[ownedCells] = True
+    frontier = ownedCells
+    layers = [numerix.zeros((0,), dtype=numerix.INT_DTYPE)]
+    for layer in range(overlap):
+        starts = xadj[frontier]
+        counts = xadj[frontier + 1] - starts
+        offsets = numerix.cumsum(counts) - counts
+        index = (numerix.repeat(starts - offsets, counts)
+                 + numerix.arange(counts.sum()))
+        neighbors = numerix.unique(adjncy[index])
+        frontier = neighbors[~reached[neighbors]]
+        reached[frontier] = True
+        layers.append(frontier)
+    return numerix.concatenate(layers).astype(numerix.INT_DTYPE)
+
+def _localMesh(mesh, ownedCells, ghostCells, communicator):
+    """Sub-mesh of `mesh` holding `ownedCells` followed by `ghostCells`.
+
+    >>> from fipy import Grid2D, serialComm
+    >>> mesh = Grid2D(nx=4, ny=2, communicator=serialComm)
+    >>> parts = _partitionCells(mesh, 2, method="rcb")
+    >>> xadj, adjncy = _cellAdjacency(mesh)
+    >>> owned = numerix.nonzero(parts == 0)[0]
+    >>> local = _localMesh(mesh, owned, _ghostCells(xadj, adjncy, owned, 1), serialComm)
+    >>> print local.numberOfCells, local.numberOfFaces, local.globalNumberOfCells
+    6 17 8
+    >>> print local.cellCenters.value[0].tolist()
+    [0.5, 1.5, 0.5, 1.5, 2.5, 2.5]
+    >>> print local._globalNonOverlappingCellIDs.tolist()
+    [0, 1, 4, 5]
+    >>> print local._globalOverlappingCellIDs.tolist()
+    [0, 1, 4, 5, 2, 6]
+    >>> print numerix.allclose(local.cellVolumes, 1.)
+    True
+
+    Structured 3D grids, whose IDs are not masked, are split the same way
+
+    >>> from fipy import Grid3D
+    >>> mesh = Grid3D(nx=2, ny=2, nz=2, communicator=serialComm)
+    >>> parts = _partitionCells(mesh, 2, method="rcb")
+    >>> xadj, adjncy = _cellAdjacency(mesh)
+    >>> owned = numerix.nonzero(parts == 0)[0]
+    >>> local = _localMesh(mesh, owned, _ghostCells(xadj, adjncy, owned, 1), serialComm)
+    >>> print local.numberOfCells, local.globalNumberOfCells
+    8 8
+    >>> print len(local._globalNonOverlappingCellIDs)
+    4
+    >>> print numerix.allclose(local.cellVolumes, 1.)
+    True
+    """
+    cells = numerix.concatenate((ownedCells, ghostCells))
+
+    def renumber(IDs, numberOfIDs):
+        used = numerix.unique(MA.compressed(IDs))
+        newIDs = -numerix.ones((numberOfIDs,), dtype=numerix.INT_DTYPE)
+        newIDs[used] = numerix.arange(len(used))
+        return used, numerix.where(MA.getmaskarray(IDs), -1, newIDs[MA.filled(IDs, 0)])
+
+    cellFaceIDs = mesh.cellFaceIDs[..., cells]
+    faces, cellFaceIDs = renumber(cellFaceIDs, mesh.numberOfFaces)
+    faceVertexIDs = mesh.faceVertexIDs[..., faces]
+    vertices, faceVertexIDs = renumber(faceVertexIDs, mesh.vertexCoords.shape[-1])
+
+    if mesh.dim == 1:
+        from fipy.meshes.mesh1D import Mesh1D as MeshClass
+    elif mesh.dim == 2:
+        from fipy.meshes.mesh2D import Mesh2D as MeshClass
+    else:
+        from fipy.meshes.mesh import Mesh as MeshClass
+
+    local = MeshClass(vertexCoords=mesh.vertexCoords[..., vertices],
+                      faceVertexIDs=faceVertexIDs,
+                      cellFaceIDs=cellFaceIDs,
+                      communicator=communicator,
+                      _TopologyClass=_PartitionedMeshTopology)
+    local.cellGlobalIDs = list(ownedCells)
+    local.gCellGlobalIDs = list(ghostCells)
+    local.globalNumberOfCells = mesh.numberOfCells
+    local.globalNumberOfFaces = mesh.numberOfFaces
+    return local
+
+def partitionMesh(mesh, communicator=parallelComm, overlap=2, method=None):
+    """Return this process's part of `mesh`.
+
+    The cells of `mesh` are divided into `communicator.Nproc` parts of
+    nearly equal size with few shared faces. The returned mesh holds the
+    cells of part `communicator.procID`, followed by `overlap` layers of
+    neighboring ghost cells.
+
+    >>> from fipy import Grid2D, serialComm
+    >>> mesh = partitionMesh(Grid2D(nx=3, ny=3, communicator=serialComm),
+    ...                      communicator=serialComm)
+    >>> print mesh.numberOfCells, mesh.globalNumberOfCells
+    9 9
+
+    :Parameters:
+      - `mesh`: the complete mesh, constructed with `communicator=serialComm`
+      - `communicator`: the parallel communicator to partition across
+      - `overlap`: the number of layers of ghost cells
+      - `method`: "metis" to require METIS, "rcb" for recursive coordinate
+        bisection, or `None` to use METIS if it is available
+    """
+    if communicator.procID == 0:
+        parts = _partitionCells(mesh, communicator.Nproc, method=method)
+    else:
+        parts = None
+    if communicator.Nproc > 1:
+        parts = communicator.bcast(parts)
+
+    xadj, adjncy = _cellAdjacency(mesh)
+    ownedCells = numerix.nonzero(parts == communicator.procID)[0].astype(numerix.INT_DTYPE)
+    ghostCells = _ghostCells(xadj, adjncy, ownedCells, overlap)
+
+    return _localMesh(mesh, ownedCells, ghostCells, communicator)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -51,6 +51,43 @@ class _GridTopology(_AbstractTopology):
     def _isOrthogonal(self):
         return True
 
+    @staticmethod
+    def _blockCellIDs(shape, start, stop):
+        """Return the IDs of the cells from `start` up to `stop` along each
+        axis of a grid of `shape`, numbered with the first axis varying
+        fastest.
+
+        >>> print _GridTopology._blockCellIDs((4, 3), (1, 1), (3, 3)).tolist()
+        [5, 6, 9, 10]
+        """
+        IDs = numerix.array(0)
+        stride = 1
+        for n, begin, end in zip(shape, start, stop):
+            IDs = numerix.add.outer(numerix.arange(begin, end) * stride, IDs)
+            stride *= n
+        return numerix.ravel(IDs)
+
+    def _cellBounds(self, overlapping):
+        """Return the first and last-plus-one local cell indices along each
+        axis, with or without the ghost cells."""
+        start = [0] * len(self.mesh.shape)
+        stop = list(self.mesh.shape)
+        if not overlapping:
+            for axis, (first, second) in enumerate(self._overlapNames):
+                start[axis] += self.mesh.overlap[first]
+                stop[axis] -= self.mesh.overlap[second]
+        return start, stop
+
+    def _globalCellIDs(self, overlapping):
+        start, stop = self._cellBounds(overlapping)
+        return self._blockCellIDs(self.mesh.globalShape,
+                                  [b + o for b, o in zip(start, self.mesh.offset)],
+                                  [e + o for e, o in zip(stop, self.mesh.offset)])
+
+    def _localCellIDs(self, overlapping):
+        start, stop = self._cellBounds(overlapping)
+        return self._blockCellIDs(self.mesh.shape, start, stop)
+
 class _Grid1DTopology(_GridTopology):
 
     _concatenatedClass = Mesh1D
@@ -208,6 +245,8 @@ class _Grid2DTopology(_GridTopology):
 
     _concatenatedClass = Mesh2D
 
+    _overlapNames = (('left', 'right'), ('bottom', 'top'))
+
     @property
     def _globalNonOverlappingCellIDs(self):
         """Return the IDs of the local mesh in the context of the global parallel mesh.
@@ -226,8 +265,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[1] + self.mesh.overlap['bottom']) * self.mesh.nx,
-                              (self.mesh.offset[1] + self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._globalCellIDs(overlapping=False)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -247,7 +285,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.offset[1] * self.mesh.nx, (self.mesh.offset[1] + self.mesh.ny) * self.mesh.nx)
+        return self._globalCellIDs(overlapping=True)
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -267,8 +305,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['bottom'] * self.mesh.nx,
-                              (self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._localCellIDs(overlapping=False)
 
     @property
     def _localOverlappingCellIDs(self):
@@ -288,7 +325,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(0, self.mesh.ny * self.mesh.nx)
+        return self._localCellIDs(overlapping=True)
 
     @property
     def _cellTopology(self):
@@ -303,6 +340,8 @@ class _Grid3DTopology(_GridTopology):
 
     _concatenatedClass = Mesh
 
+    _overlapNames = (('left', 'right'), ('bottom', 'top'), ('front', 'back'))
+
     @property
     def _globalNonOverlappingCellIDs(self):
         """
@@ -311,8 +350,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[2] + self.mesh.overlap['front']) * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._globalCellIDs(overlapping=False)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -322,9 +360,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-
-        return numerix.arange(self.mesh.offset[2] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz) * self.mesh.nx * self.mesh.ny)
+        return self._globalCellIDs(overlapping=True)
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -334,8 +370,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['front'] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._localCellIDs(overlapping=False)
 
     @property
     def _localOverlappingCellIDs(self):
@@ -345,7 +380,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(0, self.mesh.ny * self.mesh.nx * self.mesh.nz)
+        return self._localCellIDs(overlapping=True)
 
     @property
     def _cellTopology(self):
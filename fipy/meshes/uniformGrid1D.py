@@ -93,6 +93,7 @@ class UniformGrid1D(UniformGrid):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
@@ -319,7 +320,7 @@ class UniformGrid1D(UniformGrid):
         c1 = numerix.arange(self.numberOfCells)
         return numerix.array((c1 + 1, c1))
 
-    def _getNearestCellID(self, points):
+    def _getNearestCellID(self, points, exact=False):
         """
         Test cases
 
@@ -87,6 +87,7 @@ class UniformGrid2D(UniformGrid):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
@@ -592,7 +593,7 @@ class UniformGrid2D(UniformGrid):
 
         return ids.reshape((4, self.numberOfCells), order="FORTRAN")
 
-    def _getNearestCellID(self, points):
+    def _getNearestCellID(self, points, exact=False):
         """
         Test cases
 
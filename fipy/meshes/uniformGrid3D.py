@@ -95,6 +95,7 @@ class UniformGrid3D(UniformGrid):
          scale,
          self.globalNumberOfCells,
          self.globalNumberOfFaces,
+         self.globalShape,
          self.overlap,
          self.offset,
          self.numberOfVertices,
@@ -525,7 +526,7 @@ class UniformGrid3D(UniformGrid):
 
 ##     scaling
 
-    def _getNearestCellID(self, points):
+    def _getNearestCellID(self, points, exact=False):
         nx = self.args['nx']
         ny = self.args['ny']
         nz = self.args['nz']
@@ -35,11 +35,21 @@
 
 from pyamg import smoothed_aggregation_solver
 
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+
 __all__ = ["SmoothedAggregationPreconditioner"]
 
-class SmoothedAggregationPreconditioner():
-    def __init__(self):
-        pass
+class SmoothedAggregationPreconditioner(Preconditioner):
+    """
+    Smoothed aggregation algebraic multigrid preconditioner from pyAMG.
+
+    Setting up the multigrid hierarchy is expensive; pass `rebuildEvery`
+    and/or `iterationGrowth` to reuse it across solves (see
+    :class:`~fipy.solvers.scipy.preconditioners.preconditioner.Preconditioner`).
+    """
+    def __init__(self, rebuildEvery=1, iterationGrowth=None):
+        super(SmoothedAggregationPreconditioner, self).__init__(rebuildEvery=rebuildEvery,
+                                                                iterationGrowth=iterationGrowth)
 
     def _applyToMatrix(self, A):
         return smoothed_aggregation_solver(A).aspreconditioner(cycle='V')
@@ -57,6 +57,26 @@ class LinearLUSolver(PysparseSolver):
 
     .. _PySparse: http://pysparse.sourceforge.net
 
+    The factorization is kept and reused for as long as the matrix passed
+    to the solver is unchanged, e.g., for a linear problem with constant
+    coefficients and a fixed time step, so that only the triangular solves
+    are repeated. To take advantage of this, pass the same
+    `LinearLUSolver` to each call of `solve()` or `sweep()`.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=10)
+        >>> v = CellVariable(mesh=m)
+        >>> v.constrain(1., m.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm()
+        >>> solver = LinearLUSolver()
+        >>> eq.solve(var=v, dt=1., solver=solver)
+        >>> LU = solver._LU
+        >>> eq.solve(var=v, dt=1., solver=solver)
+        >>> solver._LU is LU
+        True
+        >>> eq.solve(var=v, dt=2., solver=solver)
+        >>> solver._LU is LU
+        False
     """
 
     def __init__(self, tolerance=1e-10, iterations=10,
@@ -77,6 +97,34 @@ class LinearLUSolver(PysparseSolver):
         super(LinearLUSolver, self).__init__(tolerance = tolerance,
                                              iterations = iterations)
 
+    def _factorize(self, matrix):
+        """LU factorization of the `ll_mat` `matrix`, reused if `matrix` is
+        identical to the matrix factorized by the previous solve
+        """
+        entries = matrix.find()
+        if (getattr(self, "_LU", None) is None
+            or not self._matchesFactorized(matrix.shape, entries)):
+            self._factorizedEntries = (matrix.shape, entries)
+            self._LU = superlu.factorize(matrix.to_csr())
+        return self._LU
+
+    def _matchesFactorized(self, shape, entries):
+        # comparing the nonzeros is O(nnz); factorizing is not
+        oldShape, oldEntries = self._factorizedEntries
+        return (oldShape == shape
+                and len(oldEntries[0]) == len(entries[0])
+                and numerix.array_equal(oldEntries[1], entries[1])
+                and numerix.array_equal(oldEntries[2], entries[2])
+                and numerix.array_equal(oldEntries[0], entries[0]))
+
+    def _workArrays(self, N):
+        """Residual and correction arrays for the refinement loop, kept
+        between solves of the same size
+        """
+        if getattr(self, "_work", None) is None or len(self._work[0]) != N:
+            self._work = (numerix.empty(N, 'd'), numerix.empty(N, 'd'))
+        return self._work
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
         maxdiag = max(numerix.absolute(diag))
@@ -84,23 +132,27 @@ class LinearLUSolver(PysparseSolver):
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = superlu.factorize(L.matrix.to_csr())
+        LU = self._factorize(L.matrix)
 
         if DEBUG:
             import sys
             print >> sys.stderr, L.matrix
 
-        error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
+        errorVector, xError = self._workArrays(len(b))
 
-        for iteration in range(self.iterations):
-            errorVector = L * x - b
+        L.matrix.matvec(x, errorVector)
+        errorVector -= b
+        error0 = numerix.sqrt(numerix.sum(errorVector**2))
 
+        for iteration in range(self.iterations):
             if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
                 break
 
-            xError = numerix.zeros(len(b),'d')
             LU.solve(errorVector, xError)
-            x[:] = x - xError
+            x -= xError
+
+            L.matrix.matvec(x, errorVector)
+            errorVector -= b
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
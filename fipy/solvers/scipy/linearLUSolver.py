@@ -48,8 +48,53 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorisation.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` moduleq.
+
+    The factorization is kept and reused for as long as the matrix passed
+    to the solver is unchanged, e.g., for a linear problem with constant
+    coefficients and a fixed time step, so that only the triangular solves
+    are repeated. To take advantage of this, pass the same
+    `LinearLUSolver` to each call of `solve()` or `sweep()`.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=10)
+        >>> v = CellVariable(mesh=m)
+        >>> v.constrain(1., m.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm()
+        >>> solver = LinearLUSolver()
+        >>> eq.solve(var=v, dt=1., solver=solver)
+        >>> LU = solver._LU
+        >>> eq.solve(var=v, dt=1., solver=solver)
+        >>> solver._LU is LU
+        True
+        >>> eq.solve(var=v, dt=2., solver=solver)
+        >>> solver._LU is LU
+        False
     """
 
+    def _factorize(self, matrix):
+        """LU factorization of the CSR `matrix`, reused if `matrix` is
+        identical to the matrix factorized by the previous solve
+        """
+        matrix.sort_indices()
+        if (getattr(self, "_LU", None) is None
+            or not self._matchesFactorized(matrix)):
+            self._factorizedMatrix = matrix.copy()
+            self._LU = splu(matrix.asformat("csc"), diag_pivot_thresh=1.,
+                                                    drop_tol=0.,
+                                                    relax=1,
+                                                    panel_size=10,
+                                                    permc_spec=3)
+        return self._LU
+
+    def _matchesFactorized(self, matrix):
+        # comparing the CSR arrays is O(nnz); factorizing is not
+        old = self._factorizedMatrix
+        return (old.shape == matrix.shape
+                and old.nnz == matrix.nnz
+                and numerix.array_equal(old.indptr, matrix.indptr)
+                and numerix.array_equal(old.indices, matrix.indices)
+                and numerix.array_equal(old.data, matrix.data))
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
         maxdiag = max(numerix.absolute(diag))
@@ -57,11 +102,7 @@ class LinearLUSolver(_ScipySolver):
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            drop_tol=0.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+        LU = self._factorize(L.matrix.asformat("csr"))
 
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
@@ -0,0 +1,5 @@
+from fipy.solvers.scipy.preconditioners.preconditioner import *
+from fipy.solvers.scipy.preconditioners.blockJacobiPreconditioner import *
+
+__all__ = []
+__all__.extend(blockJacobiPreconditioner.__all__)
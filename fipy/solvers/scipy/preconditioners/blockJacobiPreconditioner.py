@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "blockJacobiPreconditioner.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+from fipy.tools import numerix
+
+__all__ = ["BlockJacobiPreconditioner"]
+
+class BlockJacobiPreconditioner(Preconditioner):
+    """
+    Block Jacobi preconditioner for the SciPy Krylov solvers.
+
+    Inverts the dense diagonal blocks of a block sparse row matrix, which
+    the solvers are given for coupled equations whose unknowns are
+    numbered cell by cell (see :envvar:`FIPY_INTERLEAVE_COUPLED`), so that
+    the coupling between the variables of each cell is preconditioned
+    exactly. Other matrices get plain Jacobi preconditioning.
+
+        >>> import scipy.sparse as sp
+        >>> A = sp.bsr_matrix(numerix.array([[2., 1., 0., 0.],
+        ...                                  [1., 3., 0., 1.],
+        ...                                  [0., 0., 4., 1.],
+        ...                                  [1., 0., 2., 5.]]), blocksize=(2, 2))
+        >>> M = BlockJacobiPreconditioner()._applyToMatrix(A)
+        >>> print numerix.allclose(M * numerix.array([3., 4., 5., 7.]),
+        ...                        [1., 1., 1., 1.])
+        True
+    """
+
+    def _applyToMatrix(self, A):
+        R, C = getattr(A, "blocksize", (1, 1))
+        if R == 1 or R != C:
+            diag = A.diagonal()
+            return LinearOperator(A.shape, matvec=lambda x: x / diag)
+
+        N = A.shape[0] // R
+        rows = numerix.repeat(numerix.arange(N), numerix.diff(A.indptr))
+        onDiagonal = rows == A.indices
+        blocks = numerix.zeros((N, R, R), dtype=A.dtype)
+        blocks[rows[onDiagonal]] = A.data[onDiagonal]
+        inverses = numerix.linalg.inv(blocks)
+
+        def matvec(x):
+            x = numerix.reshape(x, (N, R))
+            return numerix.einsum('ijk,ik->ij', inverses, x).ravel()
+
+        return LinearOperator(A.shape, matvec=matvec)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "preconditioner.py"
+ #
+ #  Author: James O'Beirne <james.obeirne@nist.gov>
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+
+__docformat__ = 'restructuredtext'
+
+__all__ = ["Preconditioner"]
+
+class Preconditioner(object):
+    """
+    Base preconditioner class for the SciPy Krylov solvers.
+
+    Setting up a preconditioner, e.g., an algebraic multigrid hierarchy,
+    can cost more than the solve it accelerates. A preconditioner built
+    for one matrix remains a valid (if less effective) preconditioner for
+    the slightly different matrices of subsequent sweeps and time steps,
+    so it can be kept for several solves and rebuilt only periodically or
+    when the solver starts to need noticeably more iterations.
+
+        >>> from fipy import *
+        >>> from scipy.sparse.linalg import LinearOperator
+        >>> class _JacobiPreconditioner(Preconditioner):
+        ...     builds = 0
+        ...     def _applyToMatrix(self, A):
+        ...         self.builds += 1
+        ...         diag = A.diagonal()
+        ...         return LinearOperator(A.shape, matvec=lambda x: x / diag)
+
+        >>> m = Grid1D(nx=100)
+        >>> v = CellVariable(mesh=m)
+        >>> v.constrain(1., m.facesLeft)
+        >>> eq = TransientTerm() == DiffusionTerm(coeff=1. + v)
+
+    By default, the preconditioner is rebuilt for every solve
+
+        >>> precon = _JacobiPreconditioner()
+        >>> solver = LinearPCGSolver(precon=precon)
+        >>> for step in range(6):
+        ...     eq.solve(var=v, dt=1., solver=solver)
+        >>> print precon.builds
+        6
+
+    but it can be kept for a number of solves
+
+        >>> precon = _JacobiPreconditioner(rebuildEvery=3)
+        >>> solver = LinearPCGSolver(precon=precon)
+        >>> for step in range(6):
+        ...     eq.solve(var=v, dt=1., solver=solver)
+        >>> print precon.builds
+        2
+
+    or until a solve takes more than twice as many iterations as the
+    first solve with the current preconditioner
+
+        >>> precon = _JacobiPreconditioner(rebuildEvery=None, iterationGrowth=2.)
+        >>> solver = LinearPCGSolver(precon=precon)
+        >>> for step in range(6):
+        ...     eq.solve(var=v, dt=1., solver=solver)
+        >>> print precon.builds
+        1
+
+    A preconditioner that is reused keeps state, so each solver should be
+    given its own instance.
+
+    .. attention:: This class is abstract. Always create one of its subclasses.
+    """
+
+    def __init__(self, rebuildEvery=1, iterationGrowth=None):
+        """
+        Create a `Preconditioner` object.
+
+        :Parameters:
+          - `rebuildEvery`: The number of solves for which a preconditioner
+            is used before it is rebuilt. `None` never rebuilds on this
+            basis.
+          - `iterationGrowth`: Rebuild once a solve takes more than
+            `iterationGrowth` times the iterations of the first solve with
+            the current preconditioner. `None` ignores the iteration count.
+        """
+        if self.__class__ is Preconditioner:
+            raise NotImplementedError, \
+                  "can't instantiate abstract base class"
+
+        self.rebuildEvery = rebuildEvery
+        self.iterationGrowth = iterationGrowth
+        self._M = None
+
+    def _applyToMatrix(self, A):
+        """
+        Returns the preconditioner for the `scipy.sparse` matrix `A`
+        """
+        raise NotImplementedError
+
+    def _needsRebuild(self, A):
+        return (self._M is None
+                or self._shape != A.shape
+                or self._stale
+                or (self.rebuildEvery is not None
+                    and self._solves >= self.rebuildEvery))
+
+    def _getPreconditioner(self, A):
+        """
+        Returns the preconditioner for `A`, reusing the last one built
+        unless the lifetime policy requires a new one
+        """
+        if self._needsRebuild(A):
+            self._M = self._applyToMatrix(A)
+            self._shape = A.shape
+            self._solves = 0
+            self._baseIterations = None
+            self._stale = False
+
+        self._solves += 1
+
+        return self._M
+
+    def _recordIterations(self, iterations):
+        """
+        Mark the preconditioner for rebuilding if the solver needed too many
+        `iterations`
+        """
+        if self._baseIterations is None:
+            self._baseIterations = iterations
+        elif (self.iterationGrowth is not None
+              and iterations > self.iterationGrowth * max(self._baseIterations, 1)):
+            self._stale = True
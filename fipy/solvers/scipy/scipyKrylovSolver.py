@@ -51,15 +51,27 @@ class _ScipyKrylovSolver(_ScipySolver):
 
     def _solve_(self, L, x, b):
         A = L.matrix
+        if L.blockSize > 1:
+            # coupled unknowns numbered by cell form dense blocks
+            A = A.tobsr(blocksize=(L.blockSize, L.blockSize))
+
         if self.preconditioner is None:
             M = None
         else:
-            M = self.preconditioner._applyToMatrix(A)
+            M = self.preconditioner._getPreconditioner(A)
+
+        iterations = [0]
+        def countIterations(xk):
+            iterations[0] += 1
 
         x, info = self.solveFnc(A, b, x,
                                 tol=self.tolerance,
                                 maxiter=self.iterations,
-                                M=M)
+                                M=M,
+                                callback=countIterations)
+
+        if self.preconditioner is not None:
+            self.preconditioner._recordIterations(iterations[0])
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             if info < 0:
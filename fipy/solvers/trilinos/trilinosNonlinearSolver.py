@@ -54,6 +54,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
 
         self.colMap = globalMatrix.colMap
         self.domainMap = globalMatrix.domainMap
+        self.importer = globalMatrix._importer
 
         if self.solver.jacobian is None:
             # Define the Jacobian interface/operator
@@ -90,8 +91,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
             overlappingVector = Epetra.Vector(self.colMap, self.solver.var)
 
             overlappingVector.Import(u,
-                                     Epetra.Import(self.colMap,
-                                                   self.domainMap),
+                                     self.importer,
                                      Epetra.Insert)
 
             self.solver.var.value = overlappingVector
@@ -112,8 +112,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
             overlappingVector = Epetra.Vector(self.colMap, self.solver.var)
 
             overlappingVector.Import(u,
-                                     Epetra.Import(self.colMap,
-                                                   self.domainMap),
+                                     self.importer,
                                      Epetra.Insert)
 
             self.solver.var.value = overlappingVector
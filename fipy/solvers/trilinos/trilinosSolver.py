@@ -77,8 +77,11 @@ class TrilinosSolver(Solver):
             else:
                 s = (localNonOverlappingCellIDs,)
 
-            nonOverlappingVector = Epetra.Vector(globalMatrix.domainMap,
-                                                 self.var[s].ravel())
+            (nonOverlappingVector,
+             nonOverlappingRHSvector,
+             overlappingVector) = self._distributedVectors(globalMatrix)
+
+            nonOverlappingVector[:] = self.var[s].ravel()
             from fipy.variables.coupledCellVariable import _CoupledCellVariable
 
             if isinstance(self.RHSvector, _CoupledCellVariable):
@@ -86,18 +89,32 @@ class TrilinosSolver(Solver):
             else:
                 RHSvector = numerix.reshape(numerix.array(self.RHSvector), self.var.shape)[s].ravel()
 
-
-            nonOverlappingRHSvector = Epetra.Vector(globalMatrix.rangeMap,
-                                                    RHSvector)
+            nonOverlappingRHSvector[:] = RHSvector
 
             del RHSvector
 
-            overlappingVector = Epetra.Vector(globalMatrix.colMap, self.var)
+            overlappingVector[:] = numerix.array(self.var).ravel()
 
             self.globalVectors = (globalMatrix, nonOverlappingVector, nonOverlappingRHSvector, overlappingVector)
 
         return self.globalVectors
 
+    def _distributedVectors(self, globalMatrix):
+        """The `Epetra.Vector` objects for the solution, the right-hand
+        side and the overlapping solution on the maps of `globalMatrix`
+
+        The maps of a mesh are shared by all of its matrices, so the
+        vectors are only created again if the maps change and are
+        otherwise refilled by each solve.
+        """
+        maps = (globalMatrix.domainMap, globalMatrix.rangeMap, globalMatrix.colMap)
+        if (not hasattr(self, "_vectorMaps")
+            or any([old is not new for old, new in zip(self._vectorMaps, maps)])):
+            self._vectorMaps = maps
+            self._vectors = tuple([Epetra.Vector(vectorMap) for vectorMap in maps])
+
+        return self._vectors
+
     def _deleteGlobalMatrixAndVectors(self):
         self.matrix.flush()
         del self.globalVectors
@@ -117,8 +134,7 @@ class TrilinosSolver(Solver):
                      nonOverlappingRHSvector)
 
         overlappingVector.Import(nonOverlappingVector,
-                                 Epetra.Import(globalMatrix.colMap,
-                                               globalMatrix.domainMap),
+                                 globalMatrix._importer,
                                  Epetra.Insert)
 
         self.var.value = numerix.reshape(numerix.array(overlappingVector), self.var.shape)
@@ -140,8 +156,7 @@ class TrilinosSolver(Solver):
 
             overlappingResidual = Epetra.Vector(globalMatrix.colMap)
             overlappingResidual.Import(residual,
-				       Epetra.Import(globalMatrix.colMap,
-						     globalMatrix.domainMap),
+				       globalMatrix._importer,
 				       Epetra.Insert)
 
             return overlappingResidual
@@ -202,21 +202,46 @@ class AdvectionTerm(FirstOrderAdvectionTerm):
 
     The maximum error is 2 % when using a higher order contribution.
 
+    With a narrow band, the higher order term only needs the gradients in
+    and next to the band, and gives the same answer there.
+
+    >>> from fipy.variables.distanceVariable import DistanceVariable
+    >>> band = DistanceVariable(mesh = mesh, value = r - 5., narrowBandWidth = 2.)
+    >>> full = CellVariable(mesh = mesh, value = r - 5.)
+    >>> v, L, bandb = AdvectionTerm(1.)._buildMatrix(band, SparseMatrix)
+    >>> v, L, fullb = AdvectionTerm(1.)._buildMatrix(full, SparseMatrix)
+    >>> cellIDs = band._narrowBandCellIDs
+    >>> print numerix.allclose(bandb[cellIDs], fullb[cellIDs])
+    True
+    >>> print numerix.allclose(numerix.delete(bandb, cellIDs), 0)
+    True
+
     """
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cellIDs):
+
+        dAP = numerix.take(mesh._cellToCellDistances, cellIDs, axis=-1)
+        cellNormals = mesh._cellNormals[..., cellIDs]
+        neighborIDs = mesh._cellToCellIDs[..., cellIDs]
 
-        dAP = mesh._cellToCellDistances
+        if len(cellIDs) < mesh.numberOfCells:
+            ## only the gradients in and around the narrow band are needed
+            from fipy.variables.distanceVariable import _cellGradient
+            gradIDs = numerix.unique(numerix.concatenate((cellIDs, MA.compressed(neighborIDs))))
+            grad = numerix.zeros((mesh.dim, mesh.numberOfCells), 'd')
+            grad[..., gradIDs] = _cellGradient(mesh, numerix.array(oldArray), gradIDs)
+        else:
+            grad = oldArray.grad
 
 ##        adjacentGradient = numerix.take(oldArray.grad, cellToCellIDs)
-        adjacentGradient = numerix.take(oldArray.grad, mesh._cellToCellIDs, axis=-1)
-        adjacentNormalGradient = numerix.dot(adjacentGradient, mesh._cellNormals)
+        adjacentGradient = numerix.take(grad, neighborIDs, axis=-1)
+        adjacentNormalGradient = numerix.dot(adjacentGradient, cellNormals)
         adjacentUpValues = cellValues + 2 * dAP * adjacentNormalGradient
 
-        cellIDs = numerix.repeat(numerix.arange(mesh.numberOfCells)[numerix.newaxis, ...],
+        selfIDs = numerix.repeat(cellIDs[numerix.newaxis, ...],
                 mesh._maxFacesPerCell, axis=0)
-        cellIDs = MA.masked_array(cellIDs, mask = MA.getmask(mesh._cellToCellIDs))
-        cellGradient = numerix.take(oldArray.grad, cellIDs, axis=-1)
-        cellNormalGradient = numerix.dot(cellGradient, mesh._cellNormals)
+        selfIDs = MA.masked_array(selfIDs, mask = MA.getmask(neighborIDs))
+        cellGradient = numerix.take(grad, selfIDs, axis=-1)
+        cellNormalGradient = numerix.dot(cellGradient, cellNormals)
         cellUpValues = adjacentValues - 2 * dAP * cellNormalGradient
 
         cellLaplacian = (cellUpValues + adjacentValues - 2 * cellValues) / dAP**2
@@ -231,7 +256,7 @@ class AdvectionTerm(FirstOrderAdvectionTerm):
                                          adjacentLaplacian,
                                          cellLaplacian))
 
-        return FirstOrderAdvectionTerm._getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh) -  mm * dAP / 2.
+        return FirstOrderAdvectionTerm._getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cellIDs) -  mm * dAP / 2.
 
 class __AdvectionTerm(FirstOrderAdvectionTerm):
     """
@@ -37,6 +37,8 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+import os
+
 from fipy.terms.abstractBinaryTerm import _AbstractBinaryTerm
 from fipy.variables.coupledCellVariable import _CoupledCellVariable
 from fipy.variables.cellVariable import CellVariable
@@ -83,7 +85,53 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
         if len(self._vars) != len(self._uncoupledTerms):
             raise SolutionVariableNumberError
 
-        return _AbstractBinaryTerm._verifyVar(self, _CoupledCellVariable(self._vars))
+        return _AbstractBinaryTerm._verifyVar(self, _CoupledCellVariable(self._vars,
+                                                                         interleaved=self._interleaved))
+
+    def _getInterleaved(self):
+        """Whether to number the unknowns of each cell consecutively
+
+        The matrix is then made of dense blocks coupling the variables of
+        each cell, which block-aware solvers and preconditioners can take
+        advantage of. Requested with the :envvar:`FIPY_INTERLEAVE_COUPLED`
+        environment variable and only used on a single processor.
+
+            >>> from fipy import *
+            >>> from fipy.solvers import _MeshMatrix
+            >>> m = Grid1D(nx=2)
+            >>> v0 = CellVariable(mesh=m, value=[1., 2.])
+            >>> v1 = CellVariable(mesh=m, value=[3., 4.])
+            >>> eq = ((TransientTerm(var=v0) == DiffusionTerm(var=v1))
+            ...       & (TransientTerm(var=v1) == ImplicitSourceTerm(2., var=v0)))
+            >>> eq._interleaved = False
+            >>> var, L, b = eq._buildAndAddMatrices(eq._verifyVar(None), _MeshMatrix, dt=1.)
+            >>> eq._interleaved = True
+            >>> var, Li, bi = eq._buildAndAddMatrices(eq._verifyVar(None), _MeshMatrix, dt=1.)
+            >>> print var.value # doctest: +SERIAL
+            [ 1.  3.  2.  4.]
+            >>> print L.blockSize, Li.blockSize
+            1 2
+
+        The interleaved system is the same, with its rows and columns
+        reordered
+
+            >>> order = [0, 2, 1, 3]
+            >>> print numerix.allclose(Li.numpyArray,
+            ...                        L.numpyArray[order][:, order]) # doctest: +SERIAL
+            True
+            >>> print numerix.allclose(numerix.array(bi),
+            ...                        numerix.array(b)[order]) # doctest: +SERIAL
+            True
+        """
+        if not hasattr(self, "_interleave"):
+            self._interleave = ('FIPY_INTERLEAVE_COUPLED' in os.environ
+                                and self._vars[0].mesh.communicator.Nproc == 1)
+        return self._interleave
+
+    def _setInterleaved(self, interleaved):
+        self._interleave = interleaved
+
+    _interleaved = property(_getInterleaved, _setInterleaved)
 
     @property
     def _buildExplcitIfOther(self):
@@ -99,7 +147,8 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
         from fipy.matrices.offsetSparseMatrix import OffsetSparseMatrix
         SparseMatrix =  OffsetSparseMatrix(SparseMatrix=SparseMatrix,
                                            numberOfVariables=len(self._vars),
-                                           numberOfEquations=len(self._uncoupledTerms))
+                                           numberOfEquations=len(self._uncoupledTerms),
+                                           interleaved=var.interleaved)
         matrix = SparseMatrix(mesh=var.mesh)
         RHSvectors = []
 
@@ -128,7 +177,7 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
             RHSvectors += [CellVariable(value=termRHSvector, mesh=var.mesh)]
             matrix += termMatrix
 
-        return (var, matrix, _CoupledCellVariable(RHSvectors))
+        return (var, matrix, _CoupledCellVariable(RHSvectors, interleaved=var.interleaved))
 
     def __repr__(self):
         return '(' + repr(self.term) + ' & ' + repr(self.other) + ')'
@@ -112,6 +112,17 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
     >>> answer = -vel * numerix.array((2, numerix.sqrt(2**2 + 6**2), 1, 0))
     >>> print numerix.allclose(b, answer, atol = 1e-10) # doctest: +PROCESSOR_0
     True
+
+    When advecting a `DistanceVariable` with a narrow band, only the cells
+    in the band are evaluated and the contribution is zero elsewhere.
+
+    >>> from fipy.variables.distanceVariable import DistanceVariable
+    >>> mesh = Grid1D(dx = 1., nx = 10)
+    >>> x = mesh.cellCenters[0]
+    >>> var = DistanceVariable(mesh = mesh, value = x - 3., narrowBandWidth = 2.)
+    >>> v, L, b = FirstOrderAdvectionTerm(1.)._buildMatrix(var, SparseMatrix)
+    >>> print numerix.allclose(b, (0, -1, -1, -1, -1, 0, 0, 0, 0, 0)) # doctest: +PROCESSOR_0
+    True
     """
 
     def __init__(self, coeff = None):
@@ -126,32 +137,48 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
         NCells = mesh.numberOfCells
         NCellFaces = mesh._maxFacesPerCell
 
-        cellValues = numerix.repeat(oldArray[numerix.newaxis, ...], NCellFaces, axis = 0)
+        cellIDs = self._getActiveCellIDs(var)
+        b = numerix.zeros((NCells,), 'd')
 
-        cellIDs = numerix.repeat(numerix.arange(NCells)[numerix.newaxis, ...], NCellFaces, axis = 0)
-        cellToCellIDs = mesh._cellToCellIDs
+        if len(cellIDs) > 0:
+            oldValues = numerix.array(oldArray)
 
-        if NCells > 0:
-            cellToCellIDs = MA.where(MA.getmask(cellToCellIDs), cellIDs, cellToCellIDs)
+            cellValues = numerix.repeat(numerix.take(oldValues, cellIDs)[numerix.newaxis, ...], NCellFaces, axis = 0)
 
-            adjacentValues = numerix.take(oldArray, cellToCellIDs)
+            selfIDs = numerix.repeat(cellIDs[numerix.newaxis, ...], NCellFaces, axis = 0)
+            cellToCellIDs = mesh._cellToCellIDs[..., cellIDs]
+            cellToCellIDs = MA.where(MA.getmask(cellToCellIDs), selfIDs, cellToCellIDs)
 
-            differences = self._getDifferences(adjacentValues, cellValues, oldArray, cellToCellIDs, mesh)
+            adjacentValues = numerix.take(oldValues, cellToCellIDs)
+
+            differences = self._getDifferences(adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cellIDs)
             differences = MA.filled(differences, 0)
 
-            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
-            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
+            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, 0.)**2, axis=0))
+            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, 0.)**2, axis=0))
 
             coeff = numerix.array(self._getGeomCoeff(var))
+            if coeff.shape != ():
+                coeff = numerix.take(coeff, cellIDs, axis=-1)
 
             coeffXdifferences = coeff * ((coeff > 0.) * minsq + (coeff < 0.) * maxsq)
-        else:
-            coeffXdifferences = 0.
 
-        return (var, SparseMatrix(mesh=var.mesh), -coeffXdifferences * mesh.cellVolumes)
+            b[cellIDs] = -coeffXdifferences * numerix.take(numerix.array(mesh.cellVolumes), cellIDs)
+
+        return (var, SparseMatrix(mesh=var.mesh), b)
+
+    def _getActiveCellIDs(self, var):
+        """
+        The cells where the term is evaluated: the narrow band of a
+        `DistanceVariable` that has one, otherwise all of the cells.
+        """
+        cellIDs = getattr(var, '_narrowBandCellIDs', None)
+        if cellIDs is None:
+            cellIDs = numerix.arange(var.mesh.numberOfCells)
+        return cellIDs
 
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
-        return (adjacentValues - cellValues) / mesh._cellToCellDistances
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cellIDs):
+        return (adjacentValues - cellValues) / numerix.take(mesh._cellToCellDistances, cellIDs, axis=-1)
 
     def _getDefaultSolver(self, var, solver, *args, **kwargs):
         solver = solver or super(FirstOrderAdvectionTerm, self)._getDefaultSolver(var, solver, *args, **kwargs)
@@ -131,6 +131,43 @@ class Term(object):
 
         return SparseMatrix
 
+    def _getSparsityPattern(self, var, boundaryConditions):
+        """Sparsity pattern of the matrix this term assembles for `var` with
+        `boundaryConditions`, reused from sweep to sweep
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=3)
+            >>> v = CellVariable(mesh=m)
+            >>> eq = TransientTerm() == DiffusionTerm()
+            >>> eq._getSparsityPattern(v, ()) is eq._getSparsityPattern(v, ())
+            True
+            >>> eq._getSparsityPattern(v, ()) is eq._getSparsityPattern(v, (FixedValue(m.facesLeft, 0.),))
+            False
+
+        A coupled equation builds a new coupled variable in each sweep, but
+        it holds the same variables, so the pattern is still reused
+
+            >>> v0 = CellVariable(mesh=m)
+            >>> v1 = CellVariable(mesh=m)
+            >>> eq = ((TransientTerm(var=v0) == DiffusionTerm(var=v1))
+            ...       & (TransientTerm(var=v1) == DiffusionTerm(var=v0)))
+            >>> pattern = eq._getSparsityPattern(eq._verifyVar(None), ())
+            >>> pattern is eq._getSparsityPattern(eq._verifyVar(None), ())
+            True
+
+        Only the pattern of the latest variable and boundary conditions is
+        kept, so patterns of variables that are gone do not pile up
+        """
+        key = ((tuple(id(v) for v in getattr(var, "vars", [var])), id(var.mesh))
+               + tuple(id(bc) for bc in boundaryConditions))
+
+        if getattr(self, "_sparsityPatternKey", None) != key:
+            from fipy.matrices.sparseMatrix import _SparsityPattern
+            self._sparsityPatternKey = key
+            self._sparsityPattern = _SparsityPattern()
+
+        return self._sparsityPattern
+
     def _prepareLinearSystem(self, var, solver, boundaryConditions, dt):
         solver = self.getDefaultSolver(var, solver)
 
@@ -156,6 +193,8 @@ class Term(object):
                                                            diffusionGeomCoeff=self._getDiffusionGeomCoeff(var),
                                                            buildExplicitIfOther=self._buildExplcitIfOther)
 
+        matrix.sparsityPattern = self._getSparsityPattern(var, boundaryConditions)
+
         self._buildCache(matrix, RHSvector)
 
         solver._storeMatrix(var=var, matrix=matrix, RHSvector=RHSvector)
@@ -461,7 +500,7 @@ class Term(object):
     def _getOldAdjacentValues(self, oldArray, id1, id2, dt):
         raise NotImplementedError
 
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cellIDs):
         raise NotImplementedError
 
     def _alpha(self, P):
@@ -109,6 +109,7 @@ for M in (2, 3):
                          why="not running on processor %d of %d" % (N, M),
                          skipWarning=False)
 
+import fipy.tools.checkpoint
 import fipy.tools.dump
 import fipy.tools.numerix
 import fipy.tools.vector
@@ -118,6 +119,7 @@ from fipy.tools.vitals import Vitals
 
 __all__ = ["serialComm",
            "parallelComm",
+           "checkpoint",
            "dump",
            "numerix",
            "vector",
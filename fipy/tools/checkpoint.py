@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "checkpoint.py"
+ #
+ #  Author: James O'Beirne <james.obeirne@nist.gov>
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+
+"""Binary checkpoints of `Variable` objects and their meshes
+
+Unlike :mod:`~fipy.tools.dump`, which pickles a gathered copy of
+everything on processor 0, a checkpoint is a flat binary container: a
+short JSON header describing the contents, followed by each array as a
+raw, contiguous, aligned block. Every mesh is stored once, however many
+variables live on it, and in parallel each processor writes its own part
+of the variables to its own file, without any communication. Arrays are
+read back by memory mapping, so restarting only touches the data as it
+is used.
+"""
+__docformat__ = 'restructuredtext'
+
+import cPickle
+import json
+import struct
+
+from fipy.tools import numerix
+from fipy.tools import parallelComm
+
+__all__ = ["write", "read"]
+
+_magic = "FiPyCkpt"
+_version = 1
+_alignment = 64
+
+def _align(offset):
+    return -(-offset // _alignment) * _alignment
+
+def _partFilename(filename, communicator):
+    if communicator.Nproc > 1:
+        return "%s.%d" % (filename, communicator.procID)
+    else:
+        return filename
+
+def _variableState(var):
+    from fipy.variables.cellVariable import CellVariable
+
+    if isinstance(var, CellVariable):
+        # as `CellVariable.__getstate__()`, but without gathering
+        # the value onto every processor
+        return dict(mesh=var.mesh,
+                    name=var.name,
+                    value=var.value,
+                    unit=var.unit,
+                    old=var._old)
+    else:
+        return var.__getstate__()
+
+class _CheckpointWriter(object):
+    def __init__(self):
+        self.blocks = []
+        self.arrays = []
+        self.meshes = []
+        self.encodedMeshes = []
+        self.nbytes = 0
+
+    def _addArray(self, arr):
+        shape = list(arr.shape)
+        arr = numerix.ascontiguousarray(arr)
+        self.blocks.append(dict(dtype=arr.dtype.str,
+                                shape=shape,
+                                offset=self.nbytes))
+        self.arrays.append(arr)
+        self.nbytes = _align(self.nbytes + arr.nbytes)
+
+        return len(self.blocks) - 1
+
+    def _addPickle(self, obj):
+        return self._addArray(numerix.fromstring(cPickle.dumps(obj, 2), dtype='|u1'))
+
+    def _addMesh(self, mesh):
+        for i, m in enumerate(self.meshes):
+            if m is mesh:
+                return i
+
+        self.meshes.append(mesh)
+        self.encodedMeshes.append(None)
+        i = len(self.meshes) - 1
+        self.encodedMeshes[i] = self._encodeObject(mesh, mesh.__getstate__())
+
+        return i
+
+    def _encodeObject(self, obj, state):
+        from fipy.variables.variable import Variable
+
+        if isinstance(obj, Variable) and len(obj.requiredVariables) > 0:
+            # only the value of a `Variable` calculated from others
+            # is kept, e.g., the gradient of a `CellVariable` is
+            # restored as a plain `FaceVariable`
+            klass = obj._variableClass
+        else:
+            klass = obj.__class__
+
+        return {'class': self._addPickle(klass),
+                'state': dict((key, self._encode(value)) for key, value in state.items())}
+
+    def _encode(self, value):
+        from fipy.meshes.abstractMesh import AbstractMesh
+        from fipy.variables.variable import Variable
+
+        if isinstance(value, numerix.MA.MaskedArray):
+            return {'masked': [self._addArray(numerix.MA.getdata(value)),
+                               self._addArray(numerix.MA.getmaskarray(value))]}
+        elif type(value) is numerix.ndarray:
+            return {'array': self._addArray(value)}
+        elif isinstance(value, AbstractMesh):
+            return {'mesh': self._addMesh(value)}
+        elif isinstance(value, Variable):
+            return {'variable': self._addArray(value.value)}
+        else:
+            return {'pickle': self._addPickle(value)}
+
+    def write(self, filename, variables, attributes=None, arrays=None):
+        header = dict(version=_version,
+                      variables=dict((name, self._encodeObject(var, _variableState(var)))
+                                     for name, var in variables.items()),
+                      arrays=dict((name, self._encode(value))
+                                  for name, value in (arrays or {}).items()),
+                      meshes=self.encodedMeshes,
+                      blocks=self.blocks,
+                      attributes=attributes or {})
+        header = json.dumps(header)
+
+        start = _align(len(_magic) + 8 + len(header))
+
+        f = open(filename, 'wb')
+        try:
+            f.write(_magic)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            for block, arr in zip(self.blocks, self.arrays):
+                f.seek(start + block['offset'])
+                arr.tofile(f)
+            f.truncate(start + self.nbytes)
+        finally:
+            f.close()
+
+class _CheckpointReader(object):
+    def __init__(self, filename, mmap=True):
+        self.filename = filename
+        self.mmap = mmap
+
+        f = open(filename, 'rb')
+        try:
+            if f.read(len(_magic)) != _magic:
+                raise IOError("%s is not a FiPy checkpoint" % filename)
+            length, = struct.unpack('<Q', f.read(8))
+            self.header = json.loads(f.read(length))
+        finally:
+            f.close()
+
+        if self.header['version'] > _version:
+            raise IOError("%s has checkpoint version %d, but only %d is understood"
+                          % (filename, self.header['version'], _version))
+
+        self.start = _align(len(_magic) + 8 + length)
+        self.meshes = [None] * len(self.header['meshes'])
+        self.attributes = self.header.get('attributes', {})
+
+    @property
+    def end(self):
+        """Offset of the end of the checkpoint in the file
+        """
+        end = self.start
+        for block in self.header['blocks']:
+            nbytes = int(numerix.prod(block['shape'])) * numerix.dtype(str(block['dtype'])).itemsize
+            end = max(end, self.start + _align(block['offset'] + nbytes))
+        return end
+
+    def _getArray(self, i):
+        block = self.header['blocks'][i]
+        dtype = numerix.dtype(str(block['dtype']))
+        shape = tuple(block['shape'])
+        count = int(numerix.prod(shape))
+
+        if self.mmap and len(shape) > 0 and count > 0:
+            # copy-on-write, so that the restarted variables can change
+            # without touching the checkpoint. The map is viewed as a plain
+            # array, as `numerix.take` and friends do not accept a `memmap`.
+            return numerix.asarray(numerix.memmap(self.filename, dtype=dtype, mode='c',
+                                                  offset=self.start + block['offset'],
+                                                  shape=shape))
+        else:
+            f = open(self.filename, 'rb')
+            try:
+                f.seek(self.start + block['offset'])
+                return numerix.fromfile(f, dtype=dtype, count=count).reshape(shape)
+            finally:
+                f.close()
+
+    def _getPickle(self, i):
+        return cPickle.loads(numerix.array(self._getArray(i)).tostring())
+
+    def _getMesh(self, i):
+        if self.meshes[i] is None:
+            self.meshes[i] = self._decodeObject(self.header['meshes'][i])
+
+        return self.meshes[i]
+
+    def _decodeObject(self, encoded):
+        klass = self._getPickle(encoded['class'])
+        state = dict((str(key), self._decode(value)) for key, value in encoded['state'].items())
+
+        obj = klass.__new__(klass)
+        obj.__setstate__(state)
+
+        return obj
+
+    def _decode(self, encoded):
+        from fipy.variables.variable import Variable
+
+        if 'masked' in encoded:
+            data, mask = encoded['masked']
+            return numerix.MA.array(self._getArray(data), mask=self._getArray(mask))
+        elif 'array' in encoded:
+            return self._getArray(encoded['array'])
+        elif 'mesh' in encoded:
+            return self._getMesh(encoded['mesh'])
+        elif 'variable' in encoded:
+            return Variable(value=self._getArray(encoded['variable']))
+        else:
+            return self._getPickle(encoded['pickle'])
+
+    def read(self):
+        return dict((str(name), self._decodeObject(encoded))
+                    for name, encoded in self.header['variables'].items())
+
+    def readArrays(self):
+        return dict((str(name), self._decode(encoded))
+                    for name, encoded in self.header.get('arrays', {}).items())
+
+def write(filename, variables, communicator=parallelComm):
+    """
+    Write a checkpoint of `variables` and the meshes they are defined on.
+
+    :Parameters:
+      - `filename`: The name of the checkpoint. In parallel, each processor
+        writes its part to `filename` suffixed with ``.`` and its `procID`.
+      - `variables`: A `dict` of the `Variable` objects to checkpoint,
+        keyed by name.
+      - `communicator`: Object with `procID` and `Nproc` attributes.
+
+    Variables on the same mesh share it
+
+        >>> from fipy import *
+        >>> import os, tempfile
+        >>> m = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=m, name="phi", value=m.x * m.y, hasOld=True)
+        >>> phi.updateOld()
+        >>> phi.value = 2 * m.x
+        >>> flux = phi.faceGrad
+        >>> (f, filename) = tempfile.mkstemp('.ckpt')
+        >>> os.close(f)
+        >>> checkpoint.write(filename, dict(phi=phi, flux=flux, t=Variable(3.)))
+
+        >>> restart = checkpoint.read(filename)
+        >>> print restart['phi'].mesh is restart['flux'].mesh
+        True
+        >>> print restart['phi'].name
+        phi
+        >>> print numerix.allclose(restart['phi'], phi)
+        True
+        >>> print numerix.allclose(restart['phi'].old, phi.old)
+        True
+        >>> print isinstance(restart['flux'], FaceVariable)
+        True
+        >>> print numerix.allclose(restart['flux'], flux)
+        True
+        >>> print restart['t']
+        3.0
+
+    The restarted variables are independent of the checkpoint
+
+        >>> restart['phi'].value = 0.
+        >>> print numerix.allclose(checkpoint.read(filename)['phi'], phi)
+        True
+
+    Unstructured meshes are stored array by array
+
+        >>> m = Tri2D(nx=2, ny=2)
+        >>> phi = CellVariable(mesh=m, value=m.x, unit="m")
+        >>> checkpoint.write(filename, dict(phi=phi))
+        >>> restart = checkpoint.read(filename, mmap=False)
+        >>> print restart['phi'].unit
+        <PhysicalUnit m>
+        >>> print numerix.allclose(restart['phi'].mesh.cellCenters, m.cellCenters)
+        True
+        >>> os.remove(filename)
+    """
+    _CheckpointWriter().write(_partFilename(filename, communicator), variables)
+
+def read(filename, communicator=parallelComm, mmap=True):
+    """
+    Read a checkpoint written by :func:`write`. Returns a `dict` of the
+    `Variable` objects, keyed by name.
+
+    In parallel, each processor reads the part it wrote, so the checkpoint
+    must be read with the same number of processors and the meshes must
+    partition in the same way, as the `Grid` meshes do.
+
+    :Parameters:
+      - `filename`: The name of the checkpoint.
+      - `communicator`: Object with `procID` and `Nproc` attributes.
+      - `mmap`: Whether to map the arrays into memory, rather than reading them.
+    """
+    return _CheckpointReader(_partFilename(filename, communicator), mmap=mmap).read()
+
+def _writeArrays(filename, arrays):
+    """
+    Write a `dict` of arrays, and of anything else that can be pickled,
+    to `filename` in the checkpoint format.
+
+        >>> import os, tempfile
+        >>> (f, filename) = tempfile.mkstemp('.ckpt')
+        >>> os.close(f)
+        >>> _writeArrays(filename, dict(a=numerix.arange(3),
+        ...                             b=numerix.MA.masked_values((1, -1), -1),
+        ...                             c=[4, 5]))
+        >>> arrays = _readArrays(filename)
+        >>> print arrays['a'].tolist(), arrays['b'].mask.tolist(), arrays['c']
+        [0, 1, 2] [False, True] [4, 5]
+        >>> os.remove(filename)
+    """
+    _CheckpointWriter().write(filename, variables={}, arrays=arrays)
+
+def _readArrays(filename, mmap=True):
+    """
+    Read a `dict` written by :func:`_writeArrays`.
+    """
+    return _CheckpointReader(filename, mmap=mmap).readArrays()
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
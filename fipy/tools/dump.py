@@ -52,6 +52,10 @@ def write(data, filename = None, extension = '', communicator=parallelComm):
     Pickle an object and write it to a file. Wrapper for
     `cPickle.dump()`.
 
+    Only processor 0 writes. For large parallel runs, where the pickled
+    variables would assemble the whole mesh, see :mod:`fipy.tools.checkpoint`,
+    which writes one file per processor.
+
     :Parameters:
       - `data`: The object to be pickled.
       - `filename`: The name of the file to place the pickled object. If `filename` is `None`
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "fused.py"
+ #
+ #  Author: James O'Beirne <james.obeirne@nist.gov>
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+
+"""Evaluation of `_OperatorVariable` expression trees as fused kernels
+
+With the :option:`--fuse` flag or the :envvar:`FIPY_FUSE` environment
+variable, a stale `_OperatorVariable` is not evaluated operator by operator,
+allocating a temporary array for each, but is translated once into a single
+:mod:`numexpr` expression that is evaluated in one blocked pass over its
+operands. :mod:`numexpr` compiles and caches each distinct expression.
+Expressions that :mod:`numexpr` cannot evaluate with the same result as
+:mod:`numpy` fall back to operator by operator evaluation, as does
+everything when :mod:`numexpr` is not installed.
+"""
+__docformat__ = 'restructuredtext'
+
+__all__ = ["doFuse"]
+
+import os
+import sys
+
+from fipy.tools import numerix
+from fipy.tests.doctestPlus import register_skipper
+
+def _checkForNumexpr():
+    try:
+        import numexpr
+    except ImportError:
+        return False
+    return True
+
+register_skipper(flag="NUMEXPR",
+                 test=_checkForNumexpr,
+                 why="the `numexpr` package cannot be imported")
+
+if '--fuse' in [s.lower() for s in sys.argv[1:]]:
+    doFuse = _checkForNumexpr()
+else:
+    doFuse = 'FIPY_FUSE' in os.environ and _checkForNumexpr()
+
+class _FusionError(Exception):
+    pass
+
+_functions = {
+    'fabs': 'abs',
+    'absolute': 'abs'
+}
+
+def _call(function, args):
+    """Spell a call of `function` on `args` in :mod:`numexpr`
+
+        >>> print _call("numerix.fabs", ["var0"])
+        abs(var0)
+        >>> print _call("pow", ["var0", "var1"])
+        (var0 ** var1)
+    """
+    function = function.replace('numerix.', '')
+    if function in ('pow', 'power') and len(args) == 2:
+        return "(%s ** %s)" % tuple(args)
+    else:
+        return "%s(%s)" % (_functions.get(function, function), ", ".join(args))
+
+def _evaluate(expression, argDict, shape):
+    """Evaluate `expression` with the operands in `argDict`
+
+    Only double precision real and complex arrays are fused, so that the
+    result has the type :mod:`numpy` would give it. Scalar operators are
+    evaluated beforehand, so integer scalars only ever combine with
+    arrays and can be promoted.
+
+        >>> x = numerix.arange(4.)
+        >>> print _evaluate("var0 * var1 + sin(var2)",
+        ...                 dict(var0=x, var1=2, var2=x), (4,)) # doctest: +NUMEXPR
+        [ 0.          2.84147098  4.90929743  6.14112001]
+
+    Anything else is refused
+
+        >>> _evaluate("var0 + var1", dict(var0=numerix.arange(4), var1=2), (4,))
+        Traceback (most recent call last):
+            ...
+        _FusionError: int64 operand
+        >>> _evaluate("var0 % var1", dict(var0=x, var1=2.), (4,))
+        Traceback (most recent call last):
+            ...
+        _FusionError: unsupported operator
+    """
+    if '%' in expression or '//' in expression:
+        raise _FusionError, "unsupported operator"
+
+    floating = False
+    for key, value in argDict.items():
+        if isinstance(value, numerix.ndarray) and value.shape != ():
+            if isinstance(value, numerix.MA.MaskedArray):
+                raise _FusionError, "masked operand"
+            elif value.dtype not in (numerix.float64, numerix.complex128):
+                raise _FusionError, "%s operand" % value.dtype
+            floating = True
+        else:
+            if isinstance(value, numerix.ndarray):
+                value = value[()]
+            if isinstance(value, (bool, numerix.bool_)):
+                raise _FusionError, "boolean operand"
+            elif isinstance(value, (int, long, numerix.integer)):
+                argDict[key] = float(value)
+            elif isinstance(value, (float, complex, numerix.floating, numerix.complexfloating)):
+                argDict[key] = value
+            else:
+                raise _FusionError, "%s operand" % type(value).__name__
+
+    if not floating:
+        raise _FusionError, "no array operands"
+
+    import numexpr
+    try:
+        result = numexpr.evaluate(expression, local_dict=argDict)
+    except (KeyError, NotImplementedError, SyntaxError, TypeError, ValueError), e:
+        raise _FusionError, str(e)
+
+    if result.shape != tuple(shape):
+        raise _FusionError, "result has shape %s, not %s" % (result.shape, shape)
+
+    return result
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -481,6 +481,10 @@ else:
 def nearest(data, points, max_mem=1e8):
     """find the indices of `data` that are closest to `points`
 
+    A :class:`~fipy.tools.spatialIndex._SpatialIndex` is built for `data`;
+    when the same `data` will be queried repeatedly, build the index once
+    and keep it instead of calling this function.
+
     >>> from fipy import *
     >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
     >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
@@ -491,6 +495,19 @@ def nearest(data, points, max_mem=1e8):
     >>> print nearest(m0.cellCenters.globalValue, m1.cellCenters.globalValue, max_mem=10000)
     [4 5 7 8]
     """
+    from fipy.tools.spatialIndex import _SpatialIndex
+    return _SpatialIndex(data, max_mem=max_mem).nearest(points)
+
+def _bruteForceNearest(data, points, max_mem=1e8):
+    """find the indices of `data` that are closest to `points` by comparing
+    every point with every datum
+
+    >>> from fipy import *
+    >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
+    >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
+    >>> print _bruteForceNearest(m0.cellCenters.globalValue, m1.cellCenters.globalValue, max_mem=100)
+    [4 5 7 8]
+    """
     data = asanyarray(data)
     points = asanyarray(points)
 
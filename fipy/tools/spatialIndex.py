@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "spatialIndex.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+"""Nearest-neighbor lookup on a fixed set of coordinates
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+class _SpatialIndex(object):
+    r"""Persistent index of a `(D, N)` array of coordinates
+
+    The index is built once and then answers any number of nearest-neighbor
+    queries. A :class:`scipy.spatial.cKDTree` is used when :mod:`scipy` is
+    available, making each query :math:`O(\log N)`; otherwise queries fall
+    back to a chunked brute-force search.
+
+        >>> from fipy import *
+        >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
+        >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
+        >>> index = _SpatialIndex(m0.cellCenters.globalValue)
+        >>> print index.nearest(m1.cellCenters.globalValue)
+        [4 5 7 8]
+
+    A single point returns a single index
+
+        >>> print index.nearest((10., 10.))
+        8
+
+    and the brute-force search gives the same answer
+
+        >>> index = _SpatialIndex(m0.cellCenters.globalValue, max_mem=100)
+        >>> index._tree = None
+        >>> print index.nearest(m1.cellCenters.globalValue)
+        [4 5 7 8]
+        >>> print index.nearest((10., 10.))
+        8
+
+    An empty set of data has no neighbors
+
+        >>> print _SpatialIndex(numerix.zeros((2, 0))).nearest(((0., 1.), (0., 1.)))
+        []
+    """
+    def __init__(self, data, max_mem=1e8):
+        """
+        :Parameters:
+          - `data`: `(D, N)` coordinates to be indexed
+          - `max_mem`: upper bound, in bytes, on the temporary distance
+            arrays used by the brute-force fallback
+        """
+        self.data = numerix.asanyarray(data)
+        self.max_mem = max_mem
+        self._tree = self._buildTree()
+
+    def _buildTree(self):
+        if self.data.shape[-1] == 0:
+            return None
+
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            return None
+
+        try:
+            return cKDTree(numerix.array(self.data, 'd').swapaxes(0, 1))
+        except (TypeError, ValueError):
+            # e.g., coordinates with physical units
+            return None
+
+    def nearest(self, points):
+        """Find the indices of the indexed coordinates closest to `points`
+
+        :Parameters:
+          - `points`: `(D,)` point or `(D, M)` set of points
+
+        :Returns:
+          The `(M,)` indices of the nearest coordinates, or a single index
+          if a single point was given
+        """
+        points = numerix.asanyarray(points)
+        shape = points.shape[1:]
+        points = points.reshape((self.data.shape[0], -1))
+
+        if self.data.shape[-1] == 0:
+            return numerix.arange(0)
+        elif self._tree is None:
+            ids = numerix._bruteForceNearest(self.data, points, max_mem=self.max_mem)
+        else:
+            dist, ids = self._tree.query(numerix.array(points, 'd').swapaxes(0, 1))
+            ids = numerix.array(ids, dtype=numerix.INT_DTYPE)
+
+        return ids.reshape(shape)
+
+def _matchPoints(data, points, tolerance):
+    """Pair up the coordinates of `data` and `points` that lie within
+    `tolerance` of each other
+
+    The coordinates are binned on a grid of spacing `tolerance`, so the
+    two coordinates of a matching pair fall in the same or in adjacent
+    bins. For each of the :math:`3^D` offsets between adjacent bins, the
+    bins of `data` and of the offset `points` are sorted together and
+    identical bins are paired, so the cost is :math:`O((N + M) \log (N +
+    M))` rather than the :math:`O(N M)` of comparing every pair.
+
+    :Parameters:
+      - `data`: `(D, N)` coordinates
+      - `points`: `(D, M)` coordinates
+      - `tolerance`: the largest distance between matching coordinates,
+        which should be less than half the distance between any two
+        coordinates of `data`
+
+    :Returns:
+      The `(2, K)` indices into `data` and into `points` of the `K`
+      matching pairs, in the order of `points`
+
+        >>> data = numerix.array(((0., 1., 2., 3.), (0., 0., 0., 0.)))
+        >>> points = numerix.array(((3.001, 5., 0.999, -0.0001),
+        ...                         (0., 0., 0.0001, 0.)))
+        >>> print _matchPoints(data, points, 0.01).tolist()
+        [[3, 1, 0], [0, 2, 3]]
+        >>> print _matchPoints(data, points[..., :0], 0.01).shape
+        (2, 0)
+    """
+    data = numerix.array(data, 'd')
+    points = numerix.array(points, 'd')
+    D, N = data.shape
+    M = points.shape[-1]
+
+    matches = -numerix.ones((M,), dtype=numerix.INT_DTYPE)
+
+    if N > 0 and M > 0:
+        origin = numerix.minimum(data.min(axis=1), points.min(axis=1))[..., numerix.newaxis]
+        dataBins = numerix.floor((data - origin) / tolerance).astype(numerix.INT_DTYPE)
+        pointBins = numerix.floor((points - origin) / tolerance).astype(numerix.INT_DTYPE)
+
+        from itertools import product
+        for offset in product((-1, 0, 1), repeat=D):
+            bins = numerix.concatenate((dataBins,
+                                        pointBins + numerix.array(offset)[..., numerix.newaxis]),
+                                       axis=1)
+
+            # lexsort is stable, so if a group of identical bins holds
+            # one of the data, that datum leads the group
+            order = numerix.lexsort(bins)
+            bins = bins[..., order]
+            newGroup = numerix.ones((N + M,), dtype=bool)
+            newGroup[1:] = (bins[..., 1:] != bins[..., :-1]).any(axis=0)
+            leaders = numerix.empty((N + M,), dtype=numerix.INT_DTYPE)
+            leaders[order] = order[newGroup][numerix.cumsum(newGroup) - 1]
+            leaders = leaders[N:]
+
+            candidates = numerix.nonzero((leaders < N) & (matches < 0))[0]
+            nearby = leaders[candidates]
+            separation = data[..., nearby] - points[..., candidates]
+            close = numerix.sum(separation**2, axis=0) < tolerance**2
+            matches[candidates[close]] = nearby[close]
+
+    matched = numerix.nonzero(matches >= 0)[0]
+    return numerix.array((matches[matched], matched), dtype=numerix.INT_DTYPE)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -42,7 +42,10 @@ def _suite():
             'dimensions.physicalField',
             'numerix',
             'dump',
+            'checkpoint',
             'vector',
+            'spatialIndex',
+            'fused',
         ), base = __name__)
 
     return theSuite
@@ -44,28 +44,55 @@ __all__ = ["putAdd", "prune"]
 def _putAdd(vector, ids, additionVector, mask=False):
     """This is a temporary replacement for Numeric.put as it was not doing
     what we thought it was doing.
+
+    Values with repeated `ids` accumulate
+
+        >>> vector = numerix.zeros(4)
+        >>> _putAdd(vector, numerix.array((0, 2, 2, 3, 0)), (1., 2., 3., 4., 5.))
+        >>> print vector
+        [ 6.  0.  5.  4.]
+
+    unless they are masked
+
+        >>> _putAdd(vector, numerix.array((0, 2, 2, 3, 0)), (1., 2., 3., 4., 5.),
+        ...         mask=numerix.array((False, True, False, False, True)))
+        >>> print vector
+        [ 7.  0.  8.  8.]
+
+    and each component of a vector is added separately
+
+        >>> vector = numerix.zeros((2, 3), 'l')
+        >>> _putAdd(vector, numerix.array(((0, 1, 1),)), (((1, 2, 3),), ((4, 5, 6),)))
+        >>> print vector
+        [[ 1  5  0]
+         [ 4 11  0]]
     """
     additionVector = numerix.array(additionVector)
+    ids = numerix.ravel(numerix.MA.filled(ids, 0))
 
-    if numerix.sometrue(mask):
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value, masked in zip(ids.flat, additionVector[j].flat, mask.flat):
-                    if not masked:
-                        vector[j].flat[id] += value
-        else:
-            for id, value, masked in zip(ids.flat, additionVector.flat, mask.flat):
-                if not masked:
-                    vector.flat[id] += value
+    if len(vector.shape) < len(additionVector.shape):
+        components = [(vector[j], additionVector[j]) for j in range(vector.shape[0])]
+    else:
+        components = [(vector, additionVector)]
 
+    if numerix.sometrue(mask):
+        unmasked = ~numerix.ravel(mask)
+        ids = ids[unmasked]
     else:
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value in zip(ids.flat, additionVector[j].flat):
-                    vector[j].flat[id] += value
+        unmasked = None
+
+    for component, values in components:
+        values = numerix.ravel(values)
+        if unmasked is not None:
+            values = values[unmasked]
+
+        if component.dtype.kind == 'f' and values.dtype.kind in 'biuf':
+            increment = numerix.bincount(ids, weights=values, minlength=component.size)
         else:
-            for id, value in zip(ids.flat, additionVector.flat):
-                vector.flat[id] += value
+            increment = numerix.zeros(component.size, component.dtype)
+            numerix.add.at(increment, ids, values)
+
+        component += increment.reshape(component.shape)
 
 if inline.doInline:
     ## FIXME: inline version doesn't account for all of the conditions that Python
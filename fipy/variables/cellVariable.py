@@ -152,23 +152,17 @@ class CellVariable(_MeshVariable):
         return self.mesh._localNonOverlappingCellIDs
 
     @property
-    def globalValue(self):
-        """Concatenate and return values from all processors
-
-        When running on a single processor, the result is identical to
-        :attr:`~fipy.variables.variable.Variable.value`.
-        """
-        return self._getGlobalValue(self.mesh._localNonOverlappingCellIDs,
-                                    self.mesh._globalNonOverlappingCellIDs)
+    def _globalNonOverlappingIDs(self):
+        return self.mesh._globalNonOverlappingCellIDs
 
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
 
-    def __call__(self, points=None, order=0, nearestCellIDs=None):
+    def __call__(self, points=None, order=0, nearestCellIDs=None, exact=False):
         r"""
-        Interpolates the CellVariable to a set of points using a
-        method that has a memory requirement on the order of Ncells by
-        Npoints in general, but uses only Ncells when the
+        Interpolates the CellVariable to a set of points. The cell
+        nearest to each point is found with a spatial index of the cell
+        centers that is built once per mesh, or directly when the
         CellVariable's mesh is a UniformGrid object.
 
         :Parameters:
@@ -177,6 +171,9 @@ class CellVariable(_MeshVariable):
            - `order`: The order of interpolation, 0 or 1, default is 0
            - `nearestCellIDs` : Optional argument if user can calculate own
              nearest cell IDs array, shape should be same as points
+           - `exact`: If `True`, use the cell that contains each point,
+             rather than the cell with the nearest center, when the two
+             differ (e.g., on strongly skewed or stretched meshes)
 
         Tests
 
@@ -198,21 +195,34 @@ class CellVariable(_MeshVariable):
             [ 0.125  0.25   0.5    0.625  0.25   0.375  0.875  1.     0.5    0.875
               1.875  2.25   0.625  1.     2.25   2.625]
 
+        A point just to the right of the face between a narrow and a wide
+        cell is closer to the center of the narrow cell, but lies in the
+        wide one
+
+            >>> m = Grid1D(dx=(1., 4.))
+            >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+            >>> print v(((1.2,),))
+            [ 0.5]
+            >>> print v(((1.2,),), exact=True) # doctest: +SERIAL
+            [ 3.]
+
         """
         if points is not None:
 
             if nearestCellIDs is None:
-                nearestCellIDs = self.mesh._getNearestCellID(points)
+                nearestCellIDs = self.mesh._getNearestCellID(points, exact=exact)
 
+            # only the values at the nearest cells are communicated,
+            # not the values of the whole mesh
             if order == 0:
-                return self.globalValue[..., nearestCellIDs]
+                return self._takeGlobal(nearestCellIDs)
 
             elif order == 1:
                 ##cellID = self.mesh._getNearestCellID(points)
 ##                return self[...,self.mesh._getNearestCellID(points)] + numerix.dot(points - self.mesh.cellCenters[...,cellID], self.grad[...,cellID])
-                return (self.globalValue[..., nearestCellIDs]
-                        + numerix.dot(points - self.mesh.cellCenters.globalValue[...,nearestCellIDs],
-                                      self.grad.globalValue[...,nearestCellIDs]))
+                return (self._takeGlobal(nearestCellIDs)
+                        + numerix.dot(points - self.mesh.cellCenters._takeGlobal(nearestCellIDs),
+                                      self.grad._takeGlobal(nearestCellIDs)))
 
             else:
                 raise ValueError, 'order should be either 0 or 1'
@@ -299,6 +309,15 @@ class CellVariable(_MeshVariable):
         >>> print numerix.allclose(CellVariable(mesh=Grid1D(dx=(2.0, 1.0, 0.5)),
         ...                                     value=(0, 1, 2)).leastSquaresGrad.globalValue, [[0.461538461538, 0.8, 1.2]])
         True
+
+        The central cell of a 3D mesh only sees interior neighbors, so it
+        recovers a linear field exactly
+
+        >>> from fipy import Grid3D
+        >>> m = Grid3D(dx=(1.,) * 3, dy=(2.,) * 3, dz=(0.5,) * 3)
+        >>> v = CellVariable(mesh=m, value=m.x - 2 * m.y + 3 * m.z)
+        >>> print numerix.allclose(v.leastSquaresGrad.globalValue[..., 13], [1., -2., 3.]) # doctest: +SERIAL
+        True
         """
 
         if not hasattr(self, '_leastSquaresGrad'):
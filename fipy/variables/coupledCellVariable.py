@@ -39,8 +39,31 @@ __all__ = []
 from fipy.tools import numerix
 
 class _CoupledCellVariable(object):
-    def __init__(self, vars):
+    """
+    The values of several `CellVariable` objects, as one vector
+
+    By default, the vector holds the values of each variable in turn. If
+    `interleaved`, it holds the values of all the variables in each cell
+    in turn.
+
+        >>> from fipy import *
+        >>> mesh = Grid1D(nx=2)
+        >>> v1 = CellVariable(mesh=mesh, value=[2, 3])
+        >>> v2 = CellVariable(mesh=mesh, value=[4, 5])
+        >>> v = _CoupledCellVariable(vars=(v1, v2), interleaved=True)
+        >>> print v.value
+        [2 4 3 5]
+        >>> print v[1]
+        [3 5]
+        >>> v[:] = (6, 7, 8, 9)
+        >>> print v1
+        [6 8]
+        >>> print v2
+        [7 9]
+    """
+    def __init__(self, vars, interleaved=False):
         self.vars = vars
+        self.interleaved = interleaved
 
     @property
     def shape(self):
@@ -64,19 +87,34 @@ class _CoupledCellVariable(object):
         else:
             return meshes[0]
 
+    def _join(self, values):
+        """Copy `values`, one for each variable, into a single vector
+        """
+        if self.interleaved:
+            joined = numerix.empty(numerix.shape(values[0]) + (len(values),),
+                                   dtype=numerix.result_type(*values))
+            for i, value in enumerate(values):
+                joined[..., i] = value
+            return joined.ravel()
+        else:
+            return numerix.concatenate(values)
+
     def __getitem__(self, index):
-        return numerix.concatenate([numerix.array(var[index]) for var in self.vars])
+        return self._join([numerix.asarray(var[index]) for var in self.vars])
 
     def __setitem__(self, index, value):
         N = self.mesh.numberOfCells
+        M = len(self.vars)
         for i, var in enumerate(self.vars):
             if numerix.shape(value) == ():
                 var[index] = value
+            elif self.interleaved:
+                var[index] = value[i::M]
             else:
                 var[index] = value[i * N:(i + 1) * N]
 
     def _getValue(self):
-        return numerix.concatenate([numerix.array(var.value) for var in self.vars])
+        return self._join([numerix.asarray(var.value) for var in self.vars])
 
     def _setValue(self, value):
         self[:] = value
@@ -85,11 +123,11 @@ class _CoupledCellVariable(object):
 
     @property
     def globalValue(self):
-        return numerix.concatenate([numerix.array(var.globalValue) for var in self.vars])
+        return self._join([numerix.asarray(var.globalValue) for var in self.vars])
 
     @property
     def numericValue(self):
-        return numerix.concatenate([var.numericValue for var in self.vars])
+        return self._join([var.numericValue for var in self.vars])
 
     @property
     def unit(self):
@@ -116,13 +154,13 @@ class _CoupledCellVariable(object):
         True
 
         """
-        return numerix.array(self.value, t)
+        return numerix.asarray(self.value, t)
 
     def __neg__(self):
-        return _CoupledCellVariable([-var for var in self.vars])
+        return _CoupledCellVariable([-var for var in self.vars], interleaved=self.interleaved)
 
     def __abs__(self):
-        return _CoupledCellVariable([abs(var) for var in self.vars])
+        return _CoupledCellVariable([abs(var) for var in self.vars], interleaved=self.interleaved)
 
     def __iter__(self):
         return iter(self.value)
@@ -136,7 +174,8 @@ class _CoupledCellVariable(object):
         return self.value.ravel()
 
     def copy(self):
-        return self.__class__(vars=[var.copy() for var in self.vars])
+        return self.__class__(vars=[var.copy() for var in self.vars],
+                              interleaved=self.interleaved)
 
 def _test():
     import fipy.tests.doctestPlus
@@ -39,6 +39,8 @@ from fipy.tools.numerix import MA
 from fipy.variables.cellVariable import CellVariable
 
 from fipy.tests.doctestPlus import register_skipper
+from heapq import heappush, heappop
+import math
 import sys
 import os
 
@@ -76,12 +78,12 @@ def _parseLSMSolver():
     elif _checkForSKFMM():
         return 'skfmm'
     else:
-        return None
+        return 'fipy'
 
 LSM_SOLVER = _parseLSMSolver()
 
 register_skipper(flag="LSM",
-                 test=lambda : LSM_SOLVER is not None,
+                 test=lambda : LSM_SOLVER in ('lsmlib', 'skfmm'),
                  why="neither `lsmlib` nor `skfmm` can be found on the $PATH")
 
 register_skipper(flag="LSMLIB",
@@ -92,6 +94,301 @@ register_skipper(flag="SKFMM",
                  test=lambda : LSM_SOLVER == 'skfmm',
                  why="`skfmm` must be used to run some tests")
 
+def _solveSmall(A, rhs):
+    """Solve the small system `A x = b` for each `b` in `rhs` by Gaussian
+    elimination, or return `None` if `A` is singular.
+
+    >>> print _solveSmall([[2., 0.], [0., 4.]], ([1., 1.], [2., 4.]))
+    [[0.5, 0.25], [1.0, 1.0]]
+    >>> print _solveSmall([[1., 1.], [1., 1.]], ([1., 1.],))
+    None
+    """
+    m = len(A)
+    tol = 1e-10 * max([abs(A[i][i]) for i in range(m)])
+    M = [list(A[i]) + [b[i] for b in rhs] for i in range(m)]
+    for col in range(m):
+        pivot = max(range(col, m), key=lambda row: abs(M[row][col]))
+        if abs(M[pivot][col]) <= tol:
+            return None
+        M[col], M[pivot] = M[pivot], M[col]
+        for row in range(col + 1, m):
+            factor = M[row][col] / M[col][col]
+            M[row] = [x - factor * y for x, y in zip(M[row], M[col])]
+    solutions = []
+    for j in range(len(rhs)):
+        x = [0.] * m
+        for row in range(m - 1, -1, -1):
+            x[row] = (M[row][m + j]
+                      - sum([M[row][k] * x[k] for k in range(row + 1, m)])) / M[row][row]
+        solutions.append(x)
+    return solutions
+
+def _trialValue(offsets, values, extensions, dim):
+    r"""Return the smallest upwind solution of :math:`|\nabla \phi| = 1`
+    at a cell, and the value extended to it, from the `values` and
+    `extensions` of its known neighbors, which lie at `offsets` from it.
+
+    The `m` smallest of the neighbor values, for each `m` up to `dim`,
+    define a linear interpolant of :math:`\phi` whose gradient must have
+    unit magnitude and must point from the simplex of those neighbors
+    towards the cell.
+
+    >>> print _trialValue([(1., 0.)], [0.5], [3.], 2)
+    (1.5, 3.0)
+    >>> d, e = _trialValue([(1., 0.), (0., 1.)], [0.5, 0.5], [1., 2.], 2)
+    >>> print numerix.allclose((d, e), (0.5 + 1 / numerix.sqrt(2), 1.5))
+    True
+    >>> print _trialValue([(1., 0.), (0., 1.)], [0.5, 2.], [1., 2.], 2)
+    (1.5, 1.0)
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)[:dim]
+    gram = [[sum([a * b for a, b in zip(offsets[k], offsets[l])]) for l in order]
+            for k in order]
+    orthogonal = all([abs(gram[k][l]) <= 1e-10 * math.sqrt(gram[k][k] * gram[l][l])
+                      for k in range(len(order)) for l in range(k)])
+    best = (None, None)
+    if orthogonal:
+        # the neighbors lie along perpendicular axes, as on a grid, so
+        # the upwind quadratic can be accumulated one neighbor at a time
+        uu = uw = ww = 0.
+        for m, k in enumerate(order):
+            uu += 1. / gram[m][m]
+            uw += values[k] / gram[m][m]
+            ww += values[k]**2 / gram[m][m]
+            disc = uw**2 - uu * (ww - 1.)
+            if disc < 0:
+                break
+            d = (uw + math.sqrt(disc)) / uu
+            if d < values[k] - 1e-10 * abs(d):
+                break
+            if best[0] is None or d < best[0]:
+                weights = [max(d - values[l], 0.) / gram[n][n] for n, l in enumerate(order[:m + 1])]
+                total = sum(weights)
+                if total > 0:
+                    ext = sum([w * extensions[l] for w, l in zip(weights, order)]) / total
+                else:
+                    ext = sum([extensions[l] for l in order[:m + 1]]) / (m + 1)
+                best = (d, ext)
+        return best
+
+    for m in range(1, len(order) + 1):
+        subset = order[:m]
+        phi = [values[k] for k in subset]
+        solution = _solveSmall([row[:m] for row in gram[:m]], ([1.] * m, phi))
+        if solution is None:
+            continue
+        a, b = solution
+        uu = sum(a)
+        uw = sum(b)
+        ww = sum([p * bk for p, bk in zip(phi, b)])
+        disc = uw**2 - uu * (ww - 1.)
+        if uu <= 0 or disc < 0:
+            continue
+        d = (uw + math.sqrt(disc)) / uu
+        weights = [d * ak - bk for ak, bk in zip(a, b)]
+        if min(weights) < -1e-10 * max([abs(w) for w in weights]):
+            continue
+        if best[0] is None or d < best[0]:
+            weights = [max(w, 0.) for w in weights]
+            total = sum(weights)
+            if total > 0:
+                ext = sum([w * extensions[k] for w, k in zip(weights, subset)]) / total
+            else:
+                ext = sum([extensions[k] for k in subset]) / m
+            best = (d, ext)
+    return best
+
+def _march(phi, centers, cellToCellIDs, extension=None, narrowBandWidth=None, seedIDs=None):
+    r"""Fast march :math:`|\nabla \phi| = 1` outward from the zero level
+    set of `phi`, visiting only the cells the march reaches.
+
+    The crossings of the zero level set are looked for among the
+    neighbors of `seedIDs`, or of all the cells if `seedIDs` is `None`.
+
+    :Returns:
+      The IDs of the cells the march accepted, their unsigned distances
+      and their extended values (`None` without an `extension`)
+
+    >>> from fipy.meshes import Grid1D
+    >>> mesh = Grid1D(nx=8)
+    >>> IDs, d, e = _march(mesh.cellCenters[0].value - 2., mesh.cellCenters.value,
+    ...                    mesh._cellToCellIDs, narrowBandWidth=2., seedIDs=(0, 1, 2))
+    >>> print IDs.tolist(), d.tolist()
+    [0, 1, 2, 3] [1.5, 0.5, 0.5, 1.5]
+    """
+    dim = centers.shape[0]
+    IDs = MA.getdata(cellToCellIDs)
+    mask = MA.getmask(cellToCellIDs)
+
+    neighbors = {}
+    def neighborsOf(j):
+        if j not in neighbors:
+            row = IDs[..., j]
+            if mask is not MA.nomask:
+                row = row[~mask[..., j]]
+            neighbors[j] = [k for k in row.tolist() if k >= 0 and k != j]
+        return neighbors[j]
+
+    coords = {}
+    def coordsOf(j):
+        if j not in coords:
+            coords[j] = centers[..., j].tolist()
+        return coords[j]
+
+    if seedIDs is None:
+        seedIDs = numerix.arange(len(phi))
+    seedIDs = numerix.asarray(seedIDs, dtype=int)
+    seedNeighbors = numerix.array(MA.filled(cellToCellIDs[..., seedIDs], -1))
+    valid = (seedNeighbors >= 0) & (seedNeighbors != seedIDs)
+    negative = numerix.take(phi, seedIDs) < 0
+    crossing = valid & ((numerix.take(phi, numerix.where(valid, seedNeighbors, 0)) < 0) != negative)
+    crossingIDs = numerix.unique(numerix.concatenate((seedIDs[crossing.any(axis=0)],
+                                                      seedNeighbors[crossing])))
+
+    distance = {}
+    extended = {}
+    known = set()
+
+    for i in crossingIDs.tolist():
+        opposite = [k for k in neighborsOf(i) if (phi[k] < 0) != (phi[i] < 0)]
+        r = numerix.array([coordsOf(k) for k in opposite]) - coordsOf(i)
+        lengths = numerix.sqrt((r**2).sum(axis=1))
+        magnitude = abs(numerix.take(phi, opposite))
+        total = abs(phi[i]) + magnitude
+        s = lengths * numerix.where(total > 0, abs(phi[i]) / numerix.where(total > 0, total, 1.), 0.)
+        if s.min() > 0:
+            x = numerix.linalg.lstsq(r / lengths[..., numerix.newaxis], 1. / s, rcond=-1)[0]
+            norm = numerix.sqrt((x**2).sum())
+            distance[i] = min(1. / norm if norm > 0 else numerix.inf, s.min())
+        else:
+            distance[i] = 0.
+        known.add(i)
+        if extension is not None:
+            if phi[i] < 0:
+                weights = 1. / numerix.maximum(s, 1e-300)
+                extended[i] = (weights * numerix.take(extension, opposite)).sum() / weights.sum()
+            else:
+                extended[i] = extension[i]
+
+    heap = []
+
+    def update(j):
+        # the standard upwind update uses, along each axis, the known
+        # neighbor with the smallest value
+        upwind = {}
+        cj = coordsOf(j)
+        for k in neighborsOf(j):
+            if k in known:
+                offset = [a - b for a, b in zip(cj, coordsOf(k))]
+                axis = max(range(dim), key=lambda n: abs(offset[n]))
+                if axis not in upwind or distance[k] < distance[upwind[axis][0]]:
+                    upwind[axis] = (k, offset)
+        upwind = upwind.values()
+        value, ext = _trialValue([offset for k, offset in upwind],
+                                 [distance[k] for k, offset in upwind],
+                                 [extended.get(k, 0.) for k, offset in upwind],
+                                 dim)
+        if value is not None and value < distance.get(j, numerix.inf):
+            distance[j] = value
+            extended[j] = ext
+            heappush(heap, (value, j))
+
+    for i in list(known):
+        for j in neighborsOf(i):
+            if j not in known:
+                update(j)
+
+    while heap:
+        value, j = heappop(heap)
+        if j in known or value > distance[j]:
+            continue
+        if narrowBandWidth is not None and value > narrowBandWidth:
+            break
+        known.add(j)
+        for k in neighborsOf(j):
+            if k not in known:
+                update(k)
+
+    knownIDs = numerix.array(sorted(known), dtype=int)
+    knownDistance = numerix.array([distance[j] for j in knownIDs.tolist()], dtype=float)
+    if extension is None:
+        knownExtended = None
+    else:
+        knownExtended = numerix.array([extended[j] for j in knownIDs.tolist()], dtype=float)
+
+    return knownIDs, knownDistance, knownExtended
+
+def _fastMarch(phi, centers, cellToCellIDs, extension=None, narrowBandWidth=None):
+    r"""Solve :math:`|\nabla \phi| = 1` outward from the zero level set of
+    `phi` by the fast marching method on the cell adjacency graph, and
+    extend `extension` from the positive side of the zero level set with
+    :math:`\nabla u \cdot \nabla \phi = 0`.
+
+    The cells on either side of the zero level set take their distance
+    from the crossings along their links to opposite-sign neighbors, and a
+    heap of trial values then accepts the remaining cells in order of
+    distance. Marching stops at `narrowBandWidth`, beyond which cells are
+    set to plus or minus `narrowBandWidth`; cells the march does not reach
+    keep their values.
+
+    >>> from fipy.meshes import Grid1D
+    >>> mesh = Grid1D(dx=.5, nx=6)
+    >>> d, e = _fastMarch(numerix.array((-1., -1., -1., 1., 1., 1.)),
+    ...                   mesh.cellCenters.value, mesh._cellToCellIDs,
+    ...                   extension=numerix.array((0., 0., 0., 2., 0., 0.)))
+    >>> print d.tolist()
+    [-1.25, -0.75, -0.25, 0.25, 0.75, 1.25]
+    >>> print e.tolist()
+    [2.0, 2.0, 2.0, 2.0, 2.0, 2.0]
+    >>> d, e = _fastMarch(numerix.array((-1., -1., -1., 1., 1., 1.)),
+    ...                   mesh.cellCenters.value, mesh._cellToCellIDs,
+    ...                   narrowBandWidth=0.8)
+    >>> print d.tolist()
+    [-0.8, -0.75, -0.25, 0.25, 0.75, 0.8]
+    """
+    phi = numerix.array(phi, dtype=float)
+    if extension is not None:
+        extension = numerix.array(extension, dtype=float)
+
+    knownIDs, knownDistance, knownExtended = _march(phi, centers, cellToCellIDs,
+                                                    extension=extension,
+                                                    narrowBandWidth=narrowBandWidth)
+
+    if narrowBandWidth is None:
+        distance = abs(phi)
+    else:
+        distance = numerix.zeros(len(phi), dtype=float) + narrowBandWidth
+    distance[knownIDs] = knownDistance
+    distance = numerix.where(phi < 0, -distance, distance)
+
+    if extension is not None:
+        extension[knownIDs] = knownExtended
+
+    return distance, extension
+
+def _cellGradient(mesh, value, cellIDs):
+    """Gauss gradient of the unconstrained cell `value` at `cellIDs` only,
+    visiting just the faces of those cells rather than the whole mesh.
+
+    >>> from fipy.meshes import Grid2D
+    >>> mesh = Grid2D(nx=3, ny=3)
+    >>> x, y = mesh.cellCenters
+    >>> var = CellVariable(mesh=mesh, value=x**2 + x * y)
+    >>> cellIDs = numerix.array((0, 4, 8))
+    >>> print numerix.allclose(_cellGradient(mesh, var.value, cellIDs),
+    ...                        var.grad.value[..., cellIDs])
+    True
+    """
+    faceIDs = MA.filled(mesh.cellFaceIDs[..., cellIDs], 0)
+    orientations = MA.filled(mesh._cellToFaceOrientations[..., cellIDs], 0)
+    id1, id2 = mesh._adjacentCellIDs
+    id1 = numerix.take(id1, faceIDs)
+    id2 = numerix.take(id2, faceIDs)
+    alpha = numerix.take(mesh._faceToCellDistanceRatio, faceIDs)
+    faceValues = (numerix.take(value, id2) - numerix.take(value, id1)) * alpha + numerix.take(value, id1)
+    areaProjections = numerix.take(mesh._areaProjections, faceIDs, axis=-1)
+    volumes = numerix.take(numerix.asarray(mesh.cellVolumes), cellIDs)
+    return numerix.sum(orientations * areaProjections * faceValues, axis=1) / volumes
 
 __all__ = ["DistanceVariable"]
 
@@ -253,8 +550,55 @@ class DistanceVariable(CellVariable):
     >>> print numerix.allclose(var, answer, rtol=1e-9) #doctest: +SKFMM
     True
 
+    Meshes that neither LSMLIB nor Scikit-fmm can handle, such as 3D grids
+    and unstructured meshes, use a built-in first-order fast marching
+    method on the cell adjacency of the mesh.
+
+    >>> from fipy.meshes import Grid3D
+    >>> mesh = Grid3D(nx=10, ny=10, nz=10, dx=.1, dy=.1, dz=.1,
+    ...               communicator=serialComm)
+    >>> x, y, z = mesh.cellCenters
+    >>> r = numerix.sqrt((x - .5)**2 + (y - .5)**2 + (z - .5)**2)
+    >>> var = DistanceVariable(mesh=mesh, value=10 * (r - .3))
+    >>> var.calcDistanceFunction()
+    >>> print numerix.allclose(var, r - .3, atol=.1)
+    True
+
+    Marching can be limited to a narrow band around the zero level set,
+    beyond which the values are set to plus or minus the band width.
+
+    >>> var = DistanceVariable(mesh=mesh, value=10 * (r - .3))
+    >>> var.calcDistanceFunction(narrowBandWidth=.15)
+    >>> print max(abs(var.value))
+    0.15
+    >>> print numerix.allclose(var, numerix.clip(r - .3, -.15, .15), atol=.1)
+    True
+
+    The extension velocity is extended from the cells on the positive side
+    of the zero level set.
+
+    >>> mesh = Grid3D(nx=2, ny=2, nz=4, communicator=serialComm)
+    >>> var = DistanceVariable(mesh=mesh, value=(-1., -1., -1., -1.,
+    ...                                          -1., -1., -1., -1.,
+    ...                                           1.,  1.,  1.,  1.,
+    ...                                           1.,  1.,  1.,  1.))
+    >>> extensionVar = CellVariable(mesh=mesh, value=(0., 0., 0., 0.,
+    ...                                               0., 0., 0., 0.,
+    ...                                               1., 2., 3., 4.,
+    ...                                               0., 0., 0., 0.))
+    >>> var.extendVariable(extensionVar)
+    >>> print extensionVar.value.tolist()
+    [1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0]
+
+    `extendVariable` leaves `var` untouched, so it is redistanced
+    separately.
+
+    >>> var.calcDistanceFunction()
+    >>> print var.value.tolist()
+    [-1.5, -1.5, -1.5, -1.5, -0.5, -0.5, -0.5, -0.5, 0.5, 0.5, 0.5, 0.5, 1.5, 1.5, 1.5, 1.5]
+
     """
-    def __init__(self, mesh, name = '', value = 0., unit = None, hasOld = 0):
+    def __init__(self, mesh, name = '', value = 0., unit = None, hasOld = 0, narrowBandWidth = None):
         """
         Creates a `distanceVariable` object.
 
@@ -264,15 +608,21 @@ class DistanceVariable(CellVariable):
 	  - `value`: The initial value.
 	  - `unit`: the physical units of the variable
           - `hasOld`: Whether the variable maintains an old value.
+          - `narrowBandWidth`: If given, the `AdvectionTerm`, the
+            `SurfactantConvectionVariable` and the `cellInterfaceAreas`
+            only visit the cells within this distance of the zero level
+            set. It should span a few cells.
 
         """
+        self.narrowBandWidth = narrowBandWidth
+        self._narrowBand = None
         CellVariable.__init__(self, mesh, name = name, value = value, unit = unit, hasOld = hasOld)
         self._markStale()
 
     def _calcValue(self):
         return self._value
 
-    def extendVariable(self, extensionVariable, order=2):
+    def extendVariable(self, extensionVariable, order=2, narrowBandWidth=None):
         """
 
         Calculates the extension of `extensionVariable` from the zero
@@ -281,8 +631,24 @@ class DistanceVariable(CellVariable):
         :Parameters:
           - `extensionVariable`: The variable to extend from the zero
             level set.
+          - `order`: The order of accuracy of LSMLIB or Scikit-fmm. The
+            built-in fast marching method is first order.
+          - `narrowBandWidth`: If given, only extend within this distance
+            of the zero level set, using the built-in fast marching method.
+            Defaults to the `narrowBandWidth` of the variable.
 
         """
+        if narrowBandWidth is None:
+            narrowBandWidth = self.narrowBandWidth
+
+        if not self._usesLSMSolver(narrowBandWidth):
+            tmp, extensionValue = _fastMarch(self._value,
+                                             self.mesh.cellCenters.value,
+                                             self.mesh._cellToCellIDs,
+                                             extension=numerix.array(extensionVariable.value),
+                                             narrowBandWidth=narrowBandWidth)
+            extensionVariable[:] = extensionValue
+            return
 
         dx, shape = self.getLSMshape()
         extensionValue = numerix.reshape(extensionVariable.value, shape)
@@ -290,10 +656,8 @@ class DistanceVariable(CellVariable):
 
         if LSM_SOLVER == 'lsmlib':
             from pylsmlib import computeExtensionFields as extension_velocities
-        elif LSM_SOLVER == 'skfmm':
-            from skfmm import extension_velocities
         else:
-            raise Exception, "Neither `lsmlib` nor `skfmm` can be found on the $PATH"
+            from skfmm import extension_velocities
 
         tmp, extensionValue = extension_velocities(phi, extensionValue, ext_mask=phi < 0., dx=dx, order=order)
         extensionVariable[:] = extensionValue.flatten()
@@ -314,28 +678,112 @@ class DistanceVariable(CellVariable):
 
         return dx, shape
 
-    def calcDistanceFunction(self, order=2):
+    def _usesLSMSolver(self, narrowBandWidth=None):
+        """Whether LSMLIB or Scikit-fmm can be used rather than the
+        built-in fast marching method."""
+        from fipy.meshes.topologies.gridTopology import _GridTopology
+        usable = (narrowBandWidth is None
+                  and isinstance(self.mesh.topology, _GridTopology)
+                  and self.mesh.dim < 3)
+        if usable and LSM_SOLVER is None:
+            raise Exception, "The requested `lsmlib` or `skfmm` can not be found on the $PATH"
+        return usable and LSM_SOLVER in ('lsmlib', 'skfmm')
+
+    def calcDistanceFunction(self, order=2, narrowBandWidth=None):
         """
         Calculates the `distanceVariable` as a distance function.
 
         :Parameters:
           - `order`: The order of accuracy for the distance funtion
-            calculation, either 1 or 2.
+            calculation, either 1 or 2. The built-in fast marching
+            method is first order.
+          - `narrowBandWidth`: If given, only calculate the distance within
+            this distance of the zero level set, using the built-in fast
+            marching method. Defaults to the `narrowBandWidth` of the
+            variable.
 
         """
+        if narrowBandWidth is None:
+            narrowBandWidth = self.narrowBandWidth
+
+        if not self._usesLSMSolver(narrowBandWidth):
+            self._value, tmp = _fastMarch(self._value,
+                                          self.mesh.cellCenters.value,
+                                          self.mesh._cellToCellIDs,
+                                          narrowBandWidth=narrowBandWidth)
+            self._markFresh()
+            return
 
         dx, shape = self.getLSMshape()
 
         if LSM_SOLVER == 'lsmlib':
             from pylsmlib import distance
-        elif LSM_SOLVER == 'skfmm':
-            from skfmm import distance
         else:
-            raise Exception, "Neither `lsmlib` nor `skfmm` can be found on the $PATH"
+            from skfmm import distance
 
         self._value = distance(numerix.reshape(self._value, shape), dx=dx, order=order).flatten()
         self._markFresh()
 
+    @property
+    def _narrowBandCellIDs(self):
+        """
+        The IDs of the cells within `narrowBandWidth` of the zero level
+        set, or `None` if there is no narrow band. The band is measured
+        by fast marching from the zero level set, so it does not rely on
+        the values being a distance function, and it is only rebuilt
+        once a cell on the edge of the band changes sign, i.e., when the
+        interface is about to leave the band. The interface is then still
+        within one cell of the old band, so the rebuild only looks for it
+        there and only visits the cells of the new band.
+
+        >>> from fipy.meshes import Grid1D
+        >>> mesh = Grid1D(nx=10)
+        >>> x = mesh.cellCenters[0]
+        >>> var = DistanceVariable(mesh=mesh, value=x - 3., narrowBandWidth=2.)
+        >>> print var._narrowBandCellIDs
+        [1 2 3 4]
+        >>> var.setValue(x - 4.1)
+        >>> print var._narrowBandCellIDs
+        [1 2 3 4]
+        >>> var.setValue(x - 5.2)
+        >>> print var._narrowBandCellIDs
+        [3 4 5 6]
+        >>> print DistanceVariable(mesh=mesh, value=x - 3.)._narrowBandCellIDs
+        None
+
+        """
+        if self.narrowBandWidth is None:
+            return None
+
+        value = numerix.asarray(self._value)
+
+        seedIDs = None
+        if self._narrowBand is not None:
+            cellIDs, edgeIDs, edgeSigns, seedIDs = self._narrowBand
+            if (numerix.take(value, edgeIDs) > 0).tolist() == edgeSigns.tolist():
+                return cellIDs
+
+        cellIDs, distance, tmp = _march(value,
+                                        self.mesh.cellCenters.value,
+                                        self.mesh._cellToCellIDs,
+                                        narrowBandWidth=self.narrowBandWidth,
+                                        seedIDs=seedIDs)
+        if seedIDs is not None and len(cellIDs) == 0:
+            cellIDs, distance, tmp = _march(value,
+                                            self.mesh.cellCenters.value,
+                                            self.mesh._cellToCellIDs,
+                                            narrowBandWidth=self.narrowBandWidth)
+        cellIDs = cellIDs[distance < self.narrowBandWidth]
+
+        neighbors = numerix.array(MA.filled(self.mesh._cellToCellIDs[..., cellIDs], -1))
+        outside = (neighbors >= 0) & ~numerix.in1d(neighbors.ravel(), cellIDs).reshape(neighbors.shape)
+        edgeIDs = cellIDs[outside.any(axis=0)]
+        seedIDs = numerix.unique(numerix.concatenate((cellIDs, neighbors[outside])))
+
+        self._narrowBand = (cellIDs, edgeIDs, numerix.take(value, edgeIDs) > 0, seedIDs)
+
+        return cellIDs
+
     @property
     def cellInterfaceAreas(self):
         """
@@ -420,16 +868,55 @@ class DistanceVariable(CellVariable):
 
         """
 
+        return self._getCellInterfaceNormals()
+
+    def _getCellInterfaceNormals(self, cellIDs=None):
+        """
+        Returns the interface normals over the faces of `cellIDs`, or of
+        all the cells if `cellIDs` is `None`. Given `cellIDs`, the interface
+        flag and the normals are only evaluated on the faces of those cells.
+
+           >>> from fipy.meshes import Grid2D
+           >>> mesh = Grid2D(nx = 8, ny = 8)
+           >>> x, y = mesh.cellCenters
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = x + y - 6.5)
+           >>> cellIDs = numerix.array((20, 21, 27, 28, 29, 36))
+           >>> full = MA.filled(distanceVariable._getCellInterfaceNormals(), 0)
+           >>> print numerix.allclose(distanceVariable._getCellInterfaceNormals(cellIDs),
+           ...                        full[..., cellIDs])
+           True
+        """
+
         dim = self.mesh.dim
 
-        valueOverFaces = numerix.repeat(self._cellValueOverFaces[numerix.newaxis, ...], dim, axis=0)
-        cellFaceIDs = self.mesh.cellFaceIDs
-        if cellFaceIDs.shape[-1] > 0:
-            interfaceNormals = self._interfaceNormals[...,cellFaceIDs]
-        else:
-            interfaceNormals = 0
+        if cellIDs is None:
+            cellValueOverFaces = self._cellValueOverFaces
+            cellFaceIDs = self.mesh.cellFaceIDs
+
+            valueOverFaces = numerix.repeat(cellValueOverFaces[numerix.newaxis, ...], dim, axis=0)
+            if cellFaceIDs.shape[-1] > 0:
+                interfaceNormals = self._interfaceNormals[...,cellFaceIDs]
+            else:
+                interfaceNormals = 0
+
+            return MA.where(valueOverFaces < 0, 0, interfaceNormals)
+
+        cellFaceIDs = self.mesh.cellFaceIDs[..., cellIDs]
+        faceIDs = numerix.array(MA.filled(cellFaceIDs, 0))
+        value = numerix.asarray(self._value)
+        id1, id2 = self.mesh._adjacentCellIDs
+        val1 = numerix.take(value, numerix.take(id1, faceIDs))
+        val2 = numerix.take(value, numerix.take(id2, faceIDs))
+
+        flagged = ((val1 * val2 < 0)
+                   & ~MA.getmaskarray(cellFaceIDs)
+                   & (numerix.take(value, cellIDs) >= 0)[numerix.newaxis, ...])
+
+        interfaceNormals = numerix.zeros((dim,) + faceIDs.shape, 'd')
+        interfaceNormals[..., flagged] = self._faceLevelSetNormals(faceIDs[flagged])
 
-        return MA.where(valueOverFaces < 0, 0, interfaceNormals)
+        return interfaceNormals
 
     @property
     def _interfaceNormals(self):
@@ -539,8 +1026,34 @@ class DistanceVariable(CellVariable):
            ...                              (0, 0, v, v, 0, 0, 0, v, 0, 0, v, 0)))
            >>> print numerix.allclose(distanceVariable._levelSetNormals, answer)
            True
+
+        With a narrow band, the normals are only calculated on the faces of
+        the cells in the band.
+
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = (-0.5, 0.5, 0.5, 1.5),
+           ...                                     narrowBandWidth = 10.)
+           >>> print numerix.allclose(distanceVariable._levelSetNormals, answer)
+           True
+           >>> mesh = Grid2D(nx = 8, ny = 1)
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = mesh.cellCenters[0] - 2.,
+           ...                                     narrowBandWidth = 1.)
+           >>> answer = numerix.zeros(mesh.numberOfFaces, 'd')
+           >>> answer[17:20] = 1.
+           >>> print numerix.allclose(distanceVariable._levelSetNormals[0], answer)
+           True
         """
 
+        cellIDs = self._narrowBandCellIDs
+
+        if cellIDs is not None:
+            mesh = self.mesh
+            faceIDs = numerix.unique(MA.compressed(mesh.cellFaceIDs[..., cellIDs]))
+            normals = numerix.zeros((mesh.dim, mesh.numberOfFaces), 'd')
+            normals[..., faceIDs] = self._faceLevelSetNormals(faceIDs)
+            return normals
+
         faceGrad = self.grad.arithmeticFaceValue
         faceGradMag = numerix.array(faceGrad.mag)
         faceGradMag = numerix.where(faceGradMag > 1e-10,
@@ -555,6 +1068,46 @@ class DistanceVariable(CellVariable):
 
         return faceGrad / faceGradMag
 
+    def _faceLevelSetNormals(self, faceIDs):
+        """
+        Return the level set normals on `faceIDs` only, which are zero on
+        exterior faces. The gradient is only taken in the cells adjacent
+        to those faces.
+
+           >>> from fipy.meshes import Grid2D
+           >>> mesh = Grid2D(dx = .5, dy = .5, nx = 2, ny = 2)
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = (-0.5, 0.5, 0.5, 1.5))
+           >>> faceIDs = numerix.array((2, 3, 7, 10, 0))
+           >>> print numerix.allclose(distanceVariable._faceLevelSetNormals(faceIDs),
+           ...                        distanceVariable._levelSetNormals[..., faceIDs])
+           True
+        """
+        mesh = self.mesh
+        if len(faceIDs) == 0:
+            return numerix.zeros((mesh.dim, 0), 'd')
+
+        id1, id2 = mesh._adjacentCellIDs
+        id1 = numerix.take(id1, faceIDs)
+        id2 = numerix.take(id2, faceIDs)
+        gradIDs, index = numerix.unique(numerix.concatenate((id1, id2)), return_inverse=True)
+
+        cellGrad = _cellGradient(mesh, numerix.asarray(self._value), gradIDs)
+        grad1 = cellGrad[..., index[:len(faceIDs)]]
+        grad2 = cellGrad[..., index[len(faceIDs):]]
+
+        alpha = numerix.take(mesh._faceToCellDistanceRatio, faceIDs)
+        faceGrad = (grad2 - grad1) * alpha + grad1
+        faceGradMag = numerix.sqrt(numerix.sum(faceGrad**2, axis=0))
+        faceGradMag = numerix.where(faceGradMag > 1e-10,
+                                    faceGradMag,
+                                    1e-10)
+
+        ## set faceGrad zero on exterior faces, which have only one cell
+        faceGrad[..., id1 == id2] = 0.
+
+        return faceGrad / faceGradMag
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
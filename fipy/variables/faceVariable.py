@@ -66,11 +66,6 @@ class FaceVariable(_MeshVariable):
                                               name=self.name + "_copy",
                                               value=self.value)
 
-    @property
-    def globalValue(self):
-        return self._getGlobalValue(self.mesh._localNonOverlappingFaceIDs,
-                                    self.mesh._globalNonOverlappingFaceIDs)
-
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
 
@@ -105,6 +100,10 @@ class FaceVariable(_MeshVariable):
     def _localNonOverlappingIDs(self):
         return self.mesh._localNonOverlappingFaceIDs
 
+    @property
+    def _globalNonOverlappingIDs(self):
+        return self.mesh._globalNonOverlappingFaceIDs
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
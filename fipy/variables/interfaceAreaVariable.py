@@ -51,6 +51,36 @@ class _InterfaceAreaVariable(CellVariable):
         self.distanceVar = self._requires(distanceVar)
 
     def _calcValue(self):
-        normals = numerix.array(MA.filled(self.distanceVar._cellInterfaceNormals, 0))
-        areas = numerix.array(MA.filled(self.mesh._cellAreaProjections, 0))
-        return numerix.sum(abs(numerix.dot(normals, areas)), axis=0)
+        """
+        Only the cells in the narrow band of `distanceVar`, if it has one,
+        are visited.
+
+        >>> from fipy.meshes import Grid2D
+        >>> from fipy.variables.distanceVariable import DistanceVariable
+        >>> mesh = Grid2D(dx=0.05, dy=0.05, nx=20, ny=20)
+        >>> x, y = mesh.cellCenters
+        >>> rad = numerix.sqrt((x - .5)**2 + (y - .5)**2) - .25
+        >>> full = DistanceVariable(mesh=mesh, value=rad).cellInterfaceAreas
+        >>> band = DistanceVariable(mesh=mesh, value=rad,
+        ...                         narrowBandWidth=0.15).cellInterfaceAreas
+        >>> print numerix.allclose(band, full)
+        True
+        """
+        cellIDs = self.distanceVar._narrowBandCellIDs
+        normals = numerix.array(MA.filled(self.distanceVar._getCellInterfaceNormals(cellIDs), 0))
+        areas = self.mesh._cellAreaProjections
+        if cellIDs is None:
+            areas = numerix.array(MA.filled(areas, 0))
+            return numerix.sum(abs(numerix.dot(normals, areas)), axis=0)
+
+        areas = numerix.array(MA.filled(areas[..., cellIDs], 0))
+        value = numerix.zeros(self.mesh.numberOfCells, 'd')
+        value[cellIDs] = numerix.sum(abs(numerix.dot(normals, areas)), axis=0)
+        return value
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -144,21 +144,179 @@ class _MeshVariable(Variable):
             value = value.value
         return value
 
-    def _getGlobalValue(self, localIDs, globalIDs):
+    def _getGlobalValue(self, localIDs, globalIDs, root=None):
         localValue = self.value
-        if self.mesh.communicator.Nproc > 1:
+        communicator = self.mesh.communicator
+        if communicator.Nproc > 1:
             if localValue.shape[-1] != 0:
                 localValue = localValue[..., localIDs]
-            globalIDs = numerix.concatenate(self.mesh.communicator.allgather(globalIDs))
 
-            globalValue = numerix.empty(localValue.shape[:-1] + (max(globalIDs) + 1,),
+            if root is None:
+                pieces = communicator.allgather((globalIDs, localValue))
+            else:
+                pieces = communicator.gather((globalIDs, localValue), root=root)
+                if communicator.procID != root:
+                    return None
+
+            gatheredIDs = numerix.concatenate([ids for ids, v in pieces])
+            gatheredValue = numerix.concatenate([v for ids, v in pieces], axis=-1)
+
+            globalValue = numerix.empty(localValue.shape[:-1] + (gatheredIDs.max() + 1,),
                                         dtype=numerix.obj2sctype(localValue))
-            globalValue[..., globalIDs] = numerix.concatenate(self.mesh.communicator.allgather(localValue), axis=-1)
+            globalValue[..., gatheredIDs] = gatheredValue
 
             return globalValue
         else:
             return localValue
 
+    @property
+    def globalValue(self):
+        """Concatenate and return values from all processors
+
+        When running on a single processor, the result is identical to
+        :attr:`~fipy.variables.variable.Variable.value`.
+        """
+        return self._getGlobalValue(self._localNonOverlappingIDs,
+                                    self._globalNonOverlappingIDs)
+
+    def gatherValue(self, root=0):
+        """Concatenate the values from all processors on processor `root`
+
+        Unlike :attr:`globalValue`, the values of the whole mesh are only
+        assembled in the memory of processor `root`; the other processors
+        return `None`. If `root` is `None`, every processor gets the values,
+        as from :attr:`globalValue`. When running on a single processor,
+        the result is identical to
+        :attr:`~fipy.variables.variable.Variable.value`.
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=4)
+            >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+            >>> value = v.gatherValue()
+            >>> print value # doctest: +PROCESSOR_0
+            [ 0.5  1.5  2.5  3.5]
+            >>> print m.communicator.procID == 0 or value is None
+            True
+        """
+        return self._getGlobalValue(self._localNonOverlappingIDs,
+                                    self._globalNonOverlappingIDs,
+                                    root=root)
+
+    def iterGlobalValue(self, chunkSize=2**20, root=0):
+        """Stream the values from all processors to processor `root` in
+        chunks of at most `chunkSize` elements
+
+        Each step gathers the elements with the next `chunkSize` global
+        IDs, so that processor `root` can, e.g., write them out before
+        the next chunk arrives and never holds the values of the whole
+        mesh. Every processor must iterate to the end; the chunk is `None`
+        on processors other than `root`.
+
+        :Returns:
+          A generator of the global ID of the first element of each chunk
+          and the chunk of values
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=5)
+            >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+            >>> chunks = list(v.iterGlobalValue(chunkSize=2))
+            >>> for start, chunk in chunks:
+            ...     print start, chunk # doctest: +PROCESSOR_0
+            0 [ 0.5  1.5]
+            2 [ 2.5  3.5]
+            4 [ 4.5]
+
+        In parallel, only processor `root` assembles the chunks
+
+            >>> print [start for start, chunk in chunks]
+            [0, 2, 4]
+            >>> print numerix.concatenate([chunk for start, chunk in chunks]) # doctest: +PROCESSOR_0_OF_2
+            [ 0.5  1.5  2.5  3.5  4.5]
+            >>> print [chunk is None for start, chunk in chunks] # doctest: +PROCESSOR_1_OF_2
+            [True, True, True]
+        """
+        communicator = self.mesh.communicator
+
+        localValue = self.value
+        if localValue.shape[-1] != 0:
+            localValue = localValue[..., self._localNonOverlappingIDs]
+        globalIDs = numerix.asarray(self._globalNonOverlappingIDs)
+
+        order = numerix.argsort(globalIDs)
+        globalIDs = globalIDs[order]
+        localValue = localValue[..., order]
+
+        N = self._globalNumberOfElements
+        for start in range(0, N, chunkSize):
+            stop = min(start + chunkSize, N)
+            first, last = numerix.searchsorted(globalIDs, (start, stop))
+            IDs = globalIDs[first:last]
+            value = localValue[..., first:last]
+
+            if communicator.Nproc > 1:
+                pieces = communicator.gather((IDs, value), root=root)
+                if communicator.procID != root:
+                    yield start, None
+                    continue
+                IDs = numerix.concatenate([ids for ids, v in pieces])
+                value = numerix.concatenate([v for ids, v in pieces], axis=-1)
+
+            chunk = numerix.empty(localValue.shape[:-1] + (stop - start,),
+                                  dtype=numerix.obj2sctype(localValue))
+            chunk[..., IDs - start] = value
+
+            yield start, chunk
+
+    def _takeGlobal(self, globalIDs):
+        """The values of the elements with the given `globalIDs`, wherever
+        they are in the mesh
+
+        Each processor fills in the values of the elements it owns and
+        the result is summed over the processors, so only `len(globalIDs)`
+        values are communicated rather than the values of the whole mesh.
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=6)
+            >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+            >>> print v._takeGlobal((5, 0, 3))
+            [ 5.5  0.5  3.5]
+
+        Processors that own no elements still take part
+
+            >>> m = Grid1D(nx=1)
+            >>> v = CellVariable(mesh=m, value=m.cellCenters[0])
+            >>> print v._takeGlobal((0,))
+            [ 0.5]
+        """
+        communicator = self.mesh.communicator
+        globalIDs = numerix.asarray(globalIDs)
+
+        if communicator.Nproc == 1:
+            return self.value[..., globalIDs]
+
+        ownedIDs = numerix.asarray(self._globalNonOverlappingIDs)
+        order = numerix.argsort(ownedIDs)
+        ownedIDs = ownedIDs[order]
+        localIDs = numerix.asarray(self._localNonOverlappingIDs)[order]
+
+        value = self.value
+        taken = numerix.zeros(value.shape[:-1] + (globalIDs.size,),
+                              dtype=numerix.obj2sctype(value))
+
+        # a processor that owns no elements contributes only zeros,
+        # but must still take part in the sum
+        if len(ownedIDs) > 0:
+            position = numerix.searchsorted(ownedIDs, globalIDs.ravel())
+            position = numerix.minimum(position, len(ownedIDs) - 1)
+            owned = numerix.nonzero(numerix.take(ownedIDs, position) == globalIDs.ravel())[0]
+            taken[..., owned] = value[..., localIDs[position[owned]]]
+
+        # every element is owned by exactly one processor, so summing
+        # the elementwise contributions of all processors fills them in
+        taken = communicator.sum(taken.reshape((1, -1)), axis=0)
+
+        return taken.reshape(value.shape[:-1] + globalIDs.shape)
+
     def __str__(self):
         return str(self.globalValue)
 
@@ -71,12 +71,45 @@ def _OperatorVariableClass(baseClass=object):
             if not self.canInline:
                 return self._calcValue_()
             else:
-                from fipy.tools import inline
+                from fipy.tools import inline, fused
                 if inline.doInline:
                     return self._execInline(comment=self.comment)
+                elif fused.doFuse:
+                    return self._execFused()
                 else:
                     return self._calcValue_()
 
+        def _execFused(self):
+            """
+            Evaluate the whole tree of stale, uncached operators below this
+            one as a single fused kernel, or operator by operator if it
+            cannot be fused.
+
+                >>> from fipy import *
+                >>> m = Grid1D(nx=4)
+                >>> x = CellVariable(mesh=m, value=m.x)
+                >>> y = numerix.exp(-x) * (x - 1)**2 / 2. + numerix.sin(x)
+                >>> print numerix.allclose(y._execFused(),
+                ...                        y._calcValue_()) # doctest: +NUMEXPR
+                True
+
+            `%` is not fused, as :mod:`numexpr` takes the sign of the
+            dividend, but it still evaluates
+
+                >>> print (x % 2. - 1)._execFused()
+                [-0.5  0.5 -0.5  0.5]
+            """
+            if self.shape == ():
+                return self._calcValue_()
+
+            from fipy.tools import fused
+            argDict = {}
+            try:
+                expression = self._getNumexprString(argDict=argDict, freshen=True)
+                return fused._evaluate(expression, argDict, self.shape)
+            except (fused._FusionError, SyntaxError, TypeError):
+                return self._calcValue_()
+
         def _calcValue_(self):
             pass
 
@@ -94,12 +127,22 @@ def _OperatorVariableClass(baseClass=object):
 
             return s
 
+        def _getNumexprString(self, argDict={}, id="", freshen=False):
+            if self.canInline:
+                s = self._getRepresentation(style="numexpr", argDict=argDict, id=id, freshen=freshen)
+            else:
+                s = baseClass._getNumexprString(self, argDict=argDict, id=id)
+            if freshen:
+                self._markFresh()
+
+            return s
+
         def _getRepresentation(self, style="__repr__", argDict={}, id=id, freshen=False):
             """
 
             :Parameters:
 
-              - `style`: one of `'__repr__'`, `'name'`, `'TeX'`, `'C'`
+              - `style`: one of `'__repr__'`, `'name'`, `'TeX'`, `'C'`, `'numexpr'`
 
             """
             import opcode
@@ -137,12 +180,23 @@ def _OperatorVariableClass(baseClass=object):
                         result = v._variableClass._getCstring(v, argDict,
                                                                    id=id + str(i),
                                                                    freshen=False)
+                elif style == "numexpr":
+                    if not v._isCached() and v.shape != ():
+                        result = v._getNumexprString(argDict, id=id + str(i), freshen=freshen)
+                        v._value = None
+                    else:
+                        result = v._variableClass._getNumexprString(v, argDict,
+                                                                        id=id + str(i),
+                                                                        freshen=False)
                 else:
                     raise SyntaxError, "Unknown style: %s" % style
 
                 return result
 
             if isinstance(self.op, numerix.ufunc):
+                if style == "numexpr":
+                    from fipy.tools import fused
+                    return fused._call(self.op.__name__, [__var(i) for i in range(len(self.var))])
                 return "%s(%s)" % (self.op.__name__, ", ".join([__var(i) for i in range(len(self.var))]))
 
             if sys.version_info < (3,0):
@@ -174,6 +228,8 @@ def _OperatorVariableClass(baseClass=object):
                     s = stack.pop()
                     if style == 'C':
                         return s.replace('numerix.', '').replace('arc', 'a')
+                    elif style == 'numexpr':
+                        return s.replace('numerix.', '')
                     else:
                         return s
                 elif opcode.opname[bytecode] == 'LOAD_CONST':
@@ -195,7 +251,11 @@ def _OperatorVariableClass(baseClass=object):
                     for j in range(bytecodes.pop(0)):
                         # positional parameters
                         args.insert(0, stack.pop())
-                    stack.append(stack.pop() + "(" + ", ".join(args) + ")")
+                    if style == "numexpr":
+                        from fipy.tools import fused
+                        stack.append(fused._call(stack.pop(), args))
+                    else:
+                        stack.append(stack.pop() + "(" + ", ".join(args) + ")")
                 elif opcode.opname[bytecode] == 'LOAD_DEREF':
                     free = self.op.func_code.co_cellvars + self.op.func_code.co_freevars
                     stack.append(free[_popIndex()])
@@ -103,6 +103,15 @@ class SurfactantConvectionVariable(FaceVariable):
            >>> print numerix.allclose(SurfactantConvectionVariable(distanceVar).globalValue, answer)
            True
 
+        A narrow band that covers the interface gives the same answer:
+
+           >>> distanceVar = DistanceVariable(mesh, value = (1.5, .5 , 1.5,
+           ...                                           .5 , -.5, .5 ,
+           ...                                           1.5, .5 , 1.5),
+           ...                                narrowBandWidth = 1.)
+           >>> print numerix.allclose(SurfactantConvectionVariable(distanceVar).globalValue, answer)
+           True
+
         """
 
         FaceVariable.__init__(self, mesh=distanceVar.mesh, name='surfactant convection', rank=1)
@@ -114,11 +123,22 @@ class SurfactantConvectionVariable(FaceVariable):
         M = self.mesh._maxFacesPerCell
         dim = self.mesh.dim
         cellFaceIDs = self.mesh.cellFaceIDs
+        cellNormals = self.mesh._cellNormals
+        volumes = numerix.array(self.mesh.cellVolumes)
+        phi = numerix.array(self.distanceVar)
+
+        ## only visit the cells in the narrow band, if there is one
+        cellIDs = self.distanceVar._narrowBandCellIDs
+        if cellIDs is not None:
+            cellFaceIDs = cellFaceIDs[..., cellIDs]
+            cellNormals = cellNormals[..., cellIDs]
+            volumes = numerix.take(volumes, cellIDs)
+            phi = numerix.take(phi, cellIDs)
 
         faceNormalAreas = self.distanceVar._levelSetNormals * self.mesh._faceAreas
 
         cellFaceNormalAreas = numerix.array(MA.filled(numerix.take(faceNormalAreas, cellFaceIDs, axis=-1), 0))
-        norms = numerix.array(MA.filled(MA.array(self.mesh._cellNormals), 0))
+        norms = numerix.array(MA.filled(MA.array(cellNormals), 0))
 
         alpha = numerix.dot(cellFaceNormalAreas, norms)
         alpha = numerix.where(alpha > 0, alpha, 0)
@@ -127,10 +147,9 @@ class SurfactantConvectionVariable(FaceVariable):
         alphasum += (alphasum < 1e-100) * 1.0
         alpha = alpha / alphasum
 
-        phi = numerix.repeat(self.distanceVar[numerix.newaxis, ...], M, axis=0)
+        phi = numerix.repeat(phi[numerix.newaxis, ...], M, axis=0)
         alpha = numerix.where(phi > 0., 0, alpha)
 
-        volumes = numerix.array(self.mesh.cellVolumes)
         alpha = alpha * volumes * norms
 
         value = numerix.zeros((dim, Nfaces),'d')
@@ -64,6 +64,7 @@ def _suite():
             'fipy.variables.surfactantConvectionVariable',
             'fipy.variables.surfactantVariable',
             'fipy.variables.levelSetDiffusionVariable',
+            'fipy.variables.interfaceAreaVariable',
             'fipy.variables.distanceVariable'
         ))
 
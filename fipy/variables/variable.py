@@ -453,6 +453,26 @@ class Variable(object):
          else:
              return identifier + self._getCIndexString(shape)
 
+    def _getNumexprString(self, argDict={}, id="", freshen=None):
+        """
+        Generate the expression and dictionary of operands to be used by
+        :mod:`numexpr`
+
+            >>> argDict = {}
+            >>> (Variable((1.,2.)) * Variable(3.) + 1.)._getNumexprString(argDict=argDict)
+            '((var00 * var01) + var1)'
+            >>> print argDict['var00'], argDict['var01'], argDict['var1']
+            [ 1.  2.] 3.0 1.0
+
+        freshen is ignored
+        """
+
+        identifier = 'var%s' % (id)
+
+        argDict[identifier] = self.value
+
+        return identifier
+
     def tostring(self, max_line_width=75, precision=8, suppress_small=False, separator=' '):
         return numerix.tostring(self.value,
                                 max_line_width=max_line_width,
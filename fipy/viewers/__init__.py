@@ -15,10 +15,12 @@ except:
     pass
 
 from fipy.viewers.multiViewer import *
+from fipy.viewers.timeSeriesViewer import *
 from fipy.viewers.tsvViewer import *
 from fipy.viewers.vtkViewer import *
 
 __all__.extend(multiViewer.__all__)
+__all__.extend(timeSeriesViewer.__all__)
 __all__.extend(tsvViewer.__all__)
 __all__.extend(vtkViewer.__all__)
 
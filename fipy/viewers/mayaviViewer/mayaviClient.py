@@ -42,10 +42,48 @@ import subprocess
 import tempfile
 import time
 
+from fipy.tools import numerix
 from fipy.viewers.viewer import AbstractViewer
 
 __all__ = ["MayaviClient"]
 
+class _SharedValues(object):
+    """The values of the variables of a `VTKViewer`, shared with the daemon
+    through the memory-mapped file `fname`
+
+    The daemon reads the mesh, and the names of the variables, from the
+    VTK file written by the viewer once. For each subsequent frame, the
+    values are only copied into the shared file. The file
+    `fname`.layout lists the name, offset and number of the values of
+    each variable.
+    """
+    def __init__(self, viewer, fname):
+        self.viewer = viewer
+        self.fname = fname
+        self.layoutfname = fname + ".layout"
+
+        self.layout = []
+        size = 0
+        for var in viewer.vars:
+            name, rank, value = viewer._nameRankValue(var)
+            self.layout.append((name, size, value.size))
+            size += value.size
+
+        self.values = numerix.memmap(fname, dtype=float, mode='w+', shape=(max(size, 1),))
+
+        layout = file(self.layoutfname, 'w')
+        for name, start, count in self.layout:
+            layout.write("%s\t%d\t%d\n" % (name, start, count))
+        layout.close()
+
+        self.write()
+
+    def write(self):
+        for var, (name, start, count) in zip(self.viewer.vars, self.layout):
+            name, rank, value = self.viewer._nameRankValue(var)
+            self.values[start:start + count] = numerix.ravel(value)
+        self.values.flush()
+
 class MayaviClient(AbstractViewer):
     """
     The `MayaviClient` uses the Mayavi_ python plotting package.
@@ -58,7 +96,7 @@ class MayaviClient(AbstractViewer):
     __doc__ += AbstractViewer._test2Dirregular(viewer="MayaviClient")
     __doc__ += AbstractViewer._test3D(viewer="MayaviClient")
 
-    def __init__(self, vars, title=None, daemon_file=None, fps=1.0, **kwlimits):
+    def __init__(self, vars, title=None, daemon_file=None, fps=1.0, shared_memory=True, **kwlimits):
         """
         Create a `MayaviClient`.
 
@@ -77,10 +115,19 @@ class MayaviClient(AbstractViewer):
             Defaults to "fipy/viewers/mayaviViewer/mayaviDaemon.py"
           fps
             frames per second to attempt to display
+          shared_memory
+            if `True`, the mesh is written to a VTK file for the first frame
+            only and the values of each later frame are passed to the
+            daemon through memory-mapped files, in shared memory
+            (:file:`/dev/shm`) where available. If `False`, or if the
+            files cannot be mapped, each frame is written to VTK files.
         """
         self.fps = fps
 
-        self.vtkdir = tempfile.mkdtemp()
+        if shared_memory and os.path.isdir("/dev/shm"):
+            self.vtkdir = tempfile.mkdtemp(dir="/dev/shm")
+        else:
+            self.vtkdir = tempfile.mkdtemp()
         self.vtkcellfname = os.path.join(self.vtkdir, "cell.vtk")
         self.vtkfacefname = os.path.join(self.vtkdir, "face.vtk")
         self.vtklockfname = os.path.join(self.vtkdir, "lock")
@@ -103,8 +150,23 @@ class MayaviClient(AbstractViewer):
 
         AbstractViewer.__init__(self, vars=cell_vars + face_vars, title=title, **kwlimits)
 
+        self.cellValues = None
+        self.faceValues = None
+
         self.plot()
 
+        if shared_memory:
+            try:
+                if self.vtkCellViewer is not None:
+                    self.cellValues = _SharedValues(self.vtkCellViewer,
+                                                    self.vtkcellfname + ".buf")
+                if self.vtkFaceViewer is not None:
+                    self.faceValues = _SharedValues(self.vtkFaceViewer,
+                                                    self.vtkfacefname + ".buf")
+            except (IOError, OSError, ValueError):
+                self.cellValues = None
+                self.faceValues = None
+
         from pkg_resources import Requirement, resource_filename
         daemon_file = (daemon_file
                        or resource_filename(Requirement.parse("FiPy"),
@@ -119,9 +181,13 @@ class MayaviClient(AbstractViewer):
 
         if self.vtkCellViewer is not None:
             cmd += ["--cell", self.vtkcellfname]
+            if self.cellValues is not None:
+                cmd += ["--cellbuffer", self.cellValues.fname]
 
         if self.vtkFaceViewer is not None:
             cmd += ["--face", self.vtkfacefname]
+            if self.faceValues is not None:
+                cmd += ["--facebuffer", self.faceValues.fname]
 
 
         cmd += self._getLimit('xmin')
@@ -136,7 +202,12 @@ class MayaviClient(AbstractViewer):
         self.daemon = subprocess.Popen(cmd)
 
     def __del__(self):
-        for fname in [self.vtkcellfname, self.vtkfacefname, self.vtklockfname]:
+        fnames = [self.vtkcellfname, self.vtkfacefname, self.vtklockfname]
+        for values in [self.cellValues, self.faceValues]:
+            if values is not None:
+                del values.values
+                fnames += [values.fname, values.layoutfname]
+        for fname in fnames:
             if fname and os.path.isfile(fname):
                 os.unlink(fname)
         os.rmdir(self.vtkdir)
@@ -168,9 +239,13 @@ class MayaviClient(AbstractViewer):
         plotted = False
         while not plotted:
             if not os.path.isfile(self.vtklockfname):
-                if self.vtkCellViewer is not None:
+                if self.cellValues is not None:
+                    self.cellValues.write()
+                elif self.vtkCellViewer is not None:
                     self.vtkCellViewer.plot(filename=self.vtkcellfname)
-                if self.vtkFaceViewer is not None:
+                if self.faceValues is not None:
+                    self.faceValues.write()
+                elif self.vtkFaceViewer is not None:
                     self.vtkFaceViewer.plot(filename=self.vtkfacefname)
                 lock = file(self.vtklockfname, 'w')
                 if filename is not None:
@@ -82,7 +82,7 @@ except ImportError, e:
     from enthought.mayavi import mlab
 
 # FiPy library imports
-from fipy.tools.numerix import array, concatenate, where, zeros
+from fipy.tools.numerix import array, concatenate, memmap, where, zeros
 
 __all__ = ["MayaviDaemon"]
 
@@ -118,6 +118,12 @@ class MayaviDaemon(Mayavi):
         parser.add_option("-f", "--face", action="store", dest="face", type="string", default=None,
                           help="path of face vtk file")
 
+        parser.add_option("--cellbuffer", action="store", dest="cellbuffer", type="string", default=None,
+                          help="path of memory-mapped cell values")
+
+        parser.add_option("--facebuffer", action="store", dest="facebuffer", type="string", default=None,
+                          help="path of memory-mapped face values")
+
         parser.add_option("--xmin", action="store", dest="xmin", type="float", default=None,
                           help="minimum x value")
 
@@ -150,6 +156,8 @@ class MayaviDaemon(Mayavi):
         self.lockfname = options.lock
         self.cellfname = options.cell
         self.facefname = options.face
+        self.cellbufferfname = options.cellbuffer
+        self.facebufferfname = options.facebuffer
         self.bounds = [options.xmin, options.xmax,
                        options.ymin, options.ymax,
                        options.zmin, options.zmax]
@@ -166,6 +174,9 @@ class MayaviDaemon(Mayavi):
 
         bounds = zeros((0, 6), 'l')
 
+        self.cellbuffer = self.setup_buffer(self.cellbufferfname)
+        self.facebuffer = self.setup_buffer(self.facebufferfname)
+
         self.cellsource = self.setup_source(self.cellfname)
         if self.cellsource is not None:
             tmp = [out.cell_data.scalars for out in self.cellsource.outputs \
@@ -217,7 +228,11 @@ class MayaviDaemon(Mayavi):
 
     def __del__(self):
         dir = None
-        for fname in [self.cellfname, self.facefname, self.lockfname]:
+        fnames = [self.cellfname, self.facefname, self.lockfname]
+        for fname in [self.cellbufferfname, self.facebufferfname]:
+            if fname:
+                fnames += [fname, fname + ".layout"]
+        for fname in fnames:
             if fname and os.path.isfile(fname):
                 os.unlink(fname)
                 if not dir:
@@ -233,8 +248,8 @@ class MayaviDaemon(Mayavi):
 
     def poll_file(self):
         if os.path.isfile(self.lockfname):
-            self.update_pipeline(self.cellsource)
-            self.update_pipeline(self.facesource)
+            self.update_pipeline(self.cellsource, self.cellbuffer, "cell_data")
+            self.update_pipeline(self.facesource, self.facebuffer, "point_data")
             lock = file(self.lockfname, 'r')
             filename = lock.read()
             lock.close()
@@ -242,19 +257,55 @@ class MayaviDaemon(Mayavi):
                 mlab.savefig(filename)
             os.unlink(self.lockfname)
 
-    def update_pipeline(self, source):
+    def update_pipeline(self, source, buffer=None, attribute=None):
         """Override this to do something else if needed.
         """
         if source is not None:
             source.scene.disable_render = True
             source.scene.anti_aliasing_frames = 0
-            # Force the reader to re-read the file.
-            source.reader.modified()
+            if buffer is None:
+                # Force the reader to re-read the file.
+                source.reader.modified()
+            else:
+                # Only the values change; copy them into the data read
+                # from the file.
+                self.read_buffer(source, buffer, attribute)
             source.update()
             # Propagate the changes in the pipeline.
             source.data_changed = True
             source.scene.disable_render = False
 
+    def setup_buffer(self, fname):
+        """Given the name `fname` of the memory-mapped values written by
+        the client, this maps them and reads the name, offset and number
+        of the values of each array from `fname`.layout.
+        """
+        if fname is None:
+            return None
+
+        layout = []
+        f = open(fname + ".layout", 'r')
+        for line in f:
+            name, start, count = line.rstrip("\n").split("\t")
+            layout.append((name, int(start), int(count)))
+        f.close()
+
+        return (memmap(fname, dtype=float, mode='r'), layout)
+
+    def read_buffer(self, source, buffer, attribute):
+        """Copy the memory-mapped values of `buffer` into the arrays of
+        the `attribute` data of the outputs of `source`.
+        """
+        values, layout = buffer
+        for out in source.outputs:
+            data = getattr(out, attribute)
+            for name, start, count in layout:
+                vtkArray = data.get_array(name)
+                if vtkArray is not None:
+                    target = vtkArray.to_array()
+                    target[:] = values[start:start + count].reshape(target.shape)
+                    vtkArray.modified()
+
     def setup_source(self, fname):
         """Given a VTK file name `fname`, this creates a mayavi2 reader
         for it and adds it to the pipeline.  It returns the reader
@@ -44,6 +44,7 @@ def _suite():
     return _LateImportDocTestSuite(testModuleNames = (
         'vtkViewer.test',),
                                    docTestModuleNames = (
+        'timeSeriesViewer',
         'tsvViewer',
         ), base = __name__)
 
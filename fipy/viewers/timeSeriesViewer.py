@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "timeSeriesViewer.py"
+ #
+ #  Author: James O'Beirne <james.obeirne@nist.gov>
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+
+__docformat__ = 'restructuredtext'
+
+import struct
+import zlib
+
+from fipy.tools import numerix
+from fipy.tools import checkpoint
+from fipy.tools import parallelComm
+from fipy.viewers.viewer import AbstractViewer
+
+__all__ = ["TimeSeriesViewer", "readTimeSeries"]
+
+class TimeSeriesViewer(AbstractViewer):
+    """
+    "Views" one or more variables by appending their values to a binary
+    time series.
+
+    The first call to :meth:`plot` writes a :mod:`~fipy.tools.checkpoint`
+    of the variables, which stores their mesh once. Each call to
+    :meth:`plot`, including the first, then appends only the raw values of
+    the variables as a frame, optionally reduced in precision and
+    compressed. In parallel, each processor writes its own part of the
+    series without any communication, as for a checkpoint.
+
+    The frames can be read back with :func:`readTimeSeries`.
+    """
+
+    def __init__(self, vars, filename, title=None, dtype=None, compress=False, limits={}, **kwlimits):
+        """
+        Creates a `TimeSeriesViewer`.
+
+        :Parameters:
+          vars
+            a `Variable` or tuple of `Variable` objects to record
+          filename
+            the name of the time series file
+          title
+            ignored
+          dtype
+            if not `None`, the type to store floating point values as,
+            e.g., `'float32'`
+          compress
+            whether to compress each frame
+          limits : dict
+            ignored
+          xmin, xmax, ymin, ymax, zmin, zmax, datamin, datamax
+            ignored
+        """
+        kwlimits.update(limits)
+        AbstractViewer.__init__(self, vars=vars, title=title, **kwlimits)
+
+        self.filename = filename
+        self.dtype = dtype
+        self.compress = compress
+        self.layout = None
+
+    def _frameValue(self, var):
+        value = numerix.asarray(var.value)
+        if self.dtype is not None and value.dtype.kind in 'fc':
+            value = value.astype(self.dtype)
+        return numerix.ascontiguousarray(value)
+
+    def plot(self, filename=None):
+        """
+        Append the values of the variables to the time series.
+
+        >>> from fipy import *
+        >>> import os, tempfile
+        >>> m = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=m, name="phi")
+        >>> (f, filename) = tempfile.mkstemp('.series')
+        >>> os.close(f)
+        >>> viewer = TimeSeriesViewer(vars=(phi, phi.faceGrad), filename=filename,
+        ...                           dtype='float32', compress=True)
+        >>> for step in range(3):
+        ...     phi.value = step * m.x
+        ...     viewer.plot()
+
+        >>> variables, frames = readTimeSeries(filename)
+        >>> print variables[0].mesh.numberOfCells
+        6
+        >>> frames = list(frames)
+        >>> print len(frames)
+        3
+        >>> print frames[2][0]
+        [ 1.  3.  5.  1.  3.  5.]
+        >>> print frames[2][0].dtype
+        float32
+        >>> print frames[2][1].shape
+        (2, 17)
+
+        A new viewer starts a new series
+
+        >>> viewer = TimeSeriesViewer(vars=phi, filename=filename)
+        >>> viewer.plot()
+        >>> variables, frames = readTimeSeries(filename)
+        >>> frames = list(frames)
+        >>> print len(frames), frames[0][0].dtype
+        1 float64
+        >>> os.remove(filename)
+
+        :Parameters:
+          filename
+            ignored; frames are appended to the file given when the
+            `TimeSeriesViewer` was created
+        """
+        values = [self._frameValue(var) for var in self.vars]
+
+        partFilename = checkpoint._partFilename(self.filename, parallelComm)
+
+        if self.layout is None:
+            self.layout = [dict(dtype=value.dtype.str, shape=list(value.shape))
+                           for value in values]
+            checkpoint._CheckpointWriter().write(partFilename,
+                                                 dict((str(i), var) for i, var in enumerate(self.vars)),
+                                                 attributes=dict(series=dict(frames=self.layout,
+                                                                             compress=self.compress)))
+
+        frame = "".join(value.tostring() for value in values)
+        if self.compress:
+            frame = zlib.compress(frame)
+
+        f = open(partFilename, 'ab')
+        try:
+            f.write(struct.pack('<Q', len(frame)))
+            f.write(frame)
+        finally:
+            f.close()
+
+def readTimeSeries(filename, communicator=parallelComm):
+    """
+    Read a time series written by a :class:`TimeSeriesViewer`.
+
+    :Parameters:
+      - `filename`: The name of the time series.
+      - `communicator`: Object with `procID` and `Nproc` attributes.
+
+    :Returns:
+      a `list` of the recorded `Variable` objects, with their mesh and
+      their values at the first frame, and an iterator over the frames,
+      each a `list` of the values of the variables
+    """
+    filename = checkpoint._partFilename(filename, communicator)
+    reader = checkpoint._CheckpointReader(filename, mmap=False)
+    variables = reader.read()
+    variables = [variables[str(i)] for i in range(len(variables))]
+
+    series = reader.attributes['series']
+
+    def frames():
+        f = open(filename, 'rb')
+        try:
+            f.seek(reader.end)
+            while True:
+                length = f.read(8)
+                if len(length) < 8:
+                    break
+                length, = struct.unpack('<Q', length)
+                frame = f.read(length)
+                if series['compress']:
+                    frame = zlib.decompress(frame)
+
+                values = []
+                offset = 0
+                for layout in series['frames']:
+                    dtype = numerix.dtype(str(layout['dtype']))
+                    shape = tuple(layout['shape'])
+                    count = int(numerix.prod(shape))
+                    values.append(numerix.fromstring(frame[offset:offset + count * dtype.itemsize],
+                                                     dtype=dtype).reshape(shape))
+                    offset += count * dtype.itemsize
+
+                yield values
+        finally:
+            f.close()
+
+    return variables, frames()
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
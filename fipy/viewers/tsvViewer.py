@@ -97,35 +97,42 @@ class TSVViewer(AbstractViewer):
             assert mesh is var.mesh
 
 
-    def _plot(self, values, f, dim):
-        for index in range(values.shape[-1]):
-            lineValues = values[...,index]
-
-            # omit any elements whose cell centers lie outside of the specified limits
-            skip = False
-            for axis in range(dim):
-                mini = self._getLimit("%smin" % self._axis[axis])
-                maxi = self._getLimit("%smax" % self._axis[axis])
-
-                if (mini and lineValues[axis] < mini) or (maxi and lineValues[axis] > maxi):
-                    skip = True
-                    break
-
-            if skip:
-                continue
-
-            # replace any values that lie outside of the specified datalimits with 'nan'
-            for valIndex in range(dim, len(lineValues)):
-                mini = self._getLimit("datamin")
-                maxi = self._getLimit("datamax")
-
-                if (mini and lineValues[valIndex] < mini) or (maxi and lineValues[valIndex] > maxi):
-                    lineValues[valIndex] = float("NaN")
-                    break
-
-            line = ["%.15g" % value for value in lineValues]
-            f.write("\t".join(line))
-            f.write("\n")
+    def _plot(self, values, f, dim, chunkSize=2**14):
+        # omit any elements whose cell centers lie outside of the specified limits
+        keep = numerix.ones(values.shape[-1], dtype=bool)
+        for axis in range(dim):
+            mini = self._getLimit("%smin" % self._axis[axis])
+            maxi = self._getLimit("%smax" % self._axis[axis])
+
+            if mini:
+                keep &= ~(values[axis] < mini)
+            if maxi:
+                keep &= ~(values[axis] > maxi)
+
+        values = values[..., keep]
+
+        # replace the first value of each line that lies outside of the
+        # specified datalimits with 'nan'
+        mini = self._getLimit("datamin")
+        maxi = self._getLimit("datamax")
+
+        if mini or maxi:
+            data = values[dim:]
+            outside = numerix.zeros(data.shape, dtype=bool)
+            if mini:
+                outside |= data < mini
+            if maxi:
+                outside |= data > maxi
+
+            lines = numerix.nonzero(outside.any(axis=0))[0]
+            data[outside[..., lines].argmax(axis=0), lines] = float("NaN")
+
+        # format a block of lines at a time with a single format string
+        # covering all of their values, rather than one line at a time
+        line = "\t".join(["%.15g"] * len(values)) + "\n"
+        for start in range(0, values.shape[-1], chunkSize):
+            chunk = values[..., start:start + chunkSize]
+            f.write((line * chunk.shape[-1]) % tuple(chunk.transpose().ravel().tolist()))
 
     def plot(self, filename=None):
         """
@@ -152,6 +159,15 @@ class TSVViewer(AbstractViewer):
         0.05    0.45    -2      35      -3.33333333333333
         0.15    0.45    5       35      5
 
+        Cells outside of the axis limits are omitted and values outside
+        of the data limits are replaced with `nan`
+
+        >>> TSVViewer(vars = v, xmin = 0.1, datamax = 4).plot() #doctest: +NORMALIZE_WHITESPACE
+        var
+        x       y       var
+        0.15    0.15    2
+        0.15    0.45    nan
+
         :Parameters:
           filename
             If not `None`, the name of a file to save the image into.
@@ -195,29 +211,35 @@ class TSVViewer(AbstractViewer):
         cellVars = [var for var in self.vars if isinstance(var, CellVariable)]
         faceVars = [var for var in self.vars if isinstance(var, FaceVariable)]
 
-        if len(cellVars) > 0:
-            values = mesh.cellCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, CellVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
+        # only processor 0 writes to a file, so only it needs the values
+        # of the whole mesh
+        if f is sys.stdout:
+            root = None
+        else:
+            root = 0
 
-            self._plot(values, f, dim)
+        if len(cellVars) > 0:
+            self._plotGathered(mesh.cellCenters, cellVars, f, dim, root)
 
         if len(faceVars) > 0:
-            values = mesh.faceCenters.globalValue
-            for var in self.vars:
-                if isinstance(var, FaceVariable) and var.rank == 1:
-                    values = numerix.concatenate((values, numerix.array(var.globalValue)))
-                else:
-                    values = numerix.concatenate((values, (numerix.array(var.globalValue),)))
-
-            self._plot(values, f, dim)
+            self._plotGathered(mesh.faceCenters, faceVars, f, dim, root)
 
         if f is not sys.stdout:
             f.close()
 
+    def _plotGathered(self, centers, vars, f, dim, root):
+        values = centers.gatherValue(root=root)
+        for var in vars:
+            value = var.gatherValue(root=root)
+            if values is not None:
+                if var.rank == 1:
+                    values = numerix.concatenate((values, numerix.array(value)))
+                else:
+                    values = numerix.concatenate((values, (numerix.array(value),)))
+
+        if values is not None:
+            self._plot(values, f, dim)
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()